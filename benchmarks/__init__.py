@@ -0,0 +1 @@
+# Benchmark performa
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Benchmark waktu import
+Memastikan layer matematika (src.matrix) bisa di-import tanpa memuat pygame
+Jalankan dengan: python benchmarks/bench_import.py [--max-ms 300]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# Script yang dijalankan di proses baru; mencetak apakah pygame ikut ter-load
+_PROBE = (
+    "import sys, time; t = time.perf_counter(); {statement}; "
+    "print(time.perf_counter() - t, 'pygame' in sys.modules)"
+)
+
+
+def measure_import(statement, repeat=5):
+    """
+    Ukur waktu import di proses Python baru
+    Returns:
+        Tuple (waktu terbaik dalam detik, True jika pygame ikut ter-load)
+    """
+    best = float('inf')
+    loads_pygame = False
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(statement=statement)],
+            cwd=ROOT, env=env, capture_output=True, text=True, check=True
+        ).stdout.split()
+        best = min(best, float(output[0]))
+        loads_pygame = output[1] == "True"
+    return best, loads_pygame
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark waktu import MatrixTransform2D")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Batas waktu import src.matrix dalam milidetik")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Benchmark: Import Time")
+    print("=" * 60)
+    print()
+
+    statements = [
+        "import numpy",
+        "from src.matrix import TransformationMatrix",
+        "import src",
+        "from src.main import MatrixTransform2DApp",
+    ]
+    results = {}
+    for statement in statements:
+        elapsed, loads_pygame = measure_import(statement)
+        results[statement] = (elapsed, loads_pygame)
+        print(f"   {statement:45s} {elapsed * 1000:8.1f} ms   pygame={loads_pygame}")
+    print()
+
+    failures = []
+    for statement in ("from src.matrix import TransformationMatrix", "import src"):
+        if results[statement][1]:
+            failures.append(f"'{statement}' memuat pygame")
+    matrix_ms = results["from src.matrix import TransformationMatrix"][0] * 1000
+    if args.max_ms is not None and matrix_ms > args.max_ms:
+        failures.append(f"import src.matrix {matrix_ms:.1f} ms > {args.max_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"GAGAL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK: layer matematika tidak memuat pygame")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark kernel per jenis transformasi (TransformKind)
+Membandingkan apply_to_array dan compose untuk identity, translation, scale,
+rigid dan affine terhadap perkalian matrix 3x3 umum
+Jalankan dengan: python benchmarks/bench_kinds.py
+"""
+
+import sys
+import os
+import timeit
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from src.matrix import TransformationMatrix
+
+
+def _matrices():
+    """Satu contoh matrix untuk setiap jenis"""
+    return [
+        TransformationMatrix(),
+        TransformationMatrix().translate(12, -4),
+        TransformationMatrix().translate(400, 300).scale(1.5).translate(-400, -300),
+        TransformationMatrix().rotate(30, 50, 50),
+        TransformationMatrix().rotate(30).scale(2, 0.5),
+    ]
+
+
+def _best_ms(func, number):
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e3
+
+
+def bench_apply(vertex_count=1_000_000):
+    """apply_to_array per jenis vs kernel matmul umum"""
+    points = np.random.default_rng(0).uniform(-500, 500, size=(vertex_count, 2))
+    print(f"apply_to_array, {vertex_count:,} vertex:")
+    print(f"   {'jenis':12s} {'khusus':>10s} {'umum':>10s} {'speedup':>9s}")
+    for matrix in _matrices():
+        affine = matrix.affine
+
+        def general():
+            return points @ affine[:, :2].T + affine[:, 2]
+
+        special_ms = _best_ms(lambda: matrix.apply_to_array(points), 5)
+        general_ms = _best_ms(general, 5)
+        print(f"   {matrix.kind.name.lower():12s} {special_ms:8.2f}ms {general_ms:8.2f}ms "
+              f"{general_ms / special_ms:8.1f}x")
+    print()
+
+
+def bench_compose():
+    """Biaya compose (camera @ model) per jenis model"""
+    camera = TransformationMatrix().translate(450, 400).scale(1.2).translate(-430, -390)
+    print("compose camera (scale) @ model:")
+    for matrix in _matrices():
+        us = _best_ms(lambda: camera.copy().compose(matrix), 20000) * 1e3
+        print(f"   {matrix.kind.name.lower():12s} {us:8.2f}us")
+    print()
+
+
+def main():
+    print("=" * 60)
+    print("Benchmark: Transform Kinds")
+    print("=" * 60)
+    print()
+    bench_apply()
+    bench_compose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark simplifikasi zoom-dependent (LOD)
+Menggambar polygon dengan 100 ribu vertex pada beberapa zoom, dengan dan
+tanpa PolylineLOD; camera digeser setiap frame agar cache vertex tidak dipakai
+Jalankan dengan: python benchmarks/bench_lod.py
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from src import graphics
+from src.graphics import Polygon
+from src.matrix import TransformationMatrix
+
+
+def _coastline(vertex_count=100_000, seed=0):
+    """Outline bergerigi dengan radius ~300 di sekitar center canvas"""
+    rng = np.random.default_rng(seed)
+    angles = np.linspace(0, 2 * np.pi, vertex_count, endpoint=False)
+    radius = 300 + 20 * np.sin(angles * 23) + np.cumsum(rng.normal(0, 0.4, vertex_count))
+    radius -= np.linspace(0, radius[-1] - radius[0], vertex_count)  # tutup tanpa loncatan
+    return np.column_stack((450 + radius * np.cos(angles), 400 + radius * np.sin(angles)))
+
+
+def _frame_time(shape, surface, zoom, frames=20):
+    """Rata-rata waktu submit + flush per frame (detik) dan jumlah vertex yang digambar"""
+    queue = graphics.RenderQueue()
+    start = time.perf_counter()
+    for frame in range(frames):
+        camera = TransformationMatrix().translate(frame, 0).scale(zoom, zoom, 450, 400)
+        surface.fill((255, 255, 255))
+        shape.submit(queue, surface, view_matrix=camera)
+        queue.flush(surface)
+    elapsed = (time.perf_counter() - start) / frames
+    vertices, _ = shape._render_vertices(camera)
+    return elapsed, len(vertices)
+
+
+def main():
+    print("=" * 60)
+    print("Benchmark: Zoom-Dependent Polygon LOD")
+    print("=" * 60)
+    print()
+
+    pygame.init()
+    surface = pygame.Surface((900, 800))
+    points = _coastline()
+    for fill in (True, False):
+        shape = Polygon(points, color=(0, 120, 200), fill=fill)
+        start = time.perf_counter()
+        levels = len(shape.lod)
+        print(f"{'Filled' if fill else 'Outline'} polygon, {len(points):,} vertex "
+              f"(build {levels} level: {(time.perf_counter() - start) * 1000:.0f} ms)")
+        print(f"   {'zoom':>6s} {'full':>10s} {'LOD':>10s} {'vertex':>9s} {'speedup':>8s}")
+        for zoom in (0.1, 0.5, 1.0, 4.0, 20.0):
+            graphics._LOD_MIN_VERTICES = float("inf")
+            full, _ = _frame_time(shape, surface, zoom)
+            graphics._LOD_MIN_VERTICES = 256
+            lod, drawn = _frame_time(shape, surface, zoom)
+            print(f"   {zoom:>6.1f} {full * 1000:>8.2f}ms {lod * 1000:>8.2f}ms {drawn:>9,} "
+                  f"{full / lod:>7.1f}x")
+        print()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark precision policy: float32 vs float64
+Membandingkan throughput transformasi vertex dan ukuran buffer
+Jalankan dengan: python benchmarks/bench_precision.py
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from src.matrix import TransformationMatrix, PrecisionPolicy, precision_scope
+from src.graphics import Polygon
+from src.instancing import SharedGeometry, InstanceBatch
+
+
+def _best_time(func, repeat=5):
+    """Ambil waktu terbaik dari beberapa kali eksekusi"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_shape_transform(vertex_count):
+    """Transformasi satu shape besar dengan dtype berbeda"""
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-500, 500, size=(vertex_count, 2))
+    print(f"Shape2D.apply_transform, {vertex_count:,} vertex:")
+    for dtype in (np.float64, np.float32):
+        with precision_scope(PrecisionPolicy(dtype)):
+            shape = Polygon(points)
+            matrix = TransformationMatrix().translate(10, 20).rotate(30).scale(1.5)
+        elapsed = _best_time(lambda: shape.apply_transform(matrix))
+        mbytes = (shape.vertices.nbytes + shape.transformed_vertices.nbytes) / 1e6
+        print(f"   {np.dtype(dtype).name:8s} {vertex_count / elapsed / 1e6:8.1f} Mvertex/s   "
+              f"buffer {mbytes:8.1f} MB")
+    print()
+
+
+def bench_instance_batch(instance_count, segments=32):
+    """Batch transform banyak instance circle dengan dtype berbeda"""
+    print(f"InstanceBatch, {instance_count:,} circle x {segments} vertex:")
+    for dtype in (np.float64, np.float32):
+        with precision_scope(PrecisionPolicy(dtype)):
+            geometry = SharedGeometry([(np.cos(a), np.sin(a)) for a in
+                                       np.linspace(0, 2 * np.pi, segments, endpoint=False)])
+            batch = InstanceBatch()
+            for i in range(instance_count):
+                batch.add(geometry, TransformationMatrix().translate(i % 1000, i // 1000))
+            camera = TransformationMatrix().scale(2.0)
+            elapsed = _best_time(lambda: batch.transformed_points(geometry, camera))
+        out = batch.transformed_points(geometry, camera)
+        vertex_count = instance_count * segments
+        print(f"   {np.dtype(dtype).name:8s} {vertex_count / elapsed / 1e6:8.1f} Mvertex/s   "
+              f"output {out.nbytes / 1e6:8.1f} MB")
+    print()
+
+
+def main():
+    print("=" * 60)
+    print("Benchmark: Precision Policy (float32 vs float64)")
+    print("=" * 60)
+    print()
+    for vertex_count in (100_000, 1_000_000, 4_000_000):
+        bench_shape_transform(vertex_count)
+    bench_instance_batch(20_000)
+
+
+if __name__ == "__main__":
+    main()
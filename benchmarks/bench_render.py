@@ -0,0 +1,73 @@
+"""
+Benchmark render queue
+Membandingkan outline yang digambar per edge (pygame.draw.line) dengan
+RenderQueue yang menggabungkan edge bersambung menjadi satu pygame.draw.lines
+Jalankan dengan: python benchmarks/bench_render.py
+"""
+
+import sys
+import os
+import timeit
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from src.graphics import Circle
+from src.render import RenderQueue
+
+
+def _outline_scene(count, segments=32, seed=0):
+    """Banyak circle outline tersebar di canvas 900x800"""
+    rng = np.random.default_rng(seed)
+    shapes = []
+    for x, y, radius in zip(rng.uniform(0, 900, count), rng.uniform(0, 800, count),
+                            rng.uniform(5, 60, count)):
+        shapes.append(Circle(x, y, radius, color=(0, 0, 255), fill=False, segments=segments))
+    return shapes
+
+
+def _draw_per_edge(surface, shapes):
+    """Cara lama: satu pygame.draw.line per edge"""
+    for shape in shapes:
+        points = shape.get_points()
+        for i in range(len(points)):
+            pygame.draw.line(surface, shape.color, points[i], points[(i + 1) % len(points)], 2)
+
+
+def _draw_queue(surface, shapes, queue):
+    """RenderQueue: satu pygame.draw.lines per outline"""
+    for shape in shapes:
+        shape.submit(queue, surface)
+    return queue.flush(surface)
+
+
+def main():
+    print("=" * 60)
+    print("Benchmark: Render Queue")
+    print("=" * 60)
+    print()
+
+    pygame.init()
+    surface = pygame.Surface((900, 800))
+    queue = RenderQueue()
+    print(f"   {'outline':>8s} {'per edge':>10s} {'queue':>10s} {'calls':>13s} {'speedup':>8s}")
+    for count in (100, 500, 2000):
+        shapes = _outline_scene(count)
+        for shape in shapes:  # isi cache vertex di luar pengukuran
+            shape.get_points()
+        edge_ms = min(timeit.repeat(lambda: _draw_per_edge(surface, shapes),
+                                    number=3, repeat=3)) / 3 * 1e3
+        queue_ms = min(timeit.repeat(lambda: _draw_queue(surface, shapes, queue),
+                                     number=3, repeat=3)) / 3 * 1e3
+        calls = f"{count * 32} -> {queue.draw_calls}"
+        print(f"   {count:8d} {edge_ms:8.2f}ms {queue_ms:8.2f}ms {calls:>13s} "
+              f"{edge_ms / queue_ms:7.1f}x")
+    print()
+
+
+if __name__ == "__main__":
+    main()
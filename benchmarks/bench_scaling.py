@@ -0,0 +1,74 @@
+"""
+Benchmark skala scene
+Laporan waktu frame terhadap jumlah shape memakai generator scene sintetis,
+untuk list Shape2D (path interaktif) dan InstanceBatch (jutaan shape)
+Jalankan dengan: python benchmarks/bench_scaling.py [--max N] [--seed S]
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.main import MatrixTransform2DApp
+from src.scene import generate_scene
+
+
+def _best_of(func, repeats):
+    """Waktu terbaik (detik) dari beberapa kali pemanggilan"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _report(app, label, counts, seed, instanced, repeats):
+    """Cetak satu tabel: jumlah shape, waktu generate, waktu frame"""
+    print(f"{label}:")
+    print(f"   {'shapes':>10s} {'generate':>10s} {'frame':>10s} {'fps':>8s} {'us/shape':>9s}")
+    for count in counts:
+        start = time.perf_counter()
+        scene = generate_scene(count, seed=seed, instanced=instanced)
+        generate_time = time.perf_counter() - start
+        app.instance_batch = None
+        app.load_scene(scene)
+        app.draw()  # isi cache di luar pengukuran
+        frame = _best_of(app.draw, repeats)
+        print(f"   {count:>10,} {generate_time * 1000:>8.0f}ms {frame * 1000:>8.1f}ms "
+              f"{1 / frame:>8.1f} {frame / count * 1e6:>9.2f}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skala scene")
+    parser.add_argument("--max", type=int, default=1_000_000,
+                        help="Jumlah shape maksimal (default: 1000000)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Benchmark: Frame Time vs Jumlah Shape")
+    print("=" * 60)
+    print()
+
+    app = MatrixTransform2DApp(width=1200, height=800)
+    shape_counts = [n for n in (100, 1_000, 10_000, 50_000) if n <= args.max]
+    instanced_counts = [n for n in (10_000, 100_000, 1_000_000) if n <= args.max]
+    _report(app, "Shape2D (list shapes, dengan culling dan render queue)",
+            shape_counts, args.seed, instanced=False, repeats=3)
+    app.load_scene([])
+    _report(app, "InstanceBatch (transformasi batch per geometry)",
+            instanced_counts, args.seed, instanced=True, repeats=2)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
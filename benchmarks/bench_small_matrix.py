@@ -0,0 +1,128 @@
+"""
+Benchmark fast path skalar untuk matrix 3x3
+Membandingkan operasi TransformationMatrix dengan implementasi NumPy murni,
+dan mencari jumlah titik (crossover) di mana NumPy mulai lebih cepat
+Jalankan dengan: python benchmarks/bench_small_matrix.py
+"""
+
+import sys
+import os
+import math
+import timeit
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from src.matrix import TransformationMatrix, NUMPY_CROSSOVER
+
+
+def _numpy_translate(matrix, tx, ty):
+    """Referensi: translasi dengan np.array + np.dot"""
+    return np.dot(matrix, np.array([[1, 0, tx], [0, 1, ty], [0, 0, 1]], dtype=np.float64))
+
+
+def _numpy_rotate(matrix, angle_degrees):
+    """Referensi: rotasi dengan np.array + np.dot"""
+    angle_rad = math.radians(angle_degrees)
+    cos_a, sin_a = math.cos(angle_rad), math.sin(angle_rad)
+    return np.dot(matrix, np.array([[cos_a, -sin_a, 0], [sin_a, cos_a, 0], [0, 0, 1]],
+                                   dtype=np.float64))
+
+
+def _numpy_scale(matrix, sx, sy):
+    """Referensi: skala dengan np.array + np.dot"""
+    return np.dot(matrix, np.array([[sx, 0, 0], [0, sy, 0], [0, 0, 1]], dtype=np.float64))
+
+
+def _numpy_apply_to_point(matrix, x, y):
+    """Referensi: transformasi satu titik dengan vektor homogen"""
+    transformed = np.dot(matrix, np.array([x, y, 1], dtype=np.float64))
+    return (transformed[0], transformed[1])
+
+
+def _per_call_us(statement, number=20000):
+    """Waktu per panggilan dalam mikrodetik (best of 5)"""
+    return min(timeit.repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def bench_single_operations():
+    """Bandingkan operasi tunggal: fast path skalar vs NumPy"""
+    matrix = TransformationMatrix().rotate(10)
+    array = matrix.get_matrix()
+    cases = [
+        ("translate", lambda: matrix.translate(1.0, 2.0), lambda: _numpy_translate(array, 1.0, 2.0)),
+        ("rotate", lambda: matrix.rotate(1.0), lambda: _numpy_rotate(array, 1.0)),
+        ("scale", lambda: matrix.scale(1.0001, 1.0), lambda: _numpy_scale(array, 1.0001, 1.0)),
+        ("apply_to_point", lambda: matrix.apply_to_point(3.0, 4.0),
+         lambda: _numpy_apply_to_point(array, 3.0, 4.0)),
+    ]
+    print(f"   {'operasi':16s} {'skalar':>10s} {'numpy':>10s} {'speedup':>9s}")
+    for name, scalar, vectorized in cases:
+        scalar_us = _per_call_us(scalar)
+        numpy_us = _per_call_us(vectorized)
+        print(f"   {name:16s} {scalar_us:8.2f}us {numpy_us:8.2f}us {numpy_us / scalar_us:8.1f}x")
+    print()
+
+
+def bench_crossover():
+    """Cari jumlah titik (input ndarray) di mana path NumPy mulai lebih cepat"""
+    matrix = TransformationMatrix().translate(5, 5).rotate(30).scale(1.5)
+    crossover = None
+    print(f"   {'titik':>6s} {'skalar':>10s} {'numpy':>10s}")
+    for count in (1, 2, 4, 8, 16, 24, 32, 48, 64, 128, 256):
+        points = np.arange(count * 2, dtype=np.float64).reshape(count, 2)
+        number = max(200, 20000 // count)
+        scalar_us = _per_call_us(lambda: matrix._apply_scalar(points), number)
+        numpy_us = _per_call_us(
+            lambda: list(zip(*matrix.apply_to_array(points).T.tolist())), number)
+        if crossover is None and numpy_us < scalar_us:
+            crossover = count
+        print(f"   {count:6d} {scalar_us:8.2f}us {numpy_us:8.2f}us")
+    print()
+    print(f"   Crossover terukur: {crossover} titik (NUMPY_CROSSOVER = {NUMPY_CROSSOVER})")
+    print()
+
+
+def bench_chain():
+    """Chain panjang dengan pivot: lazy + fused vs tiga np.dot per operasi"""
+    def lazy_chain():
+        matrix = TransformationMatrix()
+        matrix.translate(450, 400).scale(1.2).translate(-430, -390)
+        matrix.translate(20, 10).rotate(30, 100, 100).scale(1.5, 0.8, 100, 100)
+        return matrix.apply_to_point(3.0, 4.0)
+
+    def eager_chain():
+        matrix = np.eye(3)
+        matrix = _numpy_translate(matrix, 450, 400)
+        matrix = _numpy_scale(matrix, 1.2, 1.2)
+        matrix = _numpy_translate(matrix, -430, -390)
+        matrix = _numpy_translate(matrix, 20, 10)
+        for op in (lambda m: _numpy_rotate(m, 30), lambda m: _numpy_scale(m, 1.5, 0.8)):
+            matrix = _numpy_translate(matrix, 100, 100)
+            matrix = op(matrix)
+            matrix = _numpy_translate(matrix, -100, -100)
+        return _numpy_apply_to_point(matrix, 3.0, 4.0)
+
+    lazy_us = _per_call_us(lazy_chain, 5000)
+    eager_us = _per_call_us(eager_chain, 5000)
+    print(f"   lazy + fused {lazy_us:8.2f}us   eager numpy {eager_us:8.2f}us   "
+          f"speedup {eager_us / lazy_us:.1f}x")
+    print()
+
+
+def main():
+    print("=" * 60)
+    print("Benchmark: Small-Matrix Fast Path")
+    print("=" * 60)
+    print()
+    print("Operasi tunggal:")
+    bench_single_operations()
+    print("apply_to_points (input ndarray), skalar vs NumPy:")
+    bench_crossover()
+    print("Chain camera + transform dengan pivot:")
+    bench_chain()
+
+
+if __name__ == "__main__":
+    main()
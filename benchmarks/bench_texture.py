@@ -0,0 +1,76 @@
+"""
+Benchmark texture cache untuk ImageShape
+Waktu frame saat pan, zoom perlahan dan rotasi image 2048x1536, dengan
+mipmap + TextureCache dibandingkan warp_image setiap frame
+Jalankan dengan: python benchmarks/bench_texture.py
+"""
+
+import sys
+import os
+import time
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from src.imaging import ImageShape
+from src.matrix import TransformationMatrix
+from src.render import RenderQueue
+from src.texture import TextureCache
+
+
+def _views(motion, frames):
+    """Camera matrix per frame untuk satu jenis gerakan"""
+    for frame in range(frames):
+        zoom, angle, pan = 0.4, 0.0, 0.0
+        if motion == 'pan':
+            pan = frame * 3.0
+        elif motion == 'zoom':
+            zoom *= 1.004 ** frame
+        else:
+            angle = frame * 0.25
+        yield (TransformationMatrix().translate(450 + pan, 400).rotate(angle)
+               .scale(zoom, zoom).translate(-1024, -768))
+
+
+def _frame_time(shape, surface, motion, frames=60):
+    """Rata-rata waktu submit + flush per frame (detik)"""
+    queue = RenderQueue()
+    start = time.perf_counter()
+    for view in _views(motion, frames):
+        surface.fill((0, 0, 0))
+        shape.submit(queue, surface, view_matrix=view)
+        queue.flush(surface)
+    return (time.perf_counter() - start) / frames
+
+
+def main():
+    print("=" * 60)
+    print("Benchmark: Mipmapped Texture Cache")
+    print("=" * 60)
+    print()
+
+    pygame.init()
+    surface = pygame.Surface((900, 800))
+    rows, columns = np.mgrid[0:1536, 0:2048]
+    pixels = np.stack([(columns // 4) % 256, (rows // 4) % 256, ((columns + rows) // 8) % 256],
+                      axis=-1).astype(np.uint8)
+    print(f"Image {pixels.shape[1]}x{pixels.shape[0]}, surface 900x800, 60 frame per gerakan")
+    print(f"   {'gerakan':>8s} {'warp':>10s} {'texture':>10s} {'speedup':>8s} {'hit':>5s} {'miss':>5s}")
+    for motion in ('pan', 'zoom', 'rotate'):
+        shape = ImageShape(0, 0, pixels, texture_cache=TextureCache())
+        shape.use_textures = False
+        warp = _frame_time(shape, surface, motion)
+        shape.use_textures = True
+        texture = _frame_time(shape, surface, motion)
+        cache = shape.texture_cache
+        print(f"   {motion:>8s} {warp * 1000:>8.1f}ms {texture * 1000:>8.1f}ms {warp / texture:>7.1f}x "
+              f"{cache.hits:>5d} {cache.misses:>5d}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark apply_to_array dengan out= (zero-copy)
+Membandingkan transformasi 10 juta titik lewat ndarray dengan path
+list-of-tuples, beserta alokasi memory puncaknya
+Jalankan dengan: python benchmarks/bench_zero_copy.py
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from src.matrix import TransformationMatrix
+
+
+def _measure(func):
+    """
+    Jalankan func sekali sambil mengukur waktu dan alokasi puncak
+    Returns:
+        Tuple (detik, byte puncak yang dialokasikan)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def bench_array(point_count=10_000_000):
+    """apply_to_array dengan dan tanpa out="""
+    points = np.random.default_rng(0).uniform(-1000, 1000, size=(point_count, 2))
+    out = np.empty_like(points)
+    matrix = TransformationMatrix().translate(5, 5).rotate(30).scale(1.5)
+    matrix.apply_to_array(points[:10])  # flush chain di luar pengukuran
+
+    print(f"{point_count:,} titik (ndarray, {points.nbytes / 1e6:.0f} MB):")
+    for name, func in (
+        ("apply_to_array(points)", lambda: matrix.apply_to_array(points)),
+        ("apply_to_array(points, out=out)", lambda: matrix.apply_to_array(points, out=out)),
+        ("apply_to_array(points, out=points)", lambda: matrix.apply_to_array(points, out=points)),
+    ):
+        elapsed, peak = _measure(func)
+        print(f"   {name:36s} {point_count / elapsed / 1e6:8.1f} Mpt/s   "
+              f"alokasi puncak {peak / 1e6:8.1f} MB")
+    print()
+
+
+def bench_tuples(point_count=1_000_000):
+    """Path lama list-of-tuples sebagai pembanding"""
+    points = [(float(i), float(-i)) for i in range(point_count)]
+    matrix = TransformationMatrix().translate(5, 5).rotate(30).scale(1.5)
+    elapsed, peak = _measure(lambda: matrix.apply_to_points(points))
+    print(f"{point_count:,} titik (list of tuples):")
+    print(f"   {'apply_to_points(points)':36s} {point_count / elapsed / 1e6:8.1f} Mpt/s   "
+          f"alokasi puncak {peak / 1e6:8.1f} MB")
+    print()
+
+
+def main():
+    print("=" * 60)
+    print("Benchmark: Zero-Copy apply_to_array")
+    print("=" * 60)
+    print()
+    bench_array()
+    bench_tuples()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,86 @@
 """
 Source code utama aplikasi MatrixTransform2D
 Aplikasi Desain Grafis 2D dengan Transformasi Matriks (Translasi, Rotasi, Skala)
+
+Submodule di-load secara lazy: `from src.matrix import TransformationMatrix`
+hanya memuat NumPy, tanpa pygame. Modul GUI (main, graphics, ui, ...) baru
+di-import saat atributnya pertama kali diakses.
 """
 
-from .main import MatrixTransform2DApp, main
-from .matrix import TransformationMatrix, Transform2D
-from .graphics import (
-    Point2D, Shape2D, Rectangle, Triangle, Circle, Line, Polygon,
-    Grid, Axis
-)
-from .ui import Button, Slider, TextLabel, ControlPanel
+import importlib
+import sys
+import types
 
 __version__ = "1.0.0"
-__all__ = [
-    "MatrixTransform2DApp",
-    "main",
-    "TransformationMatrix",
-    "Transform2D",
-    "Point2D",
-    "Shape2D",
-    "Rectangle",
-    "Triangle",
-    "Circle",
-    "Line",
-    "Polygon",
-    "Grid",
-    "Axis",
-    "Button",
-    "Slider",
-    "TextLabel",
-    "ControlPanel",
-]
+
+# Nama public -> submodule tempat nama tersebut didefinisikan
+_LAZY_ATTRIBUTES = {
+    "MatrixTransform2DApp": "main",
+    "main": "main",
+    "TransformationMatrix": "matrix",
+    "Transform2D": "matrix",
+    "build_matrix_stack": "matrix",
+    "decompose_matrix_stack": "matrix",
+    "PrecisionPolicy": "matrix",
+    "get_precision_policy": "matrix",
+    "set_precision_policy": "matrix",
+    "precision_scope": "matrix",
+    "Point2D": "graphics",
+    "PointList": "graphics",
+    "Shape2D": "graphics",
+    "Rectangle": "graphics",
+    "Triangle": "graphics",
+    "Circle": "graphics",
+    "Line": "graphics",
+    "Polygon": "graphics",
+    "Grid": "graphics",
+    "Axis": "graphics",
+    "compute_metrics": "graphics",
+    "SharedGeometry": "instancing",
+    "InstancedShape": "instancing",
+    "InstanceBatch": "instancing",
+    "RenderQueue": "render",
+    "generate_scene": "scene",
+    "AllocationProfiler": "profiling",
+    "export_svg": "export",
+    "export_png": "export",
+    "warp_image": "imaging",
+    "ImageShape": "imaging",
+    "TextureCache": "texture",
+    "Button": "ui",
+    "Slider": "ui",
+    "TextLabel": "ui",
+    "ControlPanel": "ui",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    """Import submodule saat atribut package pertama kali diakses"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    # Simpan di namespace package agar akses berikutnya tidak lewat __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    """Module package yang menjaga `src.main` tetap fungsi main()"""
+
+    def __setattr__(self, name, value):
+        # Import submodule src.main mem-bind nama 'main' di package ke module;
+        # sejak dulu `from src import main` memberikan fungsi entry point
+        if name == "main" and isinstance(value, types.ModuleType):
+            value = value.main
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
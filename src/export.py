@@ -0,0 +1,261 @@
+"""
+Export scene ke SVG dan PNG
+Kedua writer bekerja secara streaming: SVG ditulis shape per shape dan PNG
+dirender per strip baris lalu langsung dikompres, sehingga memory tidak
+bergantung pada jumlah shape (InstanceBatch diproses per potongan instance)
+"""
+
+import base64
+import io
+import struct
+import zlib
+import numpy as np
+import pygame
+from typing import BinaryIO, Iterable, Optional, TextIO, Union
+
+from .geometry import bounds_intersect, expand_bounds
+from .graphics import Shape2D
+from .imaging import NEAREST, ImageShape
+from .instancing import InstanceBatch
+from .matrix import TransformationMatrix
+from .render import RenderQueue
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Tebal outline, sama seperti rendering di layar
+_STROKE_WIDTH = 2
+
+
+def _hex_color(color) -> str:
+    """RGB tuple -> '#rrggbb'"""
+    return '#%02x%02x%02x' % tuple(int(channel) for channel in color[:3])
+
+
+def _svg_element(points: str, color, fill: bool, closed: bool,
+                 stroke_width: float = _STROKE_WIDTH) -> str:
+    """Satu elemen polygon/polyline SVG"""
+    tag = 'polygon' if closed else 'polyline'
+    if fill and closed:
+        return f'<{tag} points="{points}" fill="{_hex_color(color)}"/>\n'
+    return (f'<{tag} points="{points}" fill="none" stroke="{_hex_color(color)}" '
+            f'stroke-width="{stroke_width:g}"/>\n')
+
+
+def _svg_image(shape: ImageShape, view_matrix: Optional[TransformationMatrix],
+               precision: int) -> str:
+    """Elemen <image> dengan pixels shape sebagai PNG base64 dan matrix pixel -> dokumen"""
+    buffer = io.BytesIO()
+    writer = PNGStreamWriter(buffer, shape.image_width, shape.image_height, channels=4)
+    writer.write_rows(shape.pixels)
+    writer.close()
+    a, b, c, d, e, f = shape.image_matrix(view_matrix).coefficients
+    # SVG matrix(a b c d e f) berurutan kolom: x' = a*x + c*y + e, y' = b*x + d*y + f
+    matrix = ' '.join(f'{value:.{precision + 4}g}' for value in (a, d, b, e, c, f))
+    rendering = ' style="image-rendering:pixelated"' if shape.interpolation == NEAREST else ''
+    data = base64.b64encode(buffer.getvalue()).decode('ascii')
+    return (f'<image width="{shape.image_width}" height="{shape.image_height}" '
+            f'preserveAspectRatio="none" transform="matrix({matrix})"{rendering} '
+            f'href="data:image/png;base64,{data}"/>\n')
+
+
+class _Target:
+    """Context manager: buka path, atau pakai file object yang sudah terbuka"""
+
+    def __init__(self, target, mode: str):
+        self._target = target
+        self._mode = mode
+        self._file = None
+
+    def __enter__(self):
+        if hasattr(self._target, 'write'):
+            return self._target
+        self._file = open(self._target, self._mode)
+        return self._file
+
+    def __exit__(self, *exc_info):
+        if self._file is not None:
+            self._file.close()
+
+
+def export_svg(target: Union[str, TextIO], shapes: Iterable[Shape2D], width: int, height: int,
+               view_matrix: Optional[TransformationMatrix] = None,
+               instance_batch: Optional[InstanceBatch] = None,
+               background=(255, 255, 255), precision: int = 2, chunk_size: int = 16384) -> int:
+    """
+    Tulis scene ke file SVG secara streaming
+    ImageShape ditulis sebagai <image> berisi pixels (PNG base64) dengan
+    transform yang sama seperti render di layar
+    Args:
+        target: Path file atau file object teks
+        shapes: Shape2D yang ditulis (urutan gambar)
+        width, height: Ukuran dokumen (viewBox 0 0 width height)
+        view_matrix: Camera matrix (None: koordinat world langsung)
+        instance_batch: InstanceBatch yang digambar di belakang shapes
+        background: Warna background (None: transparan)
+        precision: Jumlah digit desimal koordinat
+        chunk_size: Jumlah instance yang ditransformasi dan ditulis sekaligus
+    Returns:
+        Jumlah elemen shape yang ditulis (shape di luar dokumen di-skip)
+    """
+    document = (0, 0, width, height)
+    # Instance digambar dengan outline default; shape memakai tebal garisnya sendiri
+    viewport = expand_bounds(document, _STROKE_WIDTH)
+    written = 0
+    with _Target(target, 'w') as out:
+        out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        out.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+                  f'viewBox="0 0 {width} {height}">\n')
+        if background is not None:
+            out.write(f'<rect width="100%" height="100%" fill="{_hex_color(background)}"/>\n')
+
+        if instance_batch is not None:
+            for geometry, vertices, colors in instance_batch.iter_chunks(view_matrix, chunk_size):
+                low, high = vertices.min(axis=1), vertices.max(axis=1)
+                visible = ((high[:, 0] >= viewport[0]) & (low[:, 0] <= viewport[2])
+                           & (high[:, 1] >= viewport[1]) & (low[:, 1] <= viewport[3]))
+                if not visible.any():
+                    continue
+                vertex_count = vertices.shape[1]
+                # Satu format string untuk semua instance geometry ini
+                template = ' '.join([f'%.{precision}f,%.{precision}f'] * vertex_count)
+                closed = vertex_count >= 3
+                lines = [_svg_element(template % tuple(flat), color, geometry.fill, closed)
+                         for flat, color in zip(vertices[visible].reshape(-1, 2 * vertex_count).tolist(),
+                                                colors[visible].tolist())]
+                out.write(''.join(lines))
+                written += len(lines)
+
+        point_format = f'%.{precision}f,%.{precision}f'
+        for shape in shapes:
+            # Tebal garis sama seperti di layar (Line.thickness, selain itu outline default)
+            stroke_width = getattr(shape, 'thickness', _STROKE_WIDTH)
+            bounds = shape.world_bounds if view_matrix is None else shape.get_screen_bounds(view_matrix)
+            if len(shape.vertices) < 2 or not bounds_intersect(
+                    bounds, expand_bounds(document, max(stroke_width, _STROKE_WIDTH))):
+                continue
+            if isinstance(shape, ImageShape):
+                out.write(_svg_image(shape, view_matrix, precision))
+                written += 1
+                continue
+            # Geometry penuh (tanpa LOD): SVG tetap tajam saat diperbesar
+            vertices = shape.transformed_vertices if view_matrix is None \
+                else shape.get_screen_vertices(view_matrix)
+            points = ' '.join([point_format] * len(vertices)) % tuple(vertices.ravel().tolist())
+            out.write(_svg_element(points, shape.color, shape.fill, len(vertices) >= 3,
+                                   stroke_width))
+            written += 1
+        out.write('</svg>\n')
+    return written
+
+
+class PNGStreamWriter:
+    """
+    Encoder PNG RGB/RGBA 8-bit yang menerima baris secara bertahap
+    Setiap strip difilter (PNG filter Up), dikompres dengan satu zlib stream
+    dan ditulis sebagai chunk IDAT, sehingga gambar penuh tidak pernah ada di memory
+    """
+
+    def __init__(self, out: BinaryIO, width: int, height: int, compression: int = 6,
+                 channels: int = 3):
+        """
+        Args:
+            out: File object biner tujuan
+            width, height: Ukuran gambar
+            compression: Level zlib (0-9)
+            channels: 3 (RGB) atau 4 (RGBA)
+        """
+        if channels not in (3, 4):
+            raise ValueError(f"PNG hanya mendukung 3 atau 4 channel, bukan {channels}")
+        self._out = out
+        self.width = width
+        self.height = height
+        self.channels = channels
+        self.rows_written = 0
+        self._compressor = zlib.compressobj(compression)
+        self._previous_row = np.zeros(width * channels, dtype=np.uint8)
+        out.write(_PNG_SIGNATURE)
+        # Bit depth 8, color type 2 (RGB) atau 6 (RGBA), compression 0, filter 0, interlace 0
+        color_type = 2 if channels == 3 else 6
+        self._chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0))
+
+    def _chunk(self, kind: bytes, data: bytes):
+        self._out.write(struct.pack('>I', len(data)))
+        self._out.write(kind)
+        self._out.write(data)
+        self._out.write(struct.pack('>I', zlib.crc32(data, zlib.crc32(kind)) & 0xFFFFFFFF))
+
+    def write_rows(self, rows: np.ndarray):
+        """
+        Tambah strip baris
+        Args:
+            rows: Array uint8 (h, width, channels)
+        """
+        row_bytes = self.width * self.channels
+        rows = np.asarray(rows, dtype=np.uint8).reshape(len(rows), row_bytes)
+        if self.rows_written + len(rows) > self.height:
+            raise ValueError(f"Lebih dari {self.height} baris ditulis ke PNG")
+        # Filter Up: selisih dengan baris di atasnya (mod 256), diawali byte tipe filter
+        above = np.vstack((self._previous_row, rows[:-1]))
+        filtered = np.empty((len(rows), row_bytes + 1), dtype=np.uint8)
+        filtered[:, 0] = 2
+        np.subtract(rows, above, out=filtered[:, 1:])
+        data = self._compressor.compress(filtered.tobytes())
+        if data:
+            self._chunk(b'IDAT', data)
+        self._previous_row = rows[-1].copy()
+        self.rows_written += len(rows)
+
+    def close(self):
+        """Tulis sisa data terkompresi dan chunk IEND"""
+        if self.rows_written != self.height:
+            raise ValueError(f"PNG membutuhkan {self.height} baris, baru {self.rows_written}")
+        self._chunk(b'IDAT', self._compressor.flush())
+        self._chunk(b'IEND', b'')
+
+
+def export_png(target: Union[str, BinaryIO], shapes: Iterable[Shape2D], width: int, height: int,
+               view_matrix: Optional[TransformationMatrix] = None,
+               instance_batch: Optional[InstanceBatch] = None,
+               background=(255, 255, 255), strip_height: int = 256,
+               chunk_size: int = 65536, compression: int = 6) -> int:
+    """
+    Render scene ke PNG per strip baris (headless, tanpa display)
+    Setiap strip adalah pygame.Surface width x strip_height dengan view matrix
+    yang digeser; shape di luar strip di-cull sebelum digambar. Shape filled
+    identik dengan render satu surface; outline yang melewati batas strip bisa
+    bergeser 1 pixel karena pygame meng-clip garis ke surface dengan koordinat integer
+    Args:
+        target: Path file atau file object biner
+        shapes: Shape2D yang digambar (urutan gambar)
+        width, height: Ukuran gambar
+        view_matrix: Camera matrix (None: koordinat world langsung)
+        instance_batch: InstanceBatch yang digambar di belakang shapes
+        background: Warna background
+        strip_height: Jumlah baris per strip render
+        chunk_size: Jumlah instance per batch transformasi
+        compression: Level zlib (0-9)
+    Returns:
+        Jumlah strip yang dirender
+    """
+    shapes = list(shapes)
+    strip = pygame.Surface((width, min(strip_height, height)))
+    queue = RenderQueue()
+    strips = 0
+    with _Target(target, 'wb') as out:
+        writer = PNGStreamWriter(out, width, height, compression)
+        for top in range(0, height, strip_height):
+            rows = min(strip_height, height - top)
+            strip_view = TransformationMatrix().translate(0, -top)
+            if view_matrix is not None:
+                strip_view.compose(view_matrix)
+            strip.fill(background)
+            if instance_batch is not None:
+                instance_batch.draw(strip, strip_view, chunk_size)
+            for shape in shapes:
+                shape.submit(queue, strip, view_matrix=strip_view)
+            queue.flush(strip)
+            pixels = np.frombuffer(pygame.image.tobytes(strip, 'RGB'), dtype=np.uint8)
+            writer.write_rows(pixels.reshape(-1, width, 3)[:rows])
+            strips += 1
+        writer.close()
+    return strips
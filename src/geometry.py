@@ -0,0 +1,646 @@
+"""
+Utilitas geometri 2D
+Convex hull dan bounding box, clipping polygon/segment ke bounds, metrics
+(area, centroid, keliling), simplifikasi Douglas-Peucker dan PolylineLOD,
+triangulasi ear clipping, hit testing (segitiga, crossing number, jarak ke
+edge) serta software rasterizer. Hanya memakai NumPy sehingga bisa dipakai
+tanpa pygame
+"""
+
+import math
+import numpy as np
+from typing import Optional, Tuple
+
+# Bounding box: (min_x, min_y, max_x, max_y)
+Bounds = Tuple[float, float, float, float]
+
+EMPTY_BOUNDS: Bounds = (np.inf, np.inf, -np.inf, -np.inf)
+
+
+def convex_hull(points) -> np.ndarray:
+    """
+    Hitung convex hull dengan algoritma monotone chain (Andrew)
+    Args:
+        points: Array-like (N, 2)
+    Returns:
+        ndarray (H, 2) berisi titik hull berlawanan arah jarum jam
+        (dengan sumbu y ke atas), tanpa titik kolinear
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    unique = np.unique(points, axis=0)  # urut berdasarkan x lalu y
+    if len(unique) < 3:
+        return unique
+
+    def half_hull(sequence):
+        hull = []
+        for x, y in sequence:
+            while len(hull) >= 2:
+                (ax, ay), (bx, by) = hull[-2], hull[-1]
+                if (bx - ax) * (y - ay) - (by - ay) * (x - ax) > 0:
+                    break
+                hull.pop()
+            hull.append((x, y))
+        return hull
+
+    ordered = unique.tolist()
+    lower = half_hull(ordered)
+    upper = half_hull(reversed(ordered))
+    return np.array(lower[:-1] + upper[:-1], dtype=np.float64)
+
+
+def bounds_of(points) -> Bounds:
+    """
+    Bounding box sejajar sumbu dari kumpulan titik
+    Returns:
+        Tuple (min_x, min_y, max_x, max_y), atau EMPTY_BOUNDS jika kosong
+    """
+    points = np.asarray(points).reshape(-1, 2)
+    if len(points) == 0:
+        return EMPTY_BOUNDS
+    min_x, min_y = points.min(axis=0).tolist()
+    max_x, max_y = points.max(axis=0).tolist()
+    return (min_x, min_y, max_x, max_y)
+
+
+def bounds_intersect(a: Bounds, b: Bounds) -> bool:
+    """True jika dua bounding box saling beririsan (termasuk bersentuhan)"""
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def bounds_contain_point(bounds: Bounds, x: float, y: float) -> bool:
+    """True jika titik (x, y) berada di dalam bounding box"""
+    return bounds[0] <= x <= bounds[2] and bounds[1] <= y <= bounds[3]
+
+
+def expand_bounds(bounds: Bounds, margin: float) -> Bounds:
+    """Perbesar bounding box ke semua arah sebesar margin"""
+    return (bounds[0] - margin, bounds[1] - margin, bounds[2] + margin, bounds[3] + margin)
+
+
+def bounds_inside(inner: Bounds, outer: Bounds) -> bool:
+    """True jika bounding box inner seluruhnya berada di dalam outer"""
+    return (outer[0] <= inner[0] and inner[2] <= outer[2]
+            and outer[1] <= inner[1] and inner[3] <= outer[3])
+
+
+def pixel_coordinates(points) -> np.ndarray:
+    """
+    Koordinat float -> integer pixel dengan floor (bukan truncation ke nol),
+    sehingga vertex di kiri/atas surface tetap konsisten saat view digeser
+    """
+    return np.floor(points).astype(np.int64)
+
+
+def clip_polygon(points, bounds: Bounds) -> np.ndarray:
+    """
+    Clip polygon terhadap rectangle (Sutherland-Hodgman)
+    Setiap dari empat sisi rectangle memproses semua edge sekaligus dengan NumPy
+    Args:
+        points: Array-like (N, 2) vertex polygon (tertutup secara implisit)
+        bounds: Rectangle clip (min_x, min_y, max_x, max_y)
+    Returns:
+        ndarray (M, 2) polygon hasil clip (kosong jika di luar rectangle)
+    """
+    polygon = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    # (axis, batas, tanda): titik di dalam jika tanda * (koordinat - batas) >= 0
+    planes = ((0, bounds[0], 1.0), (0, bounds[2], -1.0), (1, bounds[1], 1.0), (1, bounds[3], -1.0))
+    for axis, limit, sign in planes:
+        if len(polygon) == 0:
+            break
+        distance = sign * (polygon[:, axis] - limit)
+        inside = distance >= 0
+        if inside.all():
+            continue
+        following = np.roll(polygon, -1, axis=0)
+        next_distance = np.roll(distance, -1)
+        crossing = inside != (next_distance >= 0)
+        t = np.divide(distance, distance - next_distance,
+                      out=np.zeros_like(distance), where=crossing)
+        intersection = polygon + t[:, None] * (following - polygon)
+        intersection[:, axis] = limit
+        # Edge p -> q menghasilkan p (jika di dalam) lalu titik potong (jika memotong)
+        candidates = np.stack((polygon, intersection), axis=1)
+        polygon = candidates[np.stack((inside, crossing), axis=1)]
+    return polygon
+
+
+def clip_segments(starts, ends, bounds: Bounds):
+    """
+    Clip banyak segment garis sekaligus terhadap rectangle (Liang-Barsky)
+    Args:
+        starts, ends: Array-like (N, 2) titik awal dan akhir segment
+        bounds: Rectangle clip (min_x, min_y, max_x, max_y)
+    Returns:
+        Tuple (starts, ends, visible): titik hasil clip (N, 2) dan mask (N,)
+        segment yang masih terlihat
+    """
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+    delta = ends - starts
+    t_enter = np.zeros(len(starts))
+    t_exit = np.ones(len(starts))
+    visible = np.ones(len(starts), dtype=bool)
+    for axis, limit, sign in ((0, bounds[0], 1.0), (0, bounds[2], -1.0),
+                              (1, bounds[1], 1.0), (1, bounds[3], -1.0)):
+        # Di dalam jika sign * (start + t * delta - limit) >= 0
+        p = -sign * delta[:, axis]
+        q = sign * (starts[:, axis] - limit)
+        parallel = p == 0
+        visible &= ~(parallel & (q < 0))
+        ratio = np.divide(q, p, out=np.zeros_like(q), where=~parallel)
+        np.maximum(t_enter, ratio, out=t_enter, where=p < 0)
+        np.minimum(t_exit, ratio, out=t_exit, where=p > 0)
+    visible &= t_enter <= t_exit
+    return (starts + t_enter[:, None] * delta, starts + t_exit[:, None] * delta, visible)
+
+
+class ShapeMetrics:
+    """Metrik polygon: signed area, centroid, keliling dan bounding box"""
+
+    __slots__ = ('area', 'centroid', 'perimeter', 'bounds')
+
+    def __init__(self, area: float, centroid: Tuple[float, float], perimeter: float,
+                 bounds: Bounds):
+        self.area = area
+        self.centroid = centroid
+        self.perimeter = perimeter
+        self.bounds = bounds
+
+    def __repr__(self):
+        return (f"ShapeMetrics(area={self.area:.2f}, centroid=({self.centroid[0]:.2f}, "
+                f"{self.centroid[1]:.2f}), perimeter={self.perimeter:.2f})")
+
+
+def _is_degenerate(area, extent):
+    """Area dianggap nol relatif terhadap ukuran polygon (garis, titik kolinear)"""
+    return np.abs(area) <= 1e-12 * np.maximum(extent, 1e-300) ** 2
+
+
+def polygon_metrics(points) -> ShapeMetrics:
+    """
+    Hitung metrik polygon sederhana dengan rumus shoelace
+    Centroid berbobot area; untuk polygon tanpa area (garis, titik kolinear)
+    dipakai rata-rata vertex. Keliling menutup polygon hanya jika N >= 3
+    Args:
+        points: Array-like (N, 2) vertex polygon
+    Returns:
+        ShapeMetrics (area positif untuk urutan berlawanan arah jarum jam
+        dengan sumbu y ke atas)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) == 0:
+        return ShapeMetrics(0.0, (0.0, 0.0), 0.0, EMPTY_BOUNDS)
+    bounds = bounds_of(points)
+    # Relatif terhadap vertex pertama supaya tidak kehilangan presisi jauh dari origin
+    origin = points[0]
+    local = points - origin
+    following = np.roll(local, -1, axis=0)
+    cross = local[:, 0] * following[:, 1] - following[:, 0] * local[:, 1]
+    area = float(cross.sum()) / 2
+    extent = max(bounds[2] - bounds[0], bounds[3] - bounds[1])
+    if len(points) < 3 or _is_degenerate(area, extent):
+        centroid = points.mean(axis=0)
+        area = 0.0
+    else:
+        centroid = origin + ((local + following) * cross[:, None]).sum(axis=0) / (6 * area)
+    edges = following - local if len(points) >= 3 else np.diff(local, axis=0)
+    perimeter = float(np.hypot(edges[:, 0], edges[:, 1]).sum())
+    return ShapeMetrics(area, (float(centroid[0]), float(centroid[1])), perimeter, bounds)
+
+
+def batch_polygon_metrics(polygons):
+    """
+    Versi vektor dari polygon_metrics untuk banyak polygon sekaligus
+    Semua vertex digabung menjadi satu array; jumlah per polygon memakai
+    np.add.reduceat sehingga tidak ada loop Python per polygon
+    Args:
+        polygons: Sequence array-like (Ni, 2)
+    Returns:
+        Tuple (areas (M,), centroids (M, 2), perimeters (M,), bounds (M, 4))
+    """
+    arrays = [np.asarray(points, dtype=np.float64).reshape(-1, 2) for points in polygons]
+    count = len(arrays)
+    areas = np.zeros(count)
+    centroids = np.zeros((count, 2))
+    perimeters = np.zeros(count)
+    bounds = np.tile(np.array(EMPTY_BOUNDS), (count, 1))
+    sizes = np.array([len(points) for points in arrays], dtype=np.int64)
+    present = np.flatnonzero(sizes > 0)
+    if len(present) == 0:
+        return areas, centroids, perimeters, bounds
+
+    sizes = sizes[present]
+    points = np.concatenate([arrays[i] for i in present])
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    owner = np.repeat(np.arange(len(present)), sizes)
+    # Vertex berikutnya dalam polygon yang sama (vertex terakhir kembali ke awal)
+    following_index = np.arange(len(points)) + 1
+    following_index[starts + sizes - 1] = starts
+    local = points - points[starts][owner]
+    following = local[following_index]
+
+    cross = local[:, 0] * following[:, 1] - following[:, 0] * local[:, 1]
+    area = np.add.reduceat(cross, starts) / 2
+    low = np.minimum.reduceat(points, starts)
+    high = np.maximum.reduceat(points, starts)
+    extent = np.max(high - low, axis=1)
+    mean = np.add.reduceat(points, starts) / sizes[:, None]
+    degenerate = (sizes < 3) | _is_degenerate(area, extent)
+    area = np.where(degenerate, 0.0, area)
+    weighted = np.add.reduceat((local + following) * cross[:, None], starts)
+    safe_area = np.where(degenerate, 1.0, area)
+    centroid = points[starts] + weighted / (6 * safe_area[:, None])
+    centroid[degenerate] = mean[degenerate]
+
+    # Polygon dengan < 3 vertex tidak ditutup: edge terakhir -> awal tidak dihitung
+    edges = following - local
+    lengths = np.hypot(edges[:, 0], edges[:, 1])
+    lengths[(starts + sizes - 1)[sizes < 3]] = 0.0
+    perimeter = np.add.reduceat(lengths, starts)
+
+    areas[present] = area
+    centroids[present] = centroid
+    perimeters[present] = perimeter
+    bounds[present] = np.column_stack((low, high))
+    return areas, centroids, perimeters, bounds
+
+
+def douglas_peucker_importance(points, closed: bool = True,
+                               min_tolerance: float = 0.0) -> np.ndarray:
+    """
+    Importance tiap vertex menurut Douglas-Peucker: toleransi terbesar di mana
+    vertex masih dipertahankan. Simplifikasi pada toleransi t adalah semua
+    vertex dengan importance > t; importance vertex tidak pernah melebihi
+    vertex yang memecah segment induknya, sehingga level-level bersarang.
+    Semua segment aktif diproses sekaligus per iterasi (O(N) NumPy per level
+    kedalaman rekursi), bukan satu panggilan per segment
+    Args:
+        points: Array-like (N, 2)
+        closed: True untuk polygon (edge terakhir kembali ke vertex pertama)
+        min_tolerance: Segment dengan deviasi <= nilai ini tidak dipecah lagi
+            (vertex di dalamnya mendapat importance 0)
+    Returns:
+        ndarray (N,) importance; vertex yang selalu dipertahankan bernilai inf
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    count = len(points)
+    importance = np.zeros(count)
+    if count <= (3 if closed else 2):
+        importance[:] = np.inf
+        return importance
+
+    if closed:
+        # Dua seed: vertex pertama dan vertex terjauh darinya; index count = vertex 0 lagi
+        far = int(np.argmax(np.hypot(*(points - points[0]).T)))
+        if far == 0:
+            importance[0] = np.inf
+            return importance
+        extended = np.vstack((points, points[:1]))
+        importance[[0, far]] = np.inf
+        starts, ends = np.array([0, far]), np.array([far, count])
+    else:
+        extended = points
+        importance[[0, -1]] = np.inf
+        starts, ends = np.array([0]), np.array([count - 1])
+    caps = np.full(len(starts), np.inf)
+    xs, ys = extended[:, 0].copy(), extended[:, 1].copy()
+
+    while len(starts):
+        lengths = ends - starts - 1
+        has_interior = lengths > 0
+        starts, ends, caps, lengths = (starts[has_interior], ends[has_interior],
+                                       caps[has_interior], lengths[has_interior])
+        if len(starts) == 0:
+            break
+        # Index semua vertex interior dari semua segment, berurutan per segment
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        index = np.arange(offsets[-1] + lengths[-1]) + np.repeat(starts + 1 - offsets, lengths)
+
+        # Jarak kuadrat vertex ke chord segmentnya (segment, bukan garis tak hingga)
+        ax, ay = xs[starts], ys[starts]
+        chord_x, chord_y = xs[ends] - ax, ys[ends] - ay
+        px = xs[index] - np.repeat(ax, lengths)
+        py = ys[index] - np.repeat(ay, lengths)
+        cx, cy = np.repeat(chord_x, lengths), np.repeat(chord_y, lengths)
+        length2 = cx * cx + cy * cy
+        t = np.divide(px * cx + py * cy, length2, out=np.zeros_like(length2), where=length2 > 0)
+        np.clip(t, 0.0, 1.0, out=t)
+        px -= t * cx
+        py -= t * cy
+        distance2 = px * px + py * py
+
+        # Vertex pertama dengan jarak maksimum di tiap segment
+        maximum2 = np.maximum.reduceat(distance2, offsets)
+        candidates = np.flatnonzero(distance2 == np.repeat(maximum2, lengths))
+        owner = np.searchsorted(offsets, candidates, side='right') - 1
+        first = np.concatenate(([True], owner[1:] != owner[:-1]))
+        split = index[candidates[first]]
+
+        maximum = np.sqrt(maximum2)
+        active = maximum > min_tolerance
+        value = np.minimum(maximum, caps)[active]
+        split = split[active]
+        importance[split] = value
+        starts, ends = (np.concatenate((starts[active], split)),
+                        np.concatenate((split, ends[active])))
+        caps = np.concatenate((value, value))
+    return importance
+
+
+def simplify_polyline(points, tolerance: float, closed: bool = True) -> np.ndarray:
+    """
+    Simplifikasi Douglas-Peucker
+    Args:
+        points: Array-like (N, 2)
+        tolerance: Deviasi maksimum dari bentuk asli
+        closed: True untuk polygon
+    Returns:
+        ndarray (M, 2) vertex yang dipertahankan, urutan asli
+    """
+    points = np.asarray(points).reshape(-1, 2)
+    importance = douglas_peucker_importance(points, closed, tolerance)
+    return points[importance > tolerance]
+
+
+class PolylineLOD:
+    """
+    Simplifikasi multi-resolusi dari satu polyline/polygon
+    Importance Douglas-Peucker dihitung sekali; level k menyimpan vertex
+    dengan importance > base_tolerance * 2^k (level 0 paling detail).
+    Polygon tertutup selalu menyimpan minimal 3 vertex per level
+    """
+
+    def __init__(self, points, closed: bool = True, level_count: int = 16):
+        """
+        Args:
+            points: Array (N, 2) vertex asli (tidak disalin)
+            closed: True untuk polygon
+            level_count: Jumlah level; toleransi terkasar = ukuran bounding box
+        """
+        self.points = np.asarray(points).reshape(-1, 2)
+        bounds = bounds_of(self.points)
+        extent = max(bounds[2] - bounds[0], bounds[3] - bounds[1]) if len(self.points) else 0.0
+        if not extent > 0:
+            self.base_tolerance = np.inf
+            self.tolerances = np.empty(0)
+            self._levels = []
+            return
+        self.base_tolerance = extent / 2 ** level_count
+        self.tolerances = self.base_tolerance * 2.0 ** np.arange(level_count + 1)
+        importance = douglas_peucker_importance(self.points, closed, self.base_tolerance)
+        minimum = 3 if closed and len(self.points) >= 3 else min(len(self.points), 2)
+        ranked = np.sort(np.argsort(-importance, kind='stable')[:minimum])
+        self._levels = []
+        for tolerance in self.tolerances:
+            indices = np.flatnonzero(importance > tolerance)
+            if len(indices) < minimum:
+                indices = ranked
+            self._levels.append(self.points[indices])
+
+    def __len__(self):
+        return len(self._levels)
+
+    def level_for(self, tolerance: float) -> Optional[int]:
+        """
+        Level paling kasar dengan toleransi <= tolerance
+        Returns:
+            Index level, atau None jika vertex asli yang harus dipakai
+        """
+        if not self._levels or not tolerance >= self.base_tolerance:
+            return None
+        level = int(math.floor(math.log2(tolerance / self.base_tolerance)))
+        return min(level, len(self._levels) - 1)
+
+    def vertices(self, level: int) -> np.ndarray:
+        """Vertex (M, 2) untuk level tertentu"""
+        return self._levels[level]
+
+
+def triangulate(points) -> np.ndarray:
+    """
+    Triangulasi polygon sederhana (boleh concave) dengan ear clipping
+    Vertex reflex dikelompokkan dalam grid seragam sehingga tes "tidak ada
+    vertex lain di dalam ear" hanya memeriksa vertex reflex di cell yang
+    disentuh ear tersebut. Polygon self-intersecting tetap menghasilkan triangulasi
+    (tidak dijamin benar) alih-alih loop tanpa akhir
+    Args:
+        points: Array-like (N, 2), urutan searah atau berlawanan jarum jam
+    Returns:
+        ndarray (N - 2, 3) index vertex per segitiga (kosong jika N < 3 atau
+        polygon tidak memiliki area)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    count = len(points)
+    if count < 3:
+        return np.empty((0, 3), dtype=np.intp)
+    metrics = polygon_metrics(points)
+    if metrics.area == 0:
+        return np.empty((0, 3), dtype=np.intp)
+    # Relatif terhadap bounds supaya cross product presisi jauh dari origin
+    local = points - (metrics.bounds[0], metrics.bounds[1])
+    xs, ys = local[:, 0].tolist(), local[:, 1].tolist()
+    orientation = 1.0 if metrics.area > 0 else -1.0
+    extent = max(metrics.bounds[2] - metrics.bounds[0], metrics.bounds[3] - metrics.bounds[1])
+    epsilon = 1e-12 * extent * extent
+
+    previous = [count - 1] + list(range(count - 1))
+    following = list(range(1, count)) + [0]
+
+    def cross(a, b, c):
+        """Cross (b - a) x (c - b), positif untuk belokan searah orientasi polygon"""
+        return orientation * ((xs[b] - xs[a]) * (ys[c] - ys[b]) - (ys[b] - ys[a]) * (xs[c] - xs[b]))
+
+    convex = [cross(previous[i], i, following[i]) > epsilon for i in range(count)]
+    reflex = [not value for value in convex]
+    width = metrics.bounds[2] - metrics.bounds[0]
+    height = metrics.bounds[3] - metrics.bounds[1]
+    # Grid seragam berisi vertex reflex (sekitar satu vertex per cell): tes ear
+    # hanya memeriksa cell yang tumpang tindih dengan bounding box segitiga.
+    # Grid dibangun ulang (lebih kasar) setiap jumlah reflex tinggal separuh,
+    # karena ear yang dipotong belakangan semakin besar
+    state = {}
+
+    def build_grid():
+        alive = [i for i in range(count) if reflex[i]]
+        cell = max(math.sqrt(width * height / max(len(alive), 1)), extent / max(len(alive), 1), 1e-300)
+        columns = int(width / cell) + 1
+        grid = {}
+        for i in alive:
+            grid.setdefault(int(ys[i] / cell) * columns + int(xs[i] / cell), []).append(i)
+        state.update(cell=cell, columns=columns, grid=grid, alive=len(alive), built=len(alive))
+
+    def remove_reflex(i):
+        reflex[i] = False
+        state['alive'] -= 1
+        if state['alive'] * 2 < state['built']:
+            build_grid()
+
+    def contains_reflex(a, b, c):
+        """True jika ada vertex reflex (selain a, b, c) di dalam atau pada segitiga"""
+        cell, columns, grid = state['cell'], state['columns'], state['grid']
+        column_low = int(min(xs[a], xs[b], xs[c]) / cell)
+        column_high = int(max(xs[a], xs[b], xs[c]) / cell)
+        for row in range(int(min(ys[a], ys[b], ys[c]) / cell),
+                         int(max(ys[a], ys[b], ys[c]) / cell) + 1):
+            for column in range(column_low, column_high + 1):
+                for vertex in grid.get(row * columns + column, ()):
+                    if not reflex[vertex] or vertex == a or vertex == b or vertex == c:
+                        continue
+                    if cross(a, b, vertex) >= -epsilon and cross(b, c, vertex) >= -epsilon \
+                            and cross(c, a, vertex) >= -epsilon:
+                        return True
+        return False
+
+    build_grid()
+
+    triangles = []
+    remaining = count
+    vertex = 0
+    misses = 0
+    while remaining > 3:
+        a, c = previous[vertex], following[vertex]
+        is_ear = convex[vertex] and not contains_reflex(a, vertex, c)
+        if not is_ear and misses > remaining:
+            # Tidak ada ear valid (collinear atau self-intersecting): potong paksa
+            is_ear = True
+        if not is_ear:
+            vertex = c
+            misses += 1
+            continue
+        triangles.append((a, vertex, c))
+        following[a], previous[c] = c, a
+        remaining -= 1
+        misses = 0
+        for neighbour in (a, c):
+            if not convex[neighbour] and cross(previous[neighbour], neighbour,
+                                               following[neighbour]) > epsilon:
+                convex[neighbour] = True
+                remove_reflex(neighbour)
+        # Vertex yang sudah dipotong tidak lagi menjadi penghalang
+        if reflex[vertex]:
+            remove_reflex(vertex)
+        vertex = c
+    triangles.append((previous[vertex], vertex, following[vertex]))
+    return np.array(triangles, dtype=np.intp)
+
+
+def triangle_areas(points, triangles) -> np.ndarray:
+    """Luas (tanpa tanda) setiap segitiga (T,) dari index buffer (T, 3)"""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    a, b, c = points[triangles[:, 0]], points[triangles[:, 1]], points[triangles[:, 2]]
+    ab, ac = b - a, c - a
+    return np.abs(ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0]) / 2
+
+
+def points_in_triangles(points, triangles, queries) -> np.ndarray:
+    """
+    Cek titik mana yang berada di dalam (atau pada tepi) salah satu segitiga
+    Args:
+        points: Vertex (N, 2)
+        triangles: Index buffer (T, 3)
+        queries: Titik yang dicek (Q, 2)
+    Returns:
+        ndarray bool (Q,)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    queries = np.asarray(queries, dtype=np.float64).reshape(-1, 2)
+    inside = np.zeros(len(queries), dtype=bool)
+    if len(triangles) == 0 or len(queries) == 0:
+        return inside
+    a, b, c = points[triangles[:, 0]], points[triangles[:, 1]], points[triangles[:, 2]]
+
+    def side(start, end):
+        # (Q, T): cross (end - start) x (query - start)
+        edge = end - start
+        offset = queries[:, None, :] - start[None]
+        return edge[None, :, 0] * offset[..., 1] - edge[None, :, 1] * offset[..., 0]
+
+    d1, d2, d3 = side(a, b), side(b, c), side(c, a)
+    has_negative = (d1 < 0) | (d2 < 0) | (d3 < 0)
+    has_positive = (d1 > 0) | (d2 > 0) | (d3 > 0)
+    return (~(has_negative & has_positive)).any(axis=1)
+
+
+def points_in_polygon(points, queries) -> np.ndarray:
+    """
+    Cek titik mana yang berada di dalam polygon dengan aturan even-odd
+    (crossing number, O(N) per titik tanpa triangulasi). Titik tepat pada
+    tepi bisa jatuh ke dalam atau ke luar
+    Args:
+        points: Vertex polygon (N, 2)
+        queries: Titik yang dicek (Q, 2)
+    Returns:
+        ndarray bool (Q,)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    queries = np.asarray(queries, dtype=np.float64).reshape(-1, 2)
+    inside = np.zeros(len(queries), dtype=bool)
+    if len(points) < 3:
+        return inside
+    ends = np.roll(points, -1, axis=0)
+    for index, (x, y) in enumerate(queries):
+        # Edge yang memotong garis horizontal y (setengah terbuka: tidak dihitung dua kali)
+        crossing = (points[:, 1] > y) != (ends[:, 1] > y)
+        start, end = points[crossing], ends[crossing]
+        x_cross = start[:, 0] + (y - start[:, 1]) * (end[:, 0] - start[:, 0]) / (end[:, 1] - start[:, 1])
+        inside[index] = np.count_nonzero(x_cross > x) % 2 == 1
+    return inside
+
+
+def rasterize_triangles(points, triangles, width: int, height: int,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Software rasterizer: tandai pixel yang center-nya tertutup segitiga
+    Setiap segitiga hanya mengevaluasi pixel di dalam bounding box-nya
+    (edge function, semua dalam NumPy)
+    Args:
+        points: Vertex (N, 2) dalam koordinat pixel
+        triangles: Index buffer (T, 3)
+        width, height: Ukuran mask
+        out: Mask bool (height, width) tujuan (default: buat baru)
+    Returns:
+        Mask bool (height, width); mask[y, x] True jika pixel tertutup
+    """
+    mask = np.zeros((height, width), dtype=bool) if out is None else out
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    for a, b, c in points[np.asarray(triangles, dtype=np.intp)]:
+        # Pixel (x, y) memiliki center (x + 0.5, y + 0.5)
+        x0 = max(int(math.floor(min(a[0], b[0], c[0]) - 0.5)) + 1, 0)
+        x1 = min(int(math.floor(max(a[0], b[0], c[0]) - 0.5)), width - 1)
+        y0 = max(int(math.floor(min(a[1], b[1], c[1]) - 0.5)) + 1, 0)
+        y1 = min(int(math.floor(max(a[1], b[1], c[1]) - 0.5)), height - 1)
+        if x0 > x1 or y0 > y1:
+            continue
+        px = np.arange(x0, x1 + 1) + 0.5
+        py = (np.arange(y0, y1 + 1) + 0.5)[:, None]
+        d1 = (b[0] - a[0]) * (py - a[1]) - (b[1] - a[1]) * (px - a[0])
+        d2 = (c[0] - b[0]) * (py - b[1]) - (c[1] - b[1]) * (px - b[0])
+        d3 = (a[0] - c[0]) * (py - c[1]) - (a[1] - c[1]) * (px - c[0])
+        covered = ((d1 >= 0) & (d2 >= 0) & (d3 >= 0)) | ((d1 <= 0) & (d2 <= 0) & (d3 <= 0))
+        mask[y0:y1 + 1, x0:x1 + 1] |= covered
+    return mask
+
+
+def distance_to_edges(points, x: float, y: float, closed: bool = True) -> float:
+    """
+    Jarak terdekat titik (x, y) ke edge polyline/polygon
+    Args:
+        points: Vertex (N, 2)
+        closed: True jika edge terakhir kembali ke vertex pertama
+    Returns:
+        Jarak minimum (inf jika tidak ada vertex)
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    if len(points) == 0:
+        return math.inf
+    if len(points) == 1:
+        return math.hypot(points[0, 0] - x, points[0, 1] - y)
+    starts = points if closed else points[:-1]
+    ends = np.roll(points, -1, axis=0) if closed else points[1:]
+    edge = ends - starts
+    offset = np.array((x, y)) - starts
+    length2 = (edge * edge).sum(axis=1)
+    t = np.divide((offset * edge).sum(axis=1), length2,
+                  out=np.zeros_like(length2), where=length2 > 0)
+    deviation = offset - np.clip(t, 0.0, 1.0)[:, None] * edge
+    return float(np.hypot(deviation[:, 0], deviation[:, 1]).min())
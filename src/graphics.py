@@ -5,13 +5,41 @@ Menggunakan Pygame untuk rendering
 
 import pygame
 import math
-from typing import List, Tuple
-from .matrix import TransformationMatrix
+import numpy as np
+from collections.abc import MutableSequence
+from typing import Callable, List, Tuple
+from .matrix import TransformationMatrix, get_precision_policy
+from .geometry import (
+    Bounds, ShapeMetrics, PolylineLOD, convex_hull, bounds_of, bounds_intersect, bounds_inside,
+    bounds_contain_point, expand_bounds, clip_polygon, clip_segments, polygon_metrics,
+    batch_polygon_metrics, triangulate, triangle_areas, points_in_triangles, points_in_polygon,
+    rasterize_triangles, distance_to_edges, pixel_coordinates
+)
+from .render import RenderQueue, grid_polyline
+
+# Margin culling dalam pixel: tebal outline dan radius maksimum center dot
+_CULL_MARGIN = 8
+
+# Shape yang melewati canvas lebih dari faktor ini x ukuran canvas di-clip
+# sebelum digambar (guard band); yang lebih kecil langsung diserahkan ke pygame
+_GUARD_BAND = 1.0
+
+# Shape dengan vertex sebanyak ini atau lebih digambar dari level simplifikasi
+# (PolylineLOD) dengan deviasi maksimum _LOD_PIXEL_TOLERANCE pixel di layar
+_LOD_MIN_VERTICES = 256
+_LOD_PIXEL_TOLERANCE = 0.5
+
+# Shape dengan vertex sebanyak ini atau lebih di-hit-test dengan crossing number
+# langsung pada outline; triangulasi hanya dibuat saat rasterize
+_PICK_CROSSING_MIN_VERTICES = 1024
 
 
 class Point2D:
     """Class untuk merepresentasikan titik 2D"""
     
+    # Tanpa __dict__ per instance supaya hemat memory
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -29,6 +57,61 @@ class Point2D:
         return f"Point2D({self.x:.2f}, {self.y:.2f})"
 
 
+def _point_tuple(point) -> Tuple[float, float]:
+    """Point2D atau (x, y) menjadi tuple (x, y)"""
+    return point.to_tuple() if isinstance(point, Point2D) else tuple(point)
+
+
+class PointList(MutableSequence):
+    """
+    View list Point2D atas vertex array shape (kompatibilitas API lama)
+    Item assignment, append, insert dan del ditulis kembali ke shape sehingga
+    geometry version ikut naik. Point2D yang dibaca adalah salinan: mengubah
+    p.x tidak mengubah shape, assign ulang dengan points[i] = p
+    """
+    
+    __slots__ = ('_read', '_write')
+    
+    def __init__(self, read: Callable[[], np.ndarray], write: Callable[[list], None]):
+        """
+        Args:
+            read: Fungsi yang mengembalikan vertex array (N, 2) terkini
+            write: Fungsi yang menerima list (x, y) baru
+        """
+        self._read = read
+        self._write = write
+    
+    def __len__(self):
+        return len(self._read())
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Point2D(x, y) for x, y in self._read()[index].tolist()]
+        x, y = self._read()[index].tolist()
+        return Point2D(x, y)
+    
+    def __setitem__(self, index, value):
+        points = self._read().tolist()
+        if isinstance(index, slice):
+            points[index] = [_point_tuple(p) for p in value]
+        else:
+            points[index] = _point_tuple(value)
+        self._write(points)
+    
+    def __delitem__(self, index):
+        points = self._read().tolist()
+        del points[index]
+        self._write(points)
+    
+    def insert(self, index, value):
+        points = self._read().tolist()
+        points.insert(index, _point_tuple(value))
+        self._write(points)
+    
+    def __repr__(self):
+        return f"PointList({list(self)!r})"
+
+
 class Shape2D:
     """Base class untuk objek 2D"""
     
@@ -39,86 +122,471 @@ class Shape2D:
             color: RGB color tuple (default: blue)
             fill: True untuk filled shape, False untuk outline only
         """
-        self.original_points = [Point2D(x, y) for x, y in points]
-        self.transformed_points = self.original_points.copy()
+        # Vertex disimpan sebagai array (N, 2); hot path tidak membuat Point2D
+        # dtype mengikuti precision policy yang aktif saat shape dibuat
+        self._vertices = np.array(points, dtype=get_precision_policy().dtype).reshape(-1, 2)
+        self._geometry_version = 0
+        # Cache transformed vertices: (key, array). Slot world dan screen terpisah
+        # supaya rendering dengan camera tidak membuang cache world-space
+        self._world_cache = (None, None)
+        self._screen_cache = (None, None)
+        # Hull + bounds lokal (key: geometry version) dan bounds world/screen
+        # (key: versi geometry + matrix) sehingga culling/picking O(1) per shape
+        self._local_cache = (None, None)
+        self._world_bounds_cache = (None, None)
+        self._screen_bounds_cache = (None, None)
+        # List integer vertex untuk pygame (key: versi geometry + matrix + view)
+        self._point_list_cache = (None, None)
+        # Area, centroid, keliling dan bounds lokal (key: geometry version)
+        self._metrics_cache = (None, None)
+        # PolylineLOD (key: geometry version), level terpilih (key: versi geometry
+        # + matrix + view) dan vertex screen level tersebut (key: + level)
+        self._lod_cache = (None, None)
+        self._lod_level_cache = (None, None)
+        self._lod_vertices_cache = (None, None)
+        # Index buffer triangulasi + luas tiap segitiga (key: geometry version)
+        self._triangle_cache = (None, None)
         self.color = color
         self.fill = fill
         self.transform_matrix = TransformationMatrix()
-        self.center = self._calculate_center()
     
-    def _calculate_center(self) -> Tuple[float, float]:
-        """Hitung center point dari shape"""
-        if len(self.original_points) == 0:
-            return (0, 0)
-        
-        sum_x = sum(p.x for p in self.original_points)
-        sum_y = sum(p.y for p in self.original_points)
-        count = len(self.original_points)
-        
-        return (sum_x / count, sum_y / count)
+    @property
+    def vertices(self) -> np.ndarray:
+        """Array (N, 2) berisi original points"""
+        return self._vertices
+    
+    @property
+    def geometry_version(self) -> int:
+        """Versi geometry, bertambah setiap kali original points berubah"""
+        return self._geometry_version
+    
+    def set_points(self, points: List[Tuple[float, float]]):
+        """Ganti original points (geometry) dari shape"""
+        self._vertices = np.array(points, dtype=self._vertices.dtype).reshape(-1, 2)
+        self._geometry_version += 1
+
+    @property
+    def transformed_vertices(self) -> np.ndarray:
+        """Array (N, 2) berisi points setelah transformasi (lazy, di-cache)"""
+        key = (self._geometry_version, self.transform_matrix.version)
+        cached_key, cached = self._world_cache
+        if cached_key != key:
+            cached = self.transform_matrix.apply_to_array(self._vertices)
+            self._world_cache = (key, cached)
+        return cached
+    
+    def get_screen_vertices(self, view_matrix: TransformationMatrix) -> np.ndarray:
+        """
+        Vertex setelah transformasi shape lalu view matrix (misal camera)
+        Di-cache terpisah dari world-space berdasarkan versi ketiganya
+        """
+        key = (self._geometry_version, self.transform_matrix.version, view_matrix.version)
+        cached_key, cached = self._screen_cache
+        if cached_key != key:
+            # Komposisi skalar; kernel mengikuti jenis matrix gabungan
+            combined = view_matrix.copy().compose(self.transform_matrix)
+            cached = combined.apply_to_array(self._vertices)
+            self._screen_cache = (key, cached)
+        return cached
+    
+    def _local_geometry(self):
+        """(hull, local bounds) dari original points, dihitung sekali per geometry"""
+        cached_key, cached = self._local_cache
+        if cached_key != self._geometry_version:
+            cached = (convex_hull(self._vertices), self.metrics.bounds)
+            self._local_cache = (self._geometry_version, cached)
+        return cached
+    
+    @property
+    def hull(self) -> np.ndarray:
+        """Convex hull (H, 2) dari original points"""
+        return self._local_geometry()[0]
+    
+    @property
+    def local_bounds(self) -> Bounds:
+        """Bounding box (min_x, min_y, max_x, max_y) dari original points"""
+        return self._local_geometry()[1]
+    
+    @property
+    def world_bounds(self) -> Bounds:
+        """
+        Bounding box setelah transformasi shape
+        Dihitung dari hull (bukan semua vertex): bounds affine dari polygon
+        sama dengan bounds dari hull-nya. Di-cache per versi matrix
+        """
+        key = (self._geometry_version, self.transform_matrix.version)
+        cached_key, cached = self._world_bounds_cache
+        if cached_key != key:
+            cached = bounds_of(self.transform_matrix.apply_to_array(self.hull))
+            self._world_bounds_cache = (key, cached)
+        return cached
+    
+    def get_screen_bounds(self, view_matrix: TransformationMatrix) -> Bounds:
+        """Bounding box setelah transformasi shape lalu view matrix"""
+        key = (self._geometry_version, self.transform_matrix.version, view_matrix.version)
+        cached_key, cached = self._screen_bounds_cache
+        if cached_key != key:
+            combined = view_matrix.copy().compose(self.transform_matrix)
+            cached = bounds_of(combined.apply_to_array(self.hull))
+            self._screen_bounds_cache = (key, cached)
+        return cached
+    
+    def is_visible(self, surface: pygame.Surface, view_matrix: TransformationMatrix = None,
+                   margin: float = 0) -> bool:
+        """
+        Cek apakah bounds shape beririsan dengan area surface
+        Args:
+            surface: Surface tujuan drawing
+            view_matrix: Camera matrix (None: world bounds dipakai langsung)
+            margin: Tambahan pixel di sekeliling bounds (tebal garis, center dot)
+        """
+        bounds = self.world_bounds if view_matrix is None else self.get_screen_bounds(view_matrix)
+        width, height = surface.get_size()
+        return bounds_intersect(expand_bounds(bounds, margin), (0, 0, width, height))
+    
+    def _screen_vertices_and_bounds(self, surface: pygame.Surface,
+                                    view_matrix: TransformationMatrix = None):
+        """
+        Vertex screen-space, rectangle clip (canvas + margin) dan flag apakah
+        shape perlu di-clip. Shape yang masih di dalam guard band tidak di-clip:
+        pygame sudah memotong bagian kecil di luar surface dengan murah
+        """
+        width, height = surface.get_size()
+        clip_bounds = expand_bounds((0, 0, width, height), _CULL_MARGIN)
+        guard_bounds = expand_bounds((0, 0, width, height), _GUARD_BAND * max(width, height))
+        bounds = self.world_bounds if view_matrix is None else self.get_screen_bounds(view_matrix)
+        vertices, _ = self._render_vertices(view_matrix)
+        return vertices, clip_bounds, not bounds_inside(bounds, guard_bounds)
+    
+    @property
+    def lod(self) -> PolylineLOD:
+        """Level simplifikasi Douglas-Peucker dari original points (di-cache)"""
+        cached_key, cached = self._lod_cache
+        if cached_key != self._geometry_version:
+            cached = PolylineLOD(self._vertices, closed=len(self._vertices) >= 3)
+            self._lod_cache = (self._geometry_version, cached)
+        return cached
+    
+    def get_lod_level(self, view_matrix: TransformationMatrix = None):
+        """
+        Level LOD untuk skala layar saat ini (zoom camera x scale shape)
+        Returns:
+            Index level PolylineLOD, atau None untuk vertex asli
+        """
+        if len(self._vertices) < _LOD_MIN_VERTICES:
+            return None
+        key = (self._geometry_version, self.transform_matrix.version,
+               None if view_matrix is None else view_matrix.version)
+        cached_key, cached = self._lod_level_cache
+        if cached_key != key:
+            scale = _max_scale(self.transform_matrix, view_matrix)
+            cached = self.lod.level_for(_LOD_PIXEL_TOLERANCE / scale) if scale > 0 else None
+            self._lod_level_cache = (key, cached)
+        return cached
+    
+    def _render_vertices(self, view_matrix: TransformationMatrix = None):
+        """
+        Vertex screen-space yang digambar: vertex asli untuk shape kecil,
+        atau level LOD yang detailnya sesuai skala layar
+        Returns:
+            Tuple (vertices, level)
+        """
+        level = self.get_lod_level(view_matrix)
+        if level is None:
+            vertices = self.transformed_vertices if view_matrix is None \
+                else self.get_screen_vertices(view_matrix)
+            return vertices, None
+        key = (self._geometry_version, self.transform_matrix.version,
+               None if view_matrix is None else view_matrix.version, level)
+        cached_key, cached = self._lod_vertices_cache
+        if cached_key != key:
+            matrix = self.transform_matrix if view_matrix is None \
+                else view_matrix.copy().compose(self.transform_matrix)
+            cached = matrix.apply_to_array(self.lod.vertices(level))
+            self._lod_vertices_cache = (key, cached)
+        return cached, level
+    
+    def _screen_point_list(self, view_matrix: TransformationMatrix = None) -> List[List[int]]:
+        """
+        Vertex screen-space sebagai list integer untuk pygame (di-cache per versi)
+        List yang dikembalikan dipakai bersama, jangan diubah
+        """
+        vertices, level = self._render_vertices(view_matrix)
+        key = (self._geometry_version, self.transform_matrix.version,
+               None if view_matrix is None else view_matrix.version, level)
+        cached_key, cached = self._point_list_cache
+        if cached_key != key:
+            cached = pixel_coordinates(vertices).tolist()
+            self._point_list_cache = (key, cached)
+        return cached
+    
+    def get_clipped_points(self, surface: pygame.Surface,
+                           view_matrix: TransformationMatrix = None) -> List[Tuple[int, int]]:
+        """
+        Polygon screen-space yang sudah di-clip ke area surface (plus margin)
+        Saat zoom besar pygame tidak perlu menelusuri vertex yang jauh di luar canvas
+        Returns:
+            List of tuples integer untuk pygame.draw.polygon
+        """
+        vertices, clip_bounds, needs_clip = self._screen_vertices_and_bounds(surface, view_matrix)
+        if not needs_clip:
+            return list(map(tuple, self._screen_point_list(view_matrix)))
+        return list(map(tuple, pixel_coordinates(clip_polygon(vertices, clip_bounds)).tolist()))
+    
+    def get_clipped_edges(self, surface: pygame.Surface, view_matrix: TransformationMatrix = None,
+                          closed=True) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """
+        Edge outline screen-space yang sudah di-clip ke area surface (plus margin)
+        Args:
+            surface: Surface tujuan drawing
+            view_matrix: Camera matrix setelah transformasi shape
+            closed: True jika edge terakhir kembali ke vertex pertama
+        Returns:
+            List of (start, end) dengan koordinat integer untuk pygame.draw.line
+        """
+        vertices, clip_bounds, needs_clip = self._screen_vertices_and_bounds(surface, view_matrix)
+        if len(vertices) < 2:
+            return []
+        starts = vertices if closed else vertices[:-1]
+        ends = np.roll(vertices, -1, axis=0) if closed else vertices[1:]
+        if needs_clip:
+            starts, ends, visible = clip_segments(starts, ends, clip_bounds)
+            starts, ends = starts[visible], ends[visible]
+        return list(zip(map(tuple, pixel_coordinates(starts).tolist()),
+                        map(tuple, pixel_coordinates(ends).tolist())))
+    
+    @property
+    def original_points(self) -> PointList:
+        """
+        Original points sebagai list Point2D (untuk kompatibilitas)
+        Perubahan lewat list ini (points[i] = p, append, del) mengganti geometry
+        """
+        return PointList(lambda: self._vertices, self.set_points)
+    
+    @original_points.setter
+    def original_points(self, points):
+        self.set_points([_point_tuple(p) for p in points])
+    
+    @property
+    def transformed_points(self) -> PointList:
+        """
+        Transformed points sebagai list Point2D (untuk kompatibilitas)
+        Perubahan lewat list ini sama dengan meng-assign transformed_points
+        """
+        return PointList(lambda: self.transformed_vertices, self._set_transformed_points)
+    
+    @transformed_points.setter
+    def transformed_points(self, points):
+        self._set_transformed_points(points)
+    
+    def _set_transformed_points(self, points):
+        # Nilai manual berlaku sampai geometry atau matrix berubah
+        vertices = np.array([_point_tuple(p) for p in points],
+                            dtype=self._vertices.dtype).reshape(-1, 2)
+        key = (self._geometry_version, self.transform_matrix.version)
+        self._world_cache = (key, vertices)
+    
+    @property
+    def metrics(self) -> ShapeMetrics:
+        """Signed area, centroid, keliling dan bounds dari original points (di-cache)"""
+        cached_key, cached = self._metrics_cache
+        if cached_key != self._geometry_version:
+            cached = polygon_metrics(self._vertices)
+            self._metrics_cache = (self._geometry_version, cached)
+        return cached
+    
+    @property
+    def area(self) -> float:
+        """Signed area dari original points"""
+        return self.metrics.area
+    
+    @property
+    def perimeter(self) -> float:
+        """Keliling dari original points"""
+        return self.metrics.perimeter
+    
+    @property
+    def center(self) -> Tuple[float, float]:
+        """
+        Centroid berbobot area dari original points (read-only, dihitung dari
+        geometry). Untuk shape tanpa area (Line) sama dengan rata-rata vertex
+        """
+        return self.metrics.centroid
     
     def get_center(self) -> Tuple[float, float]:
         """Get center point"""
-        return self.center
+        return self.metrics.centroid
+    
+    def _triangulation(self):
+        """(index buffer, luas segitiga) dari original points, dihitung sekali per geometry"""
+        cached_key, cached = self._triangle_cache
+        if cached_key != self._geometry_version:
+            triangles = triangulate(self._vertices)
+            triangles.setflags(write=False)
+            cached = (triangles, triangle_areas(self._vertices, triangles))
+            self._triangle_cache = (self._geometry_version, cached)
+        return cached
+    
+    @property
+    def triangles(self) -> np.ndarray:
+        """Index buffer (T, 3) hasil ear clipping (kosong untuk shape tanpa area)"""
+        return self._triangulation()[0]
+    
+    @property
+    def triangle_areas(self) -> np.ndarray:
+        """Luas tiap segitiga (T,) dalam ruang lokal"""
+        return self._triangulation()[1]
+    
+    def contains_point(self, x: float, y: float, tolerance: float = 0.0) -> bool:
+        """
+        Cek apakah titik world-space berada di dalam shape
+        Bounds di-cek dulu, lalu segitiga (dengan vertex world yang sudah di-cache).
+        Shape dengan vertex sangat banyak memakai crossing number (even-odd)
+        supaya klik pertama tidak menunggu triangulasi
+        Args:
+            x, y: Titik dalam world coordinates
+            tolerance: Jarak maksimum ke outline yang masih dianggap kena
+                       (satu-satunya cara mengenai Line)
+        """
+        if not bounds_contain_point(expand_bounds(self.world_bounds, tolerance), x, y):
+            return False
+        vertices = self.transformed_vertices
+        if len(vertices) >= _PICK_CROSSING_MIN_VERTICES:
+            if points_in_polygon(vertices, ((x, y),))[0]:
+                return True
+        else:
+            triangles = self.triangles
+            if len(triangles) and points_in_triangles(vertices, triangles, ((x, y),))[0]:
+                return True
+        return tolerance > 0 and distance_to_edges(vertices, x, y, len(vertices) >= 3) <= tolerance
+    
+    def rasterize(self, width: int, height: int, view_matrix: TransformationMatrix = None,
+                  out: np.ndarray = None) -> np.ndarray:
+        """
+        Rasterisasi area shape ke mask bool (software, tanpa pygame)
+        Args:
+            width, height: Ukuran mask dalam pixel
+            view_matrix: Camera matrix setelah transformasi shape
+            out: Mask (height, width) yang ditambahkan (misal untuk banyak shape)
+        Returns:
+            Mask bool (height, width)
+        """
+        vertices = self.transformed_vertices if view_matrix is None \
+            else self.get_screen_vertices(view_matrix)
+        triangles, areas = self._triangulation()
+        # Segitiga degenerate (luas nol) tidak menutup pixel apa pun
+        return rasterize_triangles(vertices, triangles[areas > 0], width, height, out)
     
     def apply_transform(self, matrix: TransformationMatrix):
-        """Terapkan transformasi matriks ke shape"""
+        """
+        Terapkan transformasi matriks ke shape
+        Vertex baru dihitung saat pertama kali dibutuhkan (lazy)
+        """
         self.transform_matrix = matrix
-        self.transformed_points = [
-            p.transform(matrix) for p in self.original_points
-        ]
     
     def reset_transform(self):
         """Reset transformasi"""
         self.transform_matrix.reset()
-        self.transformed_points = self.original_points.copy()
     
-    def get_points(self, transformed=True) -> List[Tuple[int, int]]:
+    def get_points(self, transformed=True, view_matrix: TransformationMatrix = None) -> List[Tuple[int, int]]:
         """
         Get points sebagai list of tuples untuk pygame
         Args:
             transformed: True untuk transformed points, False untuk original
+            view_matrix: Matrix tambahan (misal camera) setelah transformasi shape
         Returns:
             List of tuples dengan koordinat integer untuk pygame
         """
-        points = self.transformed_points if transformed else self.original_points
-        return [(int(p.x), int(p.y)) for p in points]
+        if not transformed:
+            vertices = self._vertices
+        elif view_matrix is not None:
+            vertices = self.get_screen_vertices(view_matrix)
+        else:
+            vertices = self.transformed_vertices
+        return list(map(tuple, pixel_coordinates(vertices).tolist()))
     
-    def draw(self, surface: pygame.Surface, draw_center=False, zoom_factor=1.0):
+    def _draw_center(self, queue: RenderQueue, zoom_factor=1.0,
+                     view_matrix: TransformationMatrix = None):
+        """Draw center point (ikut ditransformasi) sebagai titik merah"""
+        center_x, center_y = self.transform_matrix.apply_to_point(
+            self.center[0], self.center[1]
+        )
+        if view_matrix is not None:
+            center_x, center_y = view_matrix.apply_to_point(center_x, center_y)
+        # Scale center dot radius with gentler zoom curve
+        center_radius = int(max(3, min(8, 5 * zoom_factor)))
+        queue.add_circle((int(center_x), int(center_y)), center_radius, (255, 0, 0))
+    
+    def _submit_outline(self, queue: RenderQueue, surface: pygame.Surface,
+                        view_matrix: TransformationMatrix, color, width, closed=True):
+        """Outline sebagai satu polyline, atau per edge yang sudah di-clip jika keluar surface"""
+        _, _, needs_clip = self._screen_vertices_and_bounds(surface, view_matrix)
+        if not needs_clip:
+            queue.add_polyline(self._screen_point_list(view_matrix), color, width, closed)
+        else:
+            # Edge hasil clip yang masih bersambung digabung lagi saat flush
+            queue.add_segments(self.get_clipped_edges(surface, view_matrix, closed), color, width)
+    
+    def submit_outline(self, queue: RenderQueue, surface: pygame.Surface,
+                       view_matrix: TransformationMatrix = None, color=(255, 0, 0), width=2):
         """
-        Draw shape ke pygame surface
+        Masukkan outline shape (misal selection highlight) ke render queue
         Args:
-            surface: Pygame surface untuk drawing
+            queue: RenderQueue frame ini
+            surface: Surface tujuan (untuk clipping)
+            view_matrix: Camera matrix setelah transformasi shape
+            color: Warna outline
+            width: Tebal outline
+        """
+        self._submit_outline(queue, surface, view_matrix, color, width)
+    
+    def submit(self, queue: RenderQueue, surface: pygame.Surface, draw_center=False,
+               zoom_factor=1.0, view_matrix: TransformationMatrix = None):
+        """
+        Masukkan primitive shape ke render queue (digambar saat queue di-flush)
+        Args:
+            queue: RenderQueue frame ini
+            surface: Surface tujuan (untuk culling dan clipping)
             draw_center: True untuk draw center point
             zoom_factor: Camera zoom factor for scaling the center dot
+            view_matrix: Camera matrix yang diterapkan setelah transformasi shape
         """
-        points = self.get_points(transformed=True)
+        # Shape di luar layar di-skip tanpa mentransformasi vertex-nya
+        if not self.is_visible(surface, view_matrix, margin=_CULL_MARGIN):
+            return
         
-        if len(points) < 2:
+        if len(self._vertices) < 2:
             return
         
-        # Draw filled polygon atau outline
-        if self.fill and len(points) >= 3:
-            pygame.draw.polygon(surface, self.color, points)
+        # Filled polygon atau outline, keduanya sudah di-clip ke surface
+        # (shape dengan banyak vertex memakai level LOD sesuai skala layar)
+        if self.fill and len(self._vertices) >= 3:
+            vertices, clip_bounds, needs_clip = self._screen_vertices_and_bounds(surface, view_matrix)
+            if needs_clip:
+                points = pixel_coordinates(clip_polygon(vertices, clip_bounds)).tolist()
+            else:
+                points = self._screen_point_list(view_matrix)
+            queue.add_polygon(points, self.color)
         else:
-            # Draw lines between points
-            for i in range(len(points)):
-                start = points[i]
-                end = points[(i + 1) % len(points)]
-                pygame.draw.line(surface, self.color, start, end, 2)
+            self._submit_outline(queue, surface, view_matrix, self.color, 2)
         
         # Draw center point jika diminta
         if draw_center:
-            center_x, center_y = int(self.center[0]), int(self.center[1])
-            # Transform center point juga
-            if self.transform_matrix:
-                center_x, center_y = self.transform_matrix.apply_to_point(
-                    self.center[0], self.center[1]
-                )
-                center_x, center_y = int(center_x), int(center_y)
-            # Scale center dot radius with gentler zoom curve
-            center_radius = int(max(3, min(8, 5 * zoom_factor)))
-            pygame.draw.circle(surface, (255, 0, 0), (center_x, center_y), center_radius)
+            self._draw_center(queue, zoom_factor, view_matrix)
+    
+    def draw(self, surface: pygame.Surface, draw_center=False, zoom_factor=1.0,
+             view_matrix: TransformationMatrix = None):
+        """
+        Draw shape ke pygame surface
+        Args:
+            surface: Pygame surface untuk drawing
+            draw_center: True untuk draw center point
+            zoom_factor: Camera zoom factor for scaling the center dot
+            view_matrix: Camera matrix yang diterapkan setelah transformasi shape
+        """
+        queue = RenderQueue()
+        self.submit(queue, surface, draw_center, zoom_factor, view_matrix)
+        queue.flush(surface)
 
 
 class Rectangle(Shape2D):
@@ -206,27 +674,23 @@ class Line(Shape2D):
         super().__init__(points, color, fill=False)
         self.thickness = thickness
     
-    def draw(self, surface: pygame.Surface, draw_center=False, zoom_factor=1.0):
-        """Override draw untuk line khusus
+    def submit(self, queue: RenderQueue, surface: pygame.Surface, draw_center=False,
+               zoom_factor=1.0, view_matrix: TransformationMatrix = None):
+        """Override submit untuk line khusus
         Args:
-            surface: Pygame surface untuk drawing
+            queue: RenderQueue frame ini
+            surface: Surface tujuan (untuk culling dan clipping)
             draw_center: True untuk draw center point
             zoom_factor: Camera zoom factor for scaling the center dot
+            view_matrix: Camera matrix yang diterapkan setelah transformasi shape
         """
-        points = self.get_points(transformed=True)
-        if len(points) >= 2:
-            pygame.draw.line(surface, self.color, points[0], points[1], self.thickness)
+        if not self.is_visible(surface, view_matrix, margin=max(_CULL_MARGIN, self.thickness)):
+            return
+        
+        self._submit_outline(queue, surface, view_matrix, self.color, self.thickness, closed=False)
         
         if draw_center:
-            center_x, center_y = int(self.center[0]), int(self.center[1])
-            if self.transform_matrix:
-                center_x, center_y = self.transform_matrix.apply_to_point(
-                    self.center[0], self.center[1]
-                )
-                center_x, center_y = int(center_x), int(center_y)
-            # Scale center dot radius with gentler zoom curve
-            center_radius = int(max(3, min(8, 5 * zoom_factor)))
-            pygame.draw.circle(surface, (255, 0, 0), (center_x, center_y), center_radius)
+            self._draw_center(queue, zoom_factor, view_matrix)
 
 
 class Polygon(Shape2D):
@@ -243,6 +707,42 @@ class Polygon(Shape2D):
         super().__init__(points, color, fill)
 
 
+def _max_scale(matrix: TransformationMatrix, view_matrix: TransformationMatrix = None) -> float:
+    """Faktor skala terbesar (singular value) dari view x matrix, dalam pixel per unit"""
+    a, b, _, d, e, _ = matrix.coefficients
+    if view_matrix is not None:
+        va, vb, _, vd, ve, _ = view_matrix.coefficients
+        a, b, d, e = va * a + vb * d, va * b + vb * e, vd * a + ve * d, vd * b + ve * e
+    squares = a * a + b * b + d * d + e * e
+    determinant = a * e - b * d
+    return math.sqrt((squares + math.sqrt(max(squares * squares - 4 * determinant * determinant, 0.0))) / 2)
+
+
+def compute_metrics(shapes: List[Shape2D]):
+    """
+    Metrik untuk banyak shape sekaligus (misal seluruh scene)
+    Shape yang cache metrics-nya masih valid tidak dihitung ulang; sisanya
+    dihitung dengan satu batch_polygon_metrics lalu disimpan ke cache shape
+    Args:
+        shapes: List Shape2D
+    Returns:
+        Tuple (areas (M,), centroids (M, 2), perimeters (M,), bounds (M, 4))
+    """
+    stale = [shape for shape in shapes if shape._metrics_cache[0] != shape._geometry_version]
+    if stale:
+        areas, centroids, perimeters, bounds = batch_polygon_metrics(
+            [shape._vertices for shape in stale])
+        for shape, area, centroid, perimeter, box in zip(
+                stale, areas.tolist(), centroids.tolist(), perimeters.tolist(), bounds.tolist()):
+            shape._metrics_cache = (shape._geometry_version,
+                                    ShapeMetrics(area, tuple(centroid), perimeter, tuple(box)))
+    metrics = [shape._metrics_cache[1] for shape in shapes]
+    return (np.array([m.area for m in metrics]),
+            np.array([m.centroid for m in metrics]).reshape(-1, 2),
+            np.array([m.perimeter for m in metrics]),
+            np.array([m.bounds for m in metrics]).reshape(-1, 4))
+
+
 class Grid:
     """Class untuk menggambar grid di background"""
     
@@ -267,15 +767,22 @@ class Grid:
             surface: Pygame surface
             offset_x, offset_y: Offset untuk scrolling
         """
-        # Vertical lines
         start_x = (-offset_x % self.spacing) - self.spacing
-        for x in range(int(start_x), self.width + self.spacing, self.spacing):
-            pygame.draw.line(surface, self.color, (x, 0), (x, self.height), 1)
-        
-        # Horizontal lines
+        xs = list(range(int(start_x), self.width + self.spacing, self.spacing))
         start_y = (-offset_y % self.spacing) - self.spacing
-        for y in range(int(start_y), self.height + self.spacing, self.spacing):
-            pygame.draw.line(surface, self.color, (0, y), (self.width, y), 1)
+        ys = list(range(int(start_y), self.height + self.spacing, self.spacing))
+        surface_width, surface_height = surface.get_size()
+        queue = RenderQueue()
+        if self.width >= surface_width and self.height >= surface_height:
+            # Vertical dan horizontal lines sebagai satu polyline; penghubung
+            # antar garis berada di luar grid dan juga di luar surface
+            queue.add_polyline(grid_polyline(xs, ys, (-1, self.width + 1), (-1, self.height + 1)),
+                               self.color, 1)
+        else:
+            # Surface lebih besar dari grid: penghubung akan terlihat, gambar per garis
+            queue.add_segments([((x, 0), (x, self.height)) for x in xs]
+                               + [((0, y), (self.width, y)) for y in ys], self.color, 1)
+        queue.flush(surface)
         
         # Draw axes (origin lines)
         origin_x = int(-offset_x)
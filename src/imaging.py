@@ -0,0 +1,373 @@
+"""
+Warping image raster dengan TransformationMatrix
+Setiap pixel output dipetakan balik (inverse mapping) ke koordinat source
+lalu di-sample nearest atau bilinear. Output diproses per tile sehingga
+array sementara (koordinat, index, bobot) tidak bergantung ukuran image
+"""
+
+import itertools
+import math
+import os
+import numpy as np
+import pygame
+from typing import List, Optional, Tuple
+
+from .geometry import bounds_intersect
+from .graphics import Shape2D
+from .matrix import TransformationMatrix
+from .render import RenderQueue
+from .texture import (
+    TextureCache, build_mipmaps, get_texture_cache, mip_level_for, quantize_angle, quantize_zoom
+)
+
+NEAREST = 'nearest'
+BILINEAR = 'bilinear'
+
+_INTERPOLATIONS = (NEAREST, BILINEAR)
+
+# Toleransi shear relatif; matrix dengan shear lebih besar tidak bisa memakai texture
+_SHEAR_TOLERANCE = 1e-6
+# Texture (setelah rotasi) maksimal sekian kali luas surface tujuan; lebih besar
+# dari itu (zoom sangat besar) hanya area yang terlihat yang di-warp
+_MAX_TEXTURE_AREA = 4
+
+# Id unik per ImageShape untuk key TextureCache
+_texture_ids = itertools.count()
+
+
+def load_image(source) -> np.ndarray:
+    """
+    Baca image menjadi array uint8 (H, W, C)
+    Args:
+        source: Path file (dibaca dengan Pillow), pygame.Surface atau array
+                (H, W) / (H, W, C)
+    Returns:
+        Array C-contiguous; image grayscale menjadi (H, W, 1)
+    """
+    if isinstance(source, pygame.Surface):
+        mode = 'RGBA' if source.get_flags() & pygame.SRCALPHA else 'RGB'
+        width, height = source.get_size()
+        pixels = np.frombuffer(pygame.image.tobytes(source, mode), dtype=np.uint8)
+        return pixels.reshape(height, width, len(mode))
+    if isinstance(source, (str, os.PathLike)) or hasattr(source, 'read'):
+        from PIL import Image
+        with Image.open(source) as image:
+            if image.mode not in ('L', 'RGB', 'RGBA'):
+                image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+            source = np.asarray(image)
+    pixels = np.ascontiguousarray(source, dtype=np.uint8)
+    if pixels.ndim == 2:
+        pixels = pixels[:, :, np.newaxis]
+    if pixels.ndim != 3:
+        raise ValueError(f"Image harus berbentuk (H, W) atau (H, W, C), bukan {pixels.shape}")
+    return pixels
+
+
+def _rgba_surface(pixels: np.ndarray) -> pygame.Surface:
+    """
+    Surface SRCALPHA dari array RGBA (H, W, 4)
+    Dibuat dengan urutan byte BGRA (ARGB8888, format native SDL) karena blit
+    alpha dari surface RGBA sekitar 10x lebih lambat
+    """
+    height, width = pixels.shape[:2]
+    return pygame.image.frombytes(pixels[:, :, (2, 1, 0, 3)].tobytes(), (width, height), 'BGRA')
+
+
+def _sample_nearest(flat: np.ndarray, width: int, height: int, u: np.ndarray, v: np.ndarray,
+                    background: np.ndarray, out: np.ndarray):
+    """Sample pixel terdekat; koordinat di luar image mendapat background"""
+    columns = np.floor(u + 0.5).astype(np.intp)
+    rows = np.floor(v + 0.5).astype(np.intp)
+    outside = (columns < 0) | (columns >= width) | (rows < 0) | (rows >= height)
+    np.clip(columns, 0, width - 1, out=columns)
+    np.clip(rows, 0, height - 1, out=rows)
+    rows *= width
+    rows += columns
+    np.take(flat, rows, axis=0, out=out)
+    if outside.any():
+        out[outside] = background
+
+
+def _sample_bilinear(flat: np.ndarray, width: int, height: int, u: np.ndarray, v: np.ndarray,
+                     background: np.ndarray, out: np.ndarray):
+    """
+    Interpolasi bilinear dari empat pixel tetangga
+    Di dalam setengah pixel dari tepi image nilai tepi diulang; di luar itu background
+    """
+    outside = (u < -0.5) | (u > width - 0.5) | (v < -0.5) | (v > height - 0.5)
+    left = np.floor(u)
+    top = np.floor(v)
+    fx = (u - left).astype(np.float32)[..., np.newaxis]
+    fy = (v - top).astype(np.float32)[..., np.newaxis]
+    # Index tetangga kanan/bawah sebagai offset dari index kiri-atas (0 di tepi image)
+    x0 = np.clip(left, 0, width - 1).astype(np.intp)
+    dx = (left >= 0) & (left < width - 1)
+    y0 = np.clip(top, 0, height - 1).astype(np.intp)
+    dy = ((top >= 0) & (top < height - 1)) * width
+    base = y0 * width + x0
+    right = base + dx
+    # np.take jauh lebih cepat dari fancy indexing untuk gather baris pixel
+    p00 = np.take(flat, base, axis=0).astype(np.float32)
+    p01 = np.take(flat, right, axis=0).astype(np.float32)
+    upper = p00 + (p01 - p00) * fx
+    base += dy
+    right += dy
+    p10 = np.take(flat, base, axis=0).astype(np.float32)
+    p11 = np.take(flat, right, axis=0).astype(np.float32)
+    lower = p10 + (p11 - p10) * fx
+    upper += (lower - upper) * fy
+    upper += 0.5
+    out[...] = upper
+    if outside.any():
+        out[outside] = background
+
+
+def warp_image(image, matrix: TransformationMatrix, output_size: Optional[Tuple[int, int]] = None,
+               interpolation: str = BILINEAR, tile_size: int = 128, background=0,
+               out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Terapkan TransformationMatrix ke image raster (inverse mapping, per tile)
+    Koordinat image: x ke kanan, y ke bawah, pixel (col, row) menempati
+    [col, col+1] x [row, row+1]; matrix memetakan koordinat source ke output
+    Args:
+        image: Array (H, W) / (H, W, C) uint8, pygame.Surface atau path file
+        matrix: Transformasi source -> output
+        output_size: (width, height) output (default: ukuran source)
+        interpolation: 'nearest' atau 'bilinear'
+        tile_size: Sisi tile output yang diproses sekaligus
+        background: Nilai pixel output yang jatuh di luar source (skalar atau per channel)
+        out: Array (height, width, C) uint8 milik caller untuk hasil (opsional)
+    Returns:
+        Array uint8 (height, width, C)
+    """
+    if interpolation not in _INTERPOLATIONS:
+        raise ValueError(f"interpolation harus 'nearest' atau 'bilinear', bukan {interpolation!r}")
+    pixels = load_image(image)
+    height, width, channels = pixels.shape
+    out_width, out_height = output_size if output_size is not None else (width, height)
+    if out is None:
+        out = np.empty((out_height, out_width, channels), dtype=np.uint8)
+    elif out.shape != (out_height, out_width, channels) or out.dtype != np.uint8:
+        raise ValueError(f"out harus uint8 {(out_height, out_width, channels)}, bukan {out.dtype} {out.shape}")
+    fill = np.broadcast_to(np.asarray(background, dtype=np.uint8), (channels,))
+    if width == 0 or height == 0:
+        out[...] = fill
+        return out
+
+    # Pusat pixel output (x + 0.5) dipetakan balik ke index source (u - 0.5)
+    ia, ib, ic, id_, ie, if_ = matrix.inverse().coefficients
+    ic -= 0.5
+    if_ -= 0.5
+    flat = pixels.reshape(-1, channels)
+    sample = _sample_nearest if interpolation == NEAREST else _sample_bilinear
+    # Margin satu pixel: tile yang bounding box source-nya di luar image langsung diisi background
+    source_bounds = (-1.0, -1.0, width + 1.0, height + 1.0)
+    for top in range(0, out_height, tile_size):
+        bottom = min(top + tile_size, out_height)
+        ys = np.arange(top, bottom, dtype=np.float64) + 0.5
+        for left in range(0, out_width, tile_size):
+            right = min(left + tile_size, out_width)
+            tile = out[top:bottom, left:right]
+            corners_x = np.array([left, right, left, right], dtype=np.float64)
+            corners_y = np.array([top, top, bottom, bottom], dtype=np.float64)
+            corners_u = ia * corners_x + ib * corners_y + ic
+            corners_v = id_ * corners_x + ie * corners_y + if_
+            tile_bounds = (corners_u.min(), corners_v.min(), corners_u.max(), corners_v.max())
+            if not bounds_intersect(tile_bounds, source_bounds):
+                tile[...] = fill
+                continue
+            xs = np.arange(left, right, dtype=np.float64) + 0.5
+            # Affine: koordinat source linear terhadap x dan y, cukup outer sum
+            u = np.add.outer(ib * ys + ic, ia * xs)
+            v = np.add.outer(ie * ys + if_, id_ * xs)
+            sample(flat, width, height, u, v, fill, tile)
+    return out
+
+
+class ImageShape(Shape2D):
+    """
+    Image raster yang ditempatkan pada rectangle di canvas
+    Geometry-nya rectangle biasa (culling, picking, transform dan selection
+    sama seperti shape lain). Matrix layar tanpa shear digambar dari mipmap
+    yang di-scale/rotasi sekali per (zoom, angle) terkuantisasi dan disimpan
+    di TextureCache; selain itu area yang terlihat di-warp dengan warp_image
+    """
+
+    def __init__(self, x: float, y: float, image, width: float = None, height: float = None,
+                 interpolation: str = BILINEAR, color=(0, 0, 255),
+                 texture_cache: Optional[TextureCache] = None):
+        """
+        Args:
+            x, y: Posisi top-left corner
+            image: Path file, pygame.Surface atau array (lihat load_image)
+            width, height: Ukuran di world (default: ukuran image dalam pixel)
+            interpolation: 'nearest' atau 'bilinear'
+            color: Warna outline shape (pixels image tidak memakai warna ini)
+            texture_cache: TextureCache (default: cache global get_texture_cache())
+        """
+        pixels = load_image(image)
+        if pixels.shape[2] == 1:
+            pixels = np.repeat(pixels, 3, axis=2)
+        if pixels.shape[2] == 3:
+            # Alpha penuh; area di luar image transparan setelah warping
+            alpha = np.full(pixels.shape[:2] + (1,), 255, dtype=np.uint8)
+            pixels = np.concatenate((pixels, alpha), axis=2)
+        self.pixels = np.ascontiguousarray(pixels)
+        self.image_height, self.image_width = self.pixels.shape[:2]
+        width = float(self.image_width if width is None else width)
+        height = float(self.image_height if height is None else height)
+        super().__init__([(x, y), (x + width, y), (x + width, y + height), (x, y + height)],
+                         color, fill=True)
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.interpolation = interpolation
+        # Surface hasil warp (key: versi geometry + matrix + view, area di layar)
+        self._warp_cache = (None, None)
+        # Pyramid mipmap dan surface per level dibuat saat pertama dipakai
+        self._mipmaps = None
+        self._mip_surfaces = {}
+        self.texture_cache = texture_cache if texture_cache is not None else get_texture_cache()
+        self.use_textures = True
+        self._texture_id = next(_texture_ids)
+        # (key texture, posisi blit) per versi geometry + matrix + view + ukuran surface
+        # + interpolation
+        self._placement_cache = (None, None)
+
+    @property
+    def mipmaps(self) -> List[np.ndarray]:
+        """Pyramid mipmap pixels (level 0 = resolusi penuh), dibuat sekali"""
+        if self._mipmaps is None:
+            self._mipmaps = build_mipmaps(self.pixels)
+        return self._mipmaps
+
+    def _mip_surface(self, level: int) -> pygame.Surface:
+        """Surface RGBA untuk satu level mipmap"""
+        surface = self._mip_surfaces.get(level)
+        if surface is None:
+            surface = self._mip_surfaces[level] = _rgba_surface(self.mipmaps[level])
+        return surface
+
+    def _texture_placement(self, surface: pygame.Surface, view_matrix: TransformationMatrix = None):
+        """
+        Key texture terkuantisasi dan posisi blit untuk matrix layar saat ini
+        Returns:
+            ((id, interpolation, zoom_x, zoom_y, angle), (center_x, center_y)),
+            atau None jika matrix
+            mengandung shear/refleksi atau texture terlalu besar
+        """
+        a, b, c, d, e, f = self.image_matrix(view_matrix).coefficients
+        scale_x = math.hypot(a, d)
+        scale_y = math.hypot(b, e)
+        if a * e - b * d <= 0 or abs(a * b + d * e) > _SHEAR_TOLERANCE * scale_x * scale_y:
+            return None
+        zoom_x, zoom_y = quantize_zoom(scale_x), quantize_zoom(scale_y)
+        angle = quantize_angle(math.degrees(math.atan2(d, a)))
+        width = self.image_width * zoom_x
+        height = self.image_height * zoom_y
+        radians = math.radians(angle)
+        cos_a, sin_a = abs(math.cos(radians)), abs(math.sin(radians))
+        box_width = width * cos_a + height * sin_a
+        box_height = width * sin_a + height * cos_a
+        surface_width, surface_height = surface.get_size()
+        if box_width * box_height > _MAX_TEXTURE_AREA * surface_width * surface_height \
+                or box_width * box_height * 4 > self.texture_cache.max_bytes:
+            return None
+        # Center image tetap di posisi sebenarnya; hanya posisi yang berubah saat pan
+        center_x = a * self.image_width / 2 + b * self.image_height / 2 + c
+        center_y = d * self.image_width / 2 + e * self.image_height / 2 + f
+        return (self._texture_id, self.interpolation, zoom_x, zoom_y, angle), (center_x, center_y)
+
+    def _build_texture(self, interpolation: str, zoom_x: float, zoom_y: float,
+                       angle: float) -> pygame.Surface:
+        """
+        Scale level mipmap yang sesuai lalu rotasi (dipanggil saat cache miss)
+        Nearest memakai pixel asli (level 0) dengan scale/rotate tanpa filter,
+        sama seperti warp_image nearest
+        """
+        size = (max(1, round(self.image_width * zoom_x)), max(1, round(self.image_height * zoom_y)))
+        if interpolation == NEAREST:
+            texture = self._mip_surface(0)
+            if texture.get_size() != size:
+                texture = pygame.transform.scale(texture, size)
+            # Sumbu y layar ke bawah: rotasi matrix positif = searah jarum jam
+            return pygame.transform.rotate(texture, -angle) if angle else texture
+        level = mip_level_for(max(zoom_x, zoom_y), len(self.mipmaps))
+        texture = self._mip_surface(level)
+        if texture.get_size() != size:
+            texture = pygame.transform.smoothscale(texture, size)
+        if angle:
+            texture = pygame.transform.rotozoom(texture, -angle, 1.0)
+        return texture
+
+    def texture_surface(self, surface: pygame.Surface, view_matrix: TransformationMatrix = None):
+        """
+        Image dari TextureCache untuk matrix layar saat ini
+        Returns:
+            (pygame.Surface SRCALPHA, (left, top)), atau None jika texture
+            tidak bisa dipakai (gunakan render_surface)
+        """
+        key = (self._geometry_version, self.transform_matrix.version,
+               None if view_matrix is None else view_matrix.version, surface.get_size(),
+               self.interpolation)
+        cached_key, placement = self._placement_cache
+        if cached_key != key:
+            placement = self._texture_placement(surface, view_matrix)
+            self._placement_cache = (key, placement)
+        if placement is None:
+            return None
+        texture_key, (center_x, center_y) = placement
+        texture = self.texture_cache.get_or_create(texture_key,
+                                                   lambda: self._build_texture(*texture_key[1:]))
+        width, height = texture.get_size()
+        return texture, (int(math.floor(center_x - width / 2 + 0.5)),
+                         int(math.floor(center_y - height / 2 + 0.5)))
+
+    def image_matrix(self, view_matrix: TransformationMatrix = None) -> TransformationMatrix:
+        """Matrix pixel image -> world (atau layar jika view_matrix diberikan)"""
+        matrix = TransformationMatrix() if view_matrix is None else view_matrix.copy()
+        matrix.compose(self.transform_matrix)
+        (x0, y0), (x1, _), (_, y1) = self._vertices[:3].tolist()
+        return matrix.translate(x0, y0).scale((x1 - x0) / self.image_width,
+                                              (y1 - y0) / self.image_height)
+
+    def render_surface(self, surface: pygame.Surface, view_matrix: TransformationMatrix = None):
+        """
+        Image yang sudah di-warp untuk area shape yang terlihat di surface
+        Returns:
+            (pygame.Surface SRCALPHA, (left, top)) atau None jika tidak terlihat
+        """
+        bounds = self.world_bounds if view_matrix is None else self.get_screen_bounds(view_matrix)
+        surface_width, surface_height = surface.get_size()
+        left = max(int(math.floor(bounds[0])), 0)
+        top = max(int(math.floor(bounds[1])), 0)
+        right = min(int(math.ceil(bounds[2])), surface_width)
+        bottom = min(int(math.ceil(bounds[3])), surface_height)
+        if right <= left or bottom <= top:
+            return None
+        key = (self._geometry_version, self.transform_matrix.version,
+               None if view_matrix is None else view_matrix.version,
+               left, top, right, bottom, self.interpolation)
+        cached_key, cached = self._warp_cache
+        if cached_key != key:
+            matrix = TransformationMatrix().translate(-left, -top).compose(self.image_matrix(view_matrix))
+            pixels = warp_image(self.pixels, matrix, (right - left, bottom - top),
+                                self.interpolation, background=0)
+            cached = (_rgba_surface(pixels), (left, top))
+            self._warp_cache = (key, cached)
+        return cached
+
+    def submit(self, queue: RenderQueue, surface: pygame.Surface, draw_center=False,
+               zoom_factor=1.0, view_matrix: TransformationMatrix = None):
+        """Override submit: blit texture (atau image hasil warp) pada urutannya di queue"""
+        bounds = self.world_bounds if view_matrix is None else self.get_screen_bounds(view_matrix)
+        if not bounds_intersect(bounds, (0, 0) + surface.get_size()):
+            return
+        rendered = self.texture_surface(surface, view_matrix) if self.use_textures else None
+        if rendered is None:
+            rendered = self.render_surface(surface, view_matrix)
+        if rendered is not None:
+            queue.add_blit(*rendered)
+        if draw_center:
+            self._draw_center(queue, zoom_factor, view_matrix)
@@ -0,0 +1,313 @@
+"""
+Geometry instancing untuk banyak shape identik
+Vertex data disimpan sekali (shared), tiap instance hanya menyimpan matrix dan warna
+"""
+
+import pygame
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple
+from .matrix import TransformationMatrix, get_precision_policy
+from .geometry import pixel_coordinates, polygon_metrics
+
+
+class SharedGeometry:
+    """
+    Vertex data immutable yang dipakai bersama oleh banyak instance
+    Koordinat disimpan dalam ruang lokal geometry (sebelum transformasi)
+    """
+
+    # Registry untuk geometry standar, supaya Circle/Rectangle identik
+    # benar-benar memakai array vertex yang sama
+    _registry: Dict[tuple, 'SharedGeometry'] = {}
+
+    def __init__(self, points: List[Tuple[float, float]], fill=True):
+        """
+        Args:
+            points: List of tuples [(x1,y1), (x2,y2), ...] dalam ruang lokal
+            fill: True untuk filled shape, False untuk outline only
+        """
+        vertices = np.array(points, dtype=get_precision_policy().dtype).reshape(-1, 2)
+        vertices.setflags(write=False)
+        self.vertices = vertices
+        self.fill = fill
+        # Centroid berbobot area, sama seperti Shape2D.get_center
+        self.center = polygon_metrics(vertices).centroid
+
+    def __len__(self):
+        return len(self.vertices)
+
+    @classmethod
+    def from_shape(cls, shape) -> 'SharedGeometry':
+        """Buat geometry dari original points sebuah Shape2D"""
+        return cls(shape.vertices, shape.fill)
+
+    @classmethod
+    def rectangle(cls, width: float, height: float, fill=True) -> 'SharedGeometry':
+        """Geometry rectangle dengan top-left corner di origin (di-cache)"""
+        key = ('rectangle', float(width), float(height), fill)
+        if key not in cls._registry:
+            cls._registry[key] = cls([
+                (0, 0), (width, 0), (width, height), (0, height)
+            ], fill)
+        return cls._registry[key]
+
+    @classmethod
+    def circle(cls, radius: float, segments=32, fill=True) -> 'SharedGeometry':
+        """Geometry circle dengan center di origin (di-cache)"""
+        key = ('circle', float(radius), int(segments), fill)
+        if key not in cls._registry:
+            angles = 2 * np.pi * np.arange(segments) / segments
+            points = np.column_stack((radius * np.cos(angles), radius * np.sin(angles)))
+            cls._registry[key] = cls(points, fill)
+        return cls._registry[key]
+
+    def __repr__(self):
+        return f"SharedGeometry(vertices={len(self.vertices)}, fill={self.fill})"
+
+
+class _InstanceGroup:
+    """Storage per geometry: matrix dan warna semua instance dalam array kontigu"""
+
+    def __init__(self, geometry: SharedGeometry, capacity: int = 16):
+        self.geometry = geometry
+        self.count = 0
+        # Matrix affine 2x3 per instance, dalam dtype geometry (float32 jika policy float32)
+        self.policy = get_precision_policy()
+        self.matrices = np.empty((capacity, 2, 3), dtype=geometry.vertices.dtype)
+        self.colors = np.empty((capacity, 3), dtype=np.uint8)
+
+    def append(self, matrix: np.ndarray, color) -> int:
+        """Tambah satu instance, return index-nya di dalam group"""
+        if self.count == len(self.matrices):
+            capacity = 2 * len(self.matrices)
+            self.matrices = np.resize(self.matrices, (capacity, 2, 3))
+            self.colors = np.resize(self.colors, (capacity, 3))
+        index = self.count
+        self.matrices[index] = matrix
+        self.colors[index] = color
+        self.count += 1
+        return index
+
+    def extend(self, matrices: np.ndarray, colors: np.ndarray) -> range:
+        """Tambah banyak instance sekaligus, return range index-nya"""
+        count = len(matrices)
+        if self.count + count > len(self.matrices):
+            capacity = max(2 * len(self.matrices), self.count + count)
+            self.matrices = np.resize(self.matrices, (capacity, 2, 3))
+            self.colors = np.resize(self.colors, (capacity, 3))
+        start = self.count
+        self.matrices[start:start + count] = matrices
+        self.colors[start:start + count] = colors
+        self.count += count
+        return range(start, start + count)
+
+    def transform(self, view_matrix: Optional[TransformationMatrix] = None,
+                  start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Transformasi vertex geometry untuk instance [start, stop) sekaligus
+        Returns:
+            Array (N, V, 2) berisi vertex hasil transformasi per instance
+        """
+        vertices = self.geometry.vertices
+        stack = self.matrices[start:self.count if stop is None else min(stop, self.count)]
+        if view_matrix is not None:
+            # Komposisi affine 2x3 dalam compose dtype, lalu kembali ke dtype geometry
+            compose_dtype = self.policy.compose_dtype
+            view = view_matrix.affine.astype(compose_dtype, copy=False)
+            stack = stack.astype(compose_dtype, copy=False)
+            linear = np.matmul(view[:, :2], stack[:, :, :2])
+            offset = stack[:, :, 2] @ view[:, :2].T + view[:, 2]
+            stack = np.concatenate((linear, offset[:, :, np.newaxis]), axis=2)
+            stack = stack.astype(vertices.dtype, copy=False)
+        return (np.matmul(vertices, stack[:, :, :2].transpose(0, 2, 1))
+                + stack[:, np.newaxis, :, 2])
+
+
+class InstancedShape:
+    """
+    Shape yang mereferensikan SharedGeometry plus matrix dan warna per instance
+    API-nya mengikuti Shape2D (apply_transform, get_points, draw, ...)
+    """
+
+    __slots__ = ('_group', '_index')
+
+    def __init__(self, group: _InstanceGroup, index: int):
+        self._group = group
+        self._index = index
+
+    @property
+    def geometry(self) -> SharedGeometry:
+        return self._group.geometry
+
+    @property
+    def fill(self) -> bool:
+        return self._group.geometry.fill
+
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        r, g, b = self._group.colors[self._index].tolist()
+        return (r, g, b)
+
+    @color.setter
+    def color(self, value):
+        self._group.colors[self._index] = value
+
+    @property
+    def transform_matrix(self) -> TransformationMatrix:
+        """TransformationMatrix (salinan) dari matrix instance ini"""
+        return TransformationMatrix().set_matrix(self._group.matrices[self._index])
+
+    def get_center(self) -> Tuple[float, float]:
+        """Get center point (ruang lokal geometry)"""
+        return self._group.geometry.center
+
+    def apply_transform(self, matrix: TransformationMatrix):
+        """Set matrix transformasi instance"""
+        self._group.matrices[self._index] = matrix.affine
+
+    def reset_transform(self):
+        """Reset transformasi ke identity"""
+        self._group.matrices[self._index] = np.eye(2, 3)
+
+    def get_points(self, transformed=True,
+                   view_matrix: Optional[TransformationMatrix] = None) -> List[Tuple[int, int]]:
+        """Get points sebagai list of tuples integer untuk pygame"""
+        vertices = self._group.geometry.vertices
+        if transformed:
+            matrix = self.transform_matrix
+            if view_matrix is not None:
+                matrix = view_matrix.copy().compose(matrix)
+            vertices = matrix.apply_to_array(vertices)
+        return [tuple(p) for p in pixel_coordinates(vertices).tolist()]
+
+    def draw(self, surface: pygame.Surface, draw_center=False, zoom_factor=1.0,
+             view_matrix: Optional[TransformationMatrix] = None):
+        """Draw instance ke pygame surface"""
+        points = self.get_points(view_matrix=view_matrix)
+        _draw_outline_or_fill(surface, self.color, points, self.fill)
+        if draw_center:
+            center_x, center_y = self.transform_matrix.apply_to_point(*self.get_center())
+            if view_matrix is not None:
+                center_x, center_y = view_matrix.apply_to_point(center_x, center_y)
+            center_radius = int(max(3, min(8, 5 * zoom_factor)))
+            pygame.draw.circle(surface, (255, 0, 0), (int(center_x), int(center_y)), center_radius)
+
+    def __repr__(self):
+        return f"InstancedShape({self._group.geometry!r}, index={self._index})"
+
+
+class InstanceBatch:
+    """
+    Kumpulan InstancedShape yang dikelompokkan per geometry
+    Transformasi dilakukan sebagai satu operasi batch per geometry, sehingga
+    memory sebanding dengan jumlah geometry unik + N x (matrix + warna)
+    """
+
+    def __init__(self):
+        self._groups: Dict[int, _InstanceGroup] = {}
+
+    def add(self, geometry: SharedGeometry, matrix: Optional[TransformationMatrix] = None,
+            color=(0, 0, 255)) -> InstancedShape:
+        """
+        Tambah instance baru
+        Args:
+            geometry: SharedGeometry yang direferensikan
+            matrix: TransformationMatrix instance (default: identity)
+            color: RGB color tuple
+        Returns:
+            InstancedShape handle untuk instance tersebut
+        """
+        group = self._group_for(geometry)
+        values = matrix.affine if matrix is not None else np.eye(2, 3)
+        return InstancedShape(group, group.append(values, color))
+
+    def add_many(self, geometry: SharedGeometry, matrices, colors=(0, 0, 255)) -> range:
+        """
+        Tambah banyak instance dari satu geometry tanpa loop Python
+        Args:
+            geometry: SharedGeometry yang direferensikan
+            matrices: Array (N, 2, 3) atau (N, 3, 3), misal dari build_matrix_stack
+            colors: Array (N, 3) atau satu RGB color tuple untuk semua instance
+        Returns:
+            range index instance di dalam group geometry
+        """
+        matrices = np.asarray(matrices)[:, :2, :]
+        colors = np.broadcast_to(np.asarray(colors, dtype=np.uint8), (len(matrices), 3))
+        return self._group_for(geometry).extend(matrices, colors)
+
+    def _group_for(self, geometry: SharedGeometry) -> _InstanceGroup:
+        group = self._groups.get(id(geometry))
+        if group is None:
+            group = self._groups[id(geometry)] = _InstanceGroup(geometry)
+        return group
+
+    def __len__(self):
+        return sum(group.count for group in self._groups.values())
+
+    def __iter__(self) -> Iterator[InstancedShape]:
+        for group in self._groups.values():
+            for index in range(group.count):
+                yield InstancedShape(group, index)
+
+    @property
+    def geometries(self) -> List[SharedGeometry]:
+        """List geometry unik di dalam batch"""
+        return [group.geometry for group in self._groups.values()]
+
+    def transformed_points(self, geometry: SharedGeometry,
+                           view_matrix: Optional[TransformationMatrix] = None) -> np.ndarray:
+        """
+        Vertex hasil transformasi untuk semua instance dari sebuah geometry
+        Returns:
+            Array (N, V, 2)
+        """
+        group = self._groups.get(id(geometry))
+        if group is None:
+            return np.empty((0, len(geometry), 2))
+        return group.transform(view_matrix)
+
+    def iter_chunks(self, view_matrix: Optional[TransformationMatrix] = None,
+                    chunk_size: int = 65536) -> Iterator[Tuple[SharedGeometry, np.ndarray, np.ndarray]]:
+        """
+        Transformasi per potongan instance supaya memory sebatas chunk_size
+        Yields:
+            Tuple (geometry, vertices (C, V, 2), colors (C, 3))
+        """
+        for group in self._groups.values():
+            for start in range(0, group.count, chunk_size):
+                stop = min(start + chunk_size, group.count)
+                yield group.geometry, group.transform(view_matrix, start, stop), group.colors[start:stop]
+
+    def draw(self, surface: pygame.Surface, view_matrix: Optional[TransformationMatrix] = None,
+             chunk_size: int = 65536):
+        """
+        Draw semua instance, satu batch transformasi per potongan instance per geometry
+        Args:
+            surface: Pygame surface untuk drawing
+            view_matrix: Matrix tambahan (misal camera) yang diterapkan setelah matrix instance
+            chunk_size: Jumlah instance maksimum per batch transformasi
+        """
+        width, height = surface.get_size()
+        for geometry, transformed, group_colors in self.iter_chunks(view_matrix, chunk_size):
+            # Culling: lewati instance yang bounding box-nya di luar surface
+            low = transformed.min(axis=1)
+            high = transformed.max(axis=1)
+            visible = ((high[:, 0] >= 0) & (low[:, 0] <= width)
+                       & (high[:, 1] >= 0) & (low[:, 1] <= height))
+            if not visible.any():
+                continue
+            points = pixel_coordinates(transformed[visible]).tolist()
+            colors = group_colors[visible].tolist()
+            fill = geometry.fill
+            for instance_points, color in zip(points, colors):
+                _draw_outline_or_fill(surface, color, instance_points, fill)
+
+
+def _draw_outline_or_fill(surface: pygame.Surface, color, points, fill: bool):
+    """Draw polygon filled atau outline (sama seperti Shape2D.draw)"""
+    if len(points) < 2:
+        return
+    if fill and len(points) >= 3:
+        pygame.draw.polygon(surface, color, points)
+    else:
+        pygame.draw.lines(surface, color, len(points) >= 3, points, 2)
@@ -3,26 +3,63 @@ Entry point aplikasi MatrixTransform2D
 Aplikasi Desain Grafis 2D dengan Transformasi Matriks (Translasi, Rotasi, Skala)
 """
 
+import argparse
+import json
+import os
 import pygame
 import sys
+import time
 from typing import List, Optional
 from .graphics import (
     Rectangle, Triangle, Circle, Line, Polygon, 
     Grid, Axis, Shape2D
 )
-from .ui import ControlPanel
-from .matrix import TransformationMatrix
+from .ui import ControlPanel, coalesce_motion_events
+from .matrix import TransformationMatrix, PrecisionPolicy, get_precision_policy, precision_scope
+from .render import RenderQueue, grid_polyline
+from .trace import InputRecorder, Replayer
+from .instancing import InstanceBatch
+from .scene import generate_scene
+from .profiling import AllocationProfiler, phase_scope
+from .export import export_svg, export_png
+from .imaging import ImageShape, load_image
+
+# Jarak klik (pixel layar) ke outline shape yang masih memilih shape tersebut
+_PICK_TOLERANCE = 5
+
+
+class LoopStats:
+    """Statistik main loop: waktu idle (menunggu input) vs aktif (render frame)"""
+    
+    def __init__(self):
+        self.idle_time = 0.0
+        self.active_time = 0.0
+        self.frames = 0
+        self.idle_waits = 0
+    
+    @property
+    def idle_fraction(self) -> float:
+        """Fraksi waktu yang dihabiskan dalam mode idle (0-1)"""
+        total = self.idle_time + self.active_time
+        return self.idle_time / total if total > 0 else 0.0
+    
+    def __str__(self):
+        return (f"Idle: {self.idle_time:.1f}s ({self.idle_fraction * 100:.0f}%), "
+                f"Active: {self.active_time:.1f}s, Frames: {self.frames}, "
+                f"Idle waits: {self.idle_waits}")
 
 
 class MatrixTransform2DApp:
     """Main application class"""
     
-    def __init__(self, width: int = 1200, height: int = 800):
+    def __init__(self, width: int = 1200, height: int = 800,
+                 precision: Optional[PrecisionPolicy] = None):
         """
         Initialize aplikasi
         Args:
             width: Lebar window
             height: Tinggi window
+            precision: PrecisionPolicy untuk geometry scene (default: policy global)
         """
         pygame.init()
         
@@ -36,6 +73,22 @@ class MatrixTransform2DApp:
         self.clock = pygame.time.Clock()
         self.fps = 60
         
+        # Idle mode: tanpa input/perubahan selama idle_delay detik, loop memblok
+        # di pygame.event.wait (maksimal idle_timeout_ms) alih-alih render 60 fps
+        self.idle_enabled = True
+        self.idle_delay = 0.25
+        self.idle_timeout_ms = 1000
+        self.loop_stats = LoopStats()
+        self._last_activity = time.perf_counter()
+        
+        # Input trace (src/trace.py): InputRecorder saat merekam, Replayer saat replay
+        self.frame_index = 0
+        self.recorder = None
+        self.replayer = None
+        
+        # Profiling alokasi per fase frame (src/profiling.py), None jika tidak aktif
+        self.alloc_profiler: Optional[AllocationProfiler] = None
+        
         # Colors
         self.bg_color = (255, 255, 255)
         self.grid_color = (230, 230, 230)
@@ -74,6 +127,9 @@ class MatrixTransform2DApp:
         self.selected_shape: Optional[Shape2D] = None
         self.selected_shape_index = 0
         
+        # Scene instanced (src/scene.py) digambar di belakang shapes, tidak bisa dipilih
+        self.instance_batch: Optional[InstanceBatch] = None
+        
         # Camera offset (untuk scrolling)
         self.camera_x = 0
         self.camera_y = 0
@@ -83,9 +139,21 @@ class MatrixTransform2DApp:
         self.min_zoom = 0.1
         self.max_zoom = 5.0
         self.zoom_step = 0.1
+        self._camera_cache = (None, None)
+        # Render queue canvas, dipakai ulang setiap frame
+        self._render_queue = RenderQueue()
+        # Font per ukuran, dibuat sekali (membuat Font setiap frame menahan memory)
+        self._fonts = {}
+        
+        # Key parameter transformasi terakhir yang diterapkan ke selected shape
+        self._applied_transform_key = None
+        
+        # Precision policy per scene (dtype geometry buffer dan matrix)
+        self.precision = precision if precision is not None else get_precision_policy()
         
         # Initialize default shapes
-        self._create_default_shapes()
+        with precision_scope(self.precision):
+            self._create_default_shapes()
         
         # Running state
         self.running = True
@@ -133,6 +201,38 @@ class MatrixTransform2DApp:
         if self.shapes:
             self.selected_shape = self.shapes[0]
     
+    def load_scene(self, scene):
+        """
+        Ganti isi canvas dengan scene hasil generate_scene
+        Args:
+            scene: List Shape2D (menggantikan shapes, shape pertama dipilih)
+                   atau InstanceBatch (digambar di belakang shapes yang ada)
+        """
+        if isinstance(scene, InstanceBatch):
+            self.instance_batch = scene
+            return
+        self.shapes = list(scene)
+        self.selected_shape_index = 0
+        self.selected_shape = self.shapes[0] if self.shapes else None
+        self._applied_transform_key = None
+    
+    def add_image(self, source) -> ImageShape:
+        """
+        Tambah ImageShape di tengah canvas lalu pilih shape tersebut
+        Args:
+            source: Path file, pygame.Surface atau array pixel
+        Returns:
+            ImageShape yang ditambahkan
+        """
+        pixels = load_image(source)
+        height, width = pixels.shape[:2]
+        image = ImageShape((self.canvas_width - width) / 2, (self.canvas_height - height) / 2, pixels)
+        self.shapes.append(image)
+        self.selected_shape_index = len(self.shapes) - 1
+        self.selected_shape = image
+        self._sync_control_panel_to_shape()
+        return image
+    
     def _on_transform_changed(self, matrix: TransformationMatrix):
         """Callback saat transformasi berubah dari control panel"""
         if self.selected_shape:
@@ -145,9 +245,30 @@ class MatrixTransform2DApp:
         if self.control_panel:
             self.control_panel.zoom_slider.set_value(zoom_value)
     
-    def handle_events(self):
-        """Handle pygame events"""
-        for event in pygame.event.get():
+    def handle_events(self, pending=()) -> int:
+        """
+        Handle pygame events
+        Args:
+            pending: Event yang sudah diambil dari queue (misal hasil event.wait)
+        Returns:
+            Jumlah event yang diproses
+        """
+        if self.replayer is not None:
+            # Replay: input live diabaikan, event diambil dari trace sesuai frame
+            pygame.event.pump()
+            events = self.replayer.events_for(self.frame_index)
+        else:
+            # MOUSEMOTION beruntun digabung ke posisi terakhir sebelum diproses
+            events = coalesce_motion_events(list(pending) + pygame.event.get())
+            # Posisi cursor disertakan di event wheel agar bisa direkam dan di-replay
+            events = [pygame.event.Event(pygame.MOUSEWHEEL, event.dict, pos=pygame.mouse.get_pos())
+                      if event.type == pygame.MOUSEWHEEL and not hasattr(event, 'pos') else event
+                      for event in events]
+            if self.recorder is not None:
+                self.recorder.record_events(self.frame_index, events)
+        if events:
+            self._last_activity = time.perf_counter()
+        for event in events:
             # Quit event
             if event.type == pygame.QUIT:
                 self.running = False
@@ -166,6 +287,7 @@ class MatrixTransform2DApp:
             
             # Handle control panel events
             self.control_panel.handle_event(event)
+        return len(events)
     
     def _handle_keydown(self, event: pygame.event.Event):
         """Handle keyboard key press"""
@@ -223,8 +345,7 @@ class MatrixTransform2DApp:
                 # Check if clicked on any shape
                 clicked_shape = None
                 for shape in reversed(self.shapes):  # Check from top to bottom
-                    points = shape.get_points(transformed=True)
-                    if self._point_in_shape((world_x, world_y), points):
+                    if self._point_in_shape((world_x, world_y), shape):
                         clicked_shape = shape
                         break
                 
@@ -237,7 +358,7 @@ class MatrixTransform2DApp:
     def _handle_mouse_wheel(self, event: pygame.event.Event):
         """Handle mouse wheel for zoom"""
         # Check if mouse is over canvas area (not control panel)
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        mouse_x, mouse_y = getattr(event, 'pos', None) or pygame.mouse.get_pos()
         if 0 <= mouse_x < self.canvas_width:
             if event.y > 0:  # Scroll up - zoom in
                 self.zoom_in()
@@ -282,14 +403,21 @@ class MatrixTransform2DApp:
             self.control_panel.set_zoom(self.camera_zoom)
 
     def _get_camera_matrix(self):
-        """Get the camera transformation matrix"""
-        camera_matrix = TransformationMatrix()
-        center_x = self.canvas_width / 2
-        center_y = self.canvas_height / 2
-        camera_matrix.translate(center_x, center_y)
-        camera_matrix.scale(self.camera_zoom, self.camera_zoom)
-        camera_matrix.translate(-center_x + self.camera_x, -center_y + self.camera_y)
-        return camera_matrix
+        """Get the camera transformation matrix
+        Matrix di-cache selama parameter camera tidak berubah, sehingga versinya
+        tetap dan cache screen-space shape bisa dipakai ulang antar frame
+        """
+        key = (self.camera_zoom, self.camera_x, self.camera_y,
+               self.canvas_width, self.canvas_height)
+        if self._camera_cache[0] != key:
+            camera_matrix = TransformationMatrix()
+            center_x = self.canvas_width / 2
+            center_y = self.canvas_height / 2
+            camera_matrix.translate(center_x, center_y)
+            camera_matrix.scale(self.camera_zoom, self.camera_zoom)
+            camera_matrix.translate(-center_x + self.camera_x, -center_y + self.camera_y)
+            self._camera_cache = (key, camera_matrix)
+        return self._camera_cache[1]
     
     def _screen_to_world(self, screen_x: float, screen_y: float) -> tuple:
         """Convert screen coordinates to world coordinates
@@ -308,19 +436,12 @@ class MatrixTransform2DApp:
         inv_camera.translate(-center_x, -center_y)
         return inv_camera.apply_to_point(screen_x, screen_y)
     
-    def _point_in_shape(self, point: tuple, points: List[tuple]) -> bool:
-        """Check if point is inside shape (simple bounding box check)"""
-        if len(points) < 2:
-            return False
-        
-        x, y = point
-        xs = [p[0] for p in points]
-        ys = [p[1] for p in points]
-        
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
-        
-        return min_x <= x <= max_x and min_y <= y <= max_y
+    def _point_in_shape(self, point: tuple, shape: Shape2D) -> bool:
+        """
+        Check if point is inside shape: bounds yang di-cache lalu triangulasi shape;
+        outline dalam jarak _PICK_TOLERANCE pixel layar juga dihitung kena
+        """
+        return shape.contains_point(point[0], point[1], tolerance=_PICK_TOLERANCE / self.camera_zoom)
     
     def _sync_control_panel_to_shape(self):
         """Sync control panel dengan transformasi shape yang dipilih"""
@@ -388,8 +509,19 @@ class MatrixTransform2DApp:
             
             # Gunakan center point objek asli sebagai pivot untuk scale dan rotate
             center = self.selected_shape.get_center()
-            matrix = self.control_panel.get_transform_matrix(center[0], center[1])
-            self.selected_shape.apply_transform(matrix)
+            transform = self.control_panel.transform
+            key = (id(self.selected_shape), self.selected_shape.transform_matrix.version,
+                   transform.translation_x, transform.translation_y,
+                   transform.rotation_angle, transform.scale_x, transform.scale_y, center)
+            # Matrix baru hanya dibuat jika parameter berubah, agar cache vertex
+            # shape tidak di-invalidate setiap frame
+            if key != self._applied_transform_key:
+                matrix = self.control_panel.get_transform_matrix(center[0], center[1])
+                self.selected_shape.apply_transform(matrix)
+                self._applied_transform_key = (
+                    key[0], matrix.version, *key[2:]
+                )
+                self._last_activity = time.perf_counter()
     
     def draw(self):
         """Draw everything"""
@@ -400,60 +532,41 @@ class MatrixTransform2DApp:
         canvas_surface = pygame.Surface((self.canvas_width, self.canvas_height))
         canvas_surface.fill(self.bg_color)
         
-        # Apply camera transform (zoom + translate)
-        # Transform ke center canvas dulu, lalu zoom, lalu translate kembali
-        camera_matrix = TransformationMatrix()
-        
-        # Translate ke center canvas untuk zoom dari center
-        center_x = self.canvas_width / 2
-        center_y = self.canvas_height / 2
-        camera_matrix.translate(center_x, center_y)
-        
-        # Apply zoom
-        camera_matrix.scale(self.camera_zoom, self.camera_zoom)
+        # Camera transform (zoom + translate), di-cache antar frame
+        camera_matrix = self._get_camera_matrix()
         
-        # Translate kembali + camera offset
-        camera_matrix.translate(-center_x + self.camera_x, -center_y + self.camera_y)
+        # Semua primitive canvas dikumpulkan dulu lalu digambar dengan draw call
+        # seminimal mungkin (urutan gambar tetap sama)
+        queue = self._render_queue
         
         # Draw grid dengan zoom consideration
-        self._draw_grid_with_zoom(canvas_surface)
+        self._draw_grid_with_zoom(queue)
         
         # Draw axes dengan zoom consideration
-        self._draw_axes_with_zoom(canvas_surface)
-        
-        # Draw all shapes dengan camera transform
-        for i, shape in enumerate(self.shapes):
-            # Combine camera and shape transformations
-            combined_matrix = TransformationMatrix()
-            combined_matrix.compose(camera_matrix)
-            combined_matrix.compose(shape.transform_matrix)
-            
-            # Temporarily apply combined transform
-            original_matrix = shape.transform_matrix
-            shape.apply_transform(combined_matrix)
-            
-            # Draw shape with zoom factor for center dot scaling
+        self._draw_axes_with_zoom(queue)
+        
+        # Scene instanced digambar langsung per geometry, setelah grid dan axes
+        if self.instance_batch is not None:
+            queue.flush(canvas_surface)
+            self.instance_batch.draw(canvas_surface, camera_matrix)
+        
+        # Draw all shapes dengan camera transform sebagai view matrix;
+        # transformasi shape sendiri tidak diubah sehingga cache world-space tetap valid
+        zoom_factor = self.camera_zoom ** 0.5  # Gentler scaling curve
+        for shape in self.shapes:
             is_selected = (shape == self.selected_shape)
-            zoom_factor = self.camera_zoom ** 0.5  # Gentler scaling curve
-            shape.draw(canvas_surface, draw_center=is_selected, zoom_factor=zoom_factor)
+            shape.submit(queue, canvas_surface, draw_center=is_selected, zoom_factor=zoom_factor,
+                         view_matrix=camera_matrix)
             
             # Draw selection highlight dengan zoom consideration
-            if is_selected:
-                points = shape.get_points(transformed=True)
-                if len(points) >= 2:
-                    # Use sqrt of zoom for gentler scaling
-                    highlight_zoom_factor = self.camera_zoom ** 0.5
-                    thickness = int(max(1, min(5, 2 * highlight_zoom_factor)))  # Clamped thickness
-                    for j in range(len(points)):
-                        start = points[j]
-                        end = points[(j + 1) % len(points)]
-                        pygame.draw.line(canvas_surface, (255, 0, 0), start, end, thickness)
-            
-            # Restore original transform
-            shape.transform_matrix = original_matrix
-            shape.transformed_points = [
-                p.transform(original_matrix) for p in shape.original_points
-            ]
+            if is_selected and shape.is_visible(canvas_surface, camera_matrix, margin=5):
+                # Use sqrt of zoom for gentler scaling
+                thickness = int(max(1, min(5, 2 * zoom_factor)))  # Clamped thickness
+                # Outline di-clip ke canvas sehingga panjang garis tidak ikut membesar
+                # saat zoom, dan digambar sebagai satu pygame.draw.lines
+                shape.submit_outline(queue, canvas_surface, camera_matrix, (255, 0, 0), thickness)
+        
+        queue.flush(canvas_surface)
         
         # Draw canvas ke screen
         self.screen.blit(canvas_surface, (self.canvas_x, self.canvas_y))
@@ -467,19 +580,16 @@ class MatrixTransform2DApp:
         # Update display
         pygame.display.flip()
     
-    def _draw_grid_with_zoom(self, surface):
+    def _draw_grid_with_zoom(self, queue: RenderQueue):
         """Draw grid dengan zoom consideration"""
         # Grid spacing dalam world coordinates
         base_spacing = 50
         grid_color = self.grid_color
         
-        # Buat camera matrix untuk transformasi
-        camera_matrix = TransformationMatrix()
+        # Camera matrix untuk transformasi
+        camera_matrix = self._get_camera_matrix()
         center_x = self.canvas_width / 2
         center_y = self.canvas_height / 2
-        camera_matrix.translate(center_x, center_y)
-        camera_matrix.scale(self.camera_zoom, self.camera_zoom)
-        camera_matrix.translate(-center_x + self.camera_x, -center_y + self.camera_y)
         
         # Hitung visible range dalam world coordinates
         # Inverse transform untuk mendapatkan world coordinates dari screen corners
@@ -505,43 +615,35 @@ class MatrixTransform2DApp:
         min_world_y = min(world_ys)
         max_world_y = max(world_ys)
         
-        # Draw vertical lines
+        # Posisi screen garis vertikal dan horizontal yang terlihat
         start_x = int(min_world_x - base_spacing)
         end_x = int(max_world_x + base_spacing)
+        xs = []
         for x in range(start_x, end_x, base_spacing):
-            point1 = camera_matrix.apply_to_point(x, min_world_y - base_spacing)
-            point2 = camera_matrix.apply_to_point(x, max_world_y + base_spacing)
-            # Clip ke screen bounds
-            if (0 <= point1[0] <= self.canvas_width or 0 <= point2[0] <= self.canvas_width or
-                (point1[0] < 0 and point2[0] > self.canvas_width) or
-                (point1[0] > self.canvas_width and point2[0] < 0)):
-                pygame.draw.line(surface, grid_color, 
-                               (int(point1[0]), int(point1[1])), 
-                               (int(point2[0]), int(point2[1])), 1)
-        
-        # Draw horizontal lines
+            screen_x = int(camera_matrix.apply_to_point(x, 0)[0])
+            if 0 <= screen_x <= self.canvas_width:
+                xs.append(screen_x)
+        
         start_y = int(min_world_y - base_spacing)
         end_y = int(max_world_y + base_spacing)
+        ys = []
         for y in range(start_y, end_y, base_spacing):
-            point1 = camera_matrix.apply_to_point(min_world_x - base_spacing, y)
-            point2 = camera_matrix.apply_to_point(max_world_x + base_spacing, y)
-            # Clip ke screen bounds
-            if (0 <= point1[1] <= self.canvas_height or 0 <= point2[1] <= self.canvas_height or
-                (point1[1] < 0 and point2[1] > self.canvas_height) or
-                (point1[1] > self.canvas_height and point2[1] < 0)):
-                pygame.draw.line(surface, grid_color, 
-                               (int(point1[0]), int(point1[1])), 
-                               (int(point2[0]), int(point2[1])), 1)
-    
-    def _draw_axes_with_zoom(self, surface):
+            screen_y = int(camera_matrix.apply_to_point(0, y)[1])
+            if 0 <= screen_y <= self.canvas_height:
+                ys.append(screen_y)
+        
+        # Seluruh grid sebagai satu polyline; penghubung antar garis di luar canvas
+        margin = 2
+        queue.add_polyline(
+            grid_polyline(xs, ys, (-margin, self.canvas_width + margin),
+                          (-margin, self.canvas_height + margin)),
+            grid_color, 1
+        )
+    
+    def _draw_axes_with_zoom(self, queue: RenderQueue):
         """Draw axes dengan zoom consideration"""
-        # Create temporary axis dengan zoom transform
-        camera_matrix = TransformationMatrix()
-        center_x = self.canvas_width / 2
-        center_y = self.canvas_height / 2
-        camera_matrix.translate(center_x, center_y)
-        camera_matrix.scale(self.camera_zoom, self.camera_zoom)
-        camera_matrix.translate(-center_x + self.camera_x, -center_y + self.camera_y)
+        # Camera matrix untuk transformasi axis
+        camera_matrix = self._get_camera_matrix()
         
         # Transform origin
         origin_world_x = self.origin_x
@@ -564,48 +666,52 @@ class MatrixTransform2DApp:
             # Transform points untuk axis
             point_start = camera_matrix.apply_to_point(-1000, origin_world_y)
             point_end = camera_matrix.apply_to_point(1000, origin_world_y)
-            pygame.draw.line(surface, axis_color, 
-                           (int(point_start[0]), int(point_start[1])), 
-                           (int(point_end[0]), int(point_end[1])), 
-                           line_thickness)
+            queue.add_polyline([(int(point_start[0]), int(point_start[1])),
+                                (int(point_end[0]), int(point_end[1]))],
+                               axis_color, line_thickness)
             
             # Arrow head
-            pygame.draw.polygon(surface, axis_color, [
+            queue.add_polygon([
                 (int(point_end[0]), int(point_end[1])),
                 (int(point_end[0]) - arrow_size, int(point_end[1]) - arrow_size // 2),
                 (int(point_end[0]) - arrow_size, int(point_end[1]) + arrow_size // 2)
-            ])
+            ], axis_color)
         
         # Y-axis
         if 0 <= origin_screen_x <= self.canvas_width:
             # Transform points untuk axis
             point_start = camera_matrix.apply_to_point(origin_world_x, -1000)
             point_end = camera_matrix.apply_to_point(origin_world_x, 1000)
-            pygame.draw.line(surface, axis_color, 
-                           (int(point_start[0]), int(point_start[1])), 
-                           (int(point_end[0]), int(point_end[1])), 
-                           line_thickness)
+            queue.add_polyline([(int(point_start[0]), int(point_start[1])),
+                                (int(point_end[0]), int(point_end[1]))],
+                               axis_color, line_thickness)
             
             # Arrow head
-            pygame.draw.polygon(surface, axis_color, [
+            queue.add_polygon([
                 (int(point_start[0]), int(point_start[1])),
                 (int(point_start[0]) - arrow_size // 2, int(point_start[1]) + arrow_size),
                 (int(point_start[0]) + arrow_size // 2, int(point_start[1]) + arrow_size)
-            ])
+            ], axis_color)
         
         # Label origin
         if 0 <= origin_screen_x <= self.canvas_width and 0 <= origin_screen_y <= self.canvas_height:
             # Clamp font size to reasonable range using zoom factor
             font_size = int(max(12, min(28, 24 * zoom_factor)))
-            font = pygame.font.Font(None, font_size)
-            text = font.render("O", True, axis_color)
+            text = self._get_font(font_size).render("O", True, axis_color)
             label_offset = max(3, int(5 * zoom_factor))
-            surface.blit(text, (origin_screen_x + label_offset, 
-                              origin_screen_y + label_offset))
+            queue.add_blit(text, (origin_screen_x + label_offset,
+                                  origin_screen_y + label_offset))
+    
+    def _get_font(self, size: int) -> pygame.font.Font:
+        """Font default dengan ukuran tertentu (di-cache)"""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
     
     def _draw_info(self):
         """Draw info text di canvas"""
-        font = pygame.font.Font(None, 24)
+        font = self._get_font(24)
         
         info_lines = [
             "MatrixTransform2D - Transformasi Matriks 2D",
@@ -627,6 +733,144 @@ class MatrixTransform2DApp:
             self.screen.blit(text_surface, (10, y_offset))
             y_offset += 25
     
+    def is_idle(self) -> bool:
+        """
+        True jika tidak ada drag, perubahan, maupun input selama idle_delay detik
+        Frame berikutnya bisa menunggu input tanpa render
+        """
+        if not self.idle_enabled or self.replayer is not None or self.control_panel.is_dragging:
+            return False
+        return time.perf_counter() - self._last_activity > self.idle_delay
+    
+    def run_frame(self) -> bool:
+        """
+        Jalankan satu iterasi main loop
+        Saat idle, blok di pygame.event.wait sampai ada input (atau timeout);
+        event yang membangunkan loop langsung diproses pada frame yang sama
+        Returns:
+            True jika frame dirender, False jika hanya menunggu lalu timeout
+        """
+        pending = ()
+        if self.is_idle():
+            wait_start = time.perf_counter()
+            event = pygame.event.wait(self.idle_timeout_ms)
+            self.loop_stats.idle_time += time.perf_counter() - wait_start
+            self.loop_stats.idle_waits += 1
+            if event.type == pygame.NOEVENT:
+                return False
+            pending = (event,)
+            # Reset clock supaya waktu menunggu tidak dihitung sebagai frame lambat
+            self.clock.tick()
+        
+        profiler = self.alloc_profiler
+        if profiler is not None:
+            profiler.begin_frame(self.frame_index)
+        frame_start = time.perf_counter()
+        
+        # Handle events
+        with phase_scope(profiler, 'events'):
+            self.handle_events(pending)
+        
+        # Update
+        with phase_scope(profiler, 'update'):
+            self.update()
+            
+            if self.recorder is not None:
+                self.recorder.record_sliders(self.frame_index, self.get_slider_state())
+            elif self.replayer is not None:
+                self.replayer.check_sliders(self.frame_index, self.get_slider_state())
+        
+        # Draw
+        with phase_scope(profiler, 'draw'):
+            self.draw()
+        
+        if self.replayer is not None:
+            self.replayer.frame_times.append(time.perf_counter() - frame_start)
+            if self.frame_index + 1 >= self.replayer.frame_count:
+                self.running = False
+        
+        # Control FPS
+        with phase_scope(profiler, 'tick'):
+            self.clock.tick(self.fps)
+        if profiler is not None:
+            profiler.end_frame()
+        self.loop_stats.active_time += time.perf_counter() - frame_start
+        self.loop_stats.frames += 1
+        self.frame_index += 1
+        return True
+    
+    def get_slider_state(self) -> dict:
+        """Nilai semua slider control panel (untuk trace)"""
+        panel = self.control_panel
+        return {
+            'zoom': panel.zoom_slider.value,
+            'tx': panel.translate_x_slider.value,
+            'ty': panel.translate_y_slider.value,
+            'rot': panel.rotate_slider.value,
+            'sx': panel.scale_x_slider.value,
+            'sy': panel.scale_y_slider.value,
+        }
+    
+    def start_recording(self, path: str):
+        """Mulai merekam input ke file trace"""
+        self.recorder = InputRecorder(path, self.width, self.height, self.fps)
+    
+    def start_replay(self, replayer: Replayer):
+        """
+        Putar ulang trace: event diambil dari replayer, tanpa batas fps dan
+        tanpa idle mode sehingga waktu frame yang tercatat murni waktu kerja
+        """
+        self.replayer = replayer
+        self.fps = 0
+    
+    def start_alloc_profiling(self, budget_bytes: int = 64 * 1024,
+                              snapshot_interval: int = 1) -> AllocationProfiler:
+        """
+        Aktifkan profiling alokasi per frame (tracemalloc)
+        Args:
+            budget_bytes: Batas alokasi per frame sebelum frame ditandai
+            snapshot_interval: Snapshot statistik per baris setiap N frame
+        Returns:
+            AllocationProfiler yang dipakai
+        """
+        self.alloc_profiler = AllocationProfiler(budget_bytes, snapshot_interval=snapshot_interval)
+        self.alloc_profiler.start()
+        return self.alloc_profiler
+    
+    def export_scene(self, path: str, use_camera: bool = True) -> int:
+        """
+        Export canvas (instance batch lalu shapes) ke SVG atau PNG sesuai ekstensi
+        Args:
+            path: File tujuan (.svg atau .png)
+            use_camera: True untuk menerapkan camera (zoom/pan) saat ini,
+                        False untuk koordinat world
+        Returns:
+            Jumlah elemen (SVG) atau strip (PNG) yang ditulis
+        """
+        view_matrix = self._get_camera_matrix() if use_camera else None
+        extension = os.path.splitext(path)[1].lower()
+        if extension == ".svg":
+            return export_svg(path, self.shapes, self.canvas_width, self.canvas_height,
+                              view_matrix, self.instance_batch)
+        if extension == ".png":
+            return export_png(path, self.shapes, self.canvas_width, self.canvas_height,
+                              view_matrix, self.instance_batch)
+        raise ValueError(f"Format export tidak didukung: {extension or path!r} (pakai .svg atau .png)")
+    
+    def _print_replay_summary(self):
+        """Cetak statistik waktu frame hasil replay"""
+        summary = self.replayer.timing_summary()
+        print(f"Replay: {summary['frames']} frame")
+        if summary['frames']:
+            print(f"  mean {summary['mean']:.2f} ms, p50 {summary['p50']:.2f} ms, "
+                  f"p95 {summary['p95']:.2f} ms, p99 {summary['p99']:.2f} ms, "
+                  f"max {summary['max']:.2f} ms")
+        if self.replayer.mismatches:
+            print(f"  PERINGATAN: slider berbeda dari rekaman pada "
+                  f"{len(self.replayer.mismatches)} frame (pertama: {self.replayer.mismatches[0]})")
+        else:
+            print("  Slider sama dengan rekaman (deterministik)")
+    
     def run(self):
         """Main game loop"""
         print("=" * 60)
@@ -646,29 +890,97 @@ class MatrixTransform2DApp:
         print("Using sliders in control panel to transform selected shape")
         print()
         
-        while self.running:
-            # Handle events
-            self.handle_events()
-            
-            # Update
-            self.update()
-            
-            # Draw
-            self.draw()
-            
-            # Control FPS
-            self.clock.tick(self.fps)
+        # Frame pertama selalu dirender sebelum loop boleh idle
+        self._last_activity = time.perf_counter()
+        try:
+            while self.running:
+                self.run_frame()
+        finally:
+            # Trace tetap tertutup rapi walau loop dihentikan (Ctrl+C)
+            if self.recorder is not None:
+                self.recorder.close()
+            if self.alloc_profiler is not None:
+                self.alloc_profiler.stop()
+        
+        print(self.loop_stats)
+        if self.alloc_profiler is not None:
+            print(self.alloc_profiler.report())
+        if self.recorder is not None:
+            print(f"Trace disimpan: {self.recorder.path} ({self.recorder.event_count} event)")
+        if self.replayer is not None:
+            self._print_replay_summary()
         
         # Cleanup
         pygame.quit()
         print("Aplikasi ditutup. Terima kasih!")
 
 
-def main():
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(description="MatrixTransform2D - Transformasi Matriks 2D")
+    parser.add_argument("--record", metavar="PATH",
+                        help="Rekam input ke file trace (.jsonl.gz)")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="Putar ulang file trace dan laporkan waktu frame")
+    parser.add_argument("--headless", action="store_true",
+                        help="Jalankan tanpa window (otomatis untuk --replay)")
+    parser.add_argument("--timings", metavar="PATH",
+                        help="Simpan waktu frame replay (JSON)")
+    parser.add_argument("--scene", metavar="N", type=int,
+                        help="Ganti shape demo dengan N shape sintetis (src/scene.py)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed untuk --scene (default: 0)")
+    parser.add_argument("--instanced", action="store_true",
+                        help="Buat --scene sebagai InstanceBatch (untuk jutaan shape)")
+    parser.add_argument("--profile-alloc", action="store_true",
+                        help="Ukur alokasi memory per fase frame dengan tracemalloc")
+    parser.add_argument("--alloc-budget", metavar="KB", type=float, default=64,
+                        help="Budget alokasi per frame untuk --profile-alloc (default: 64)")
+    parser.add_argument("--image", metavar="PATH",
+                        help="Tambah image (PNG/JPEG/...) ke canvas sebagai ImageShape")
+    parser.add_argument("--export", metavar="PATH",
+                        help="Export scene ke .svg atau .png lalu keluar tanpa membuka loop")
+    parser.add_argument("--export-world", action="store_true",
+                        help="Export dalam koordinat world (tanpa camera)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main entry point"""
+    args = parse_args(argv)
+    if args.record and args.replay:
+        print("Error: --record dan --replay tidak bisa dipakai bersamaan")
+        sys.exit(2)
+    if args.headless or args.replay or args.export:
+        # Harus di-set sebelum pygame.display diinisialisasi
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+    
     try:
-        app = MatrixTransform2DApp(width=1200, height=800)
+        if args.replay:
+            replayer = Replayer(args.replay)
+            app = MatrixTransform2DApp(width=replayer.width, height=replayer.height)
+            app.start_replay(replayer)
+        else:
+            app = MatrixTransform2DApp(width=1200, height=800)
+            if args.record:
+                app.start_recording(args.record)
+        if args.profile_alloc:
+            app.start_alloc_profiling(int(args.alloc_budget * 1024))
+        if args.scene:
+            app.load_scene(generate_scene(args.scene, seed=args.seed, instanced=args.instanced))
+        if args.image:
+            app.add_image(args.image)
+        if args.export:
+            written = app.export_scene(args.export, use_camera=not args.export_world)
+            print(f"Scene diexport ke {args.export} ({written})")
+            pygame.quit()
+            return
         app.run()
+        if args.replay and args.timings:
+            with open(args.timings, "w") as timings_file:
+                json.dump({"summary": replayer.timing_summary(),
+                           "frame_times": replayer.frame_times,
+                           "mismatches": replayer.mismatches}, timings_file)
     except KeyboardInterrupt:
         print("\nAplikasi dihentikan oleh user.")
         pygame.quit()
@@ -5,18 +5,329 @@ Menggunakan NumPy untuk operasi matriks 2D
 
 import numpy as np
 import math
+import itertools
+from array import array
+from contextlib import contextmanager
+from enum import IntEnum
+
+
+class PrecisionPolicy:
+    """
+    Kebijakan dtype untuk geometry buffer dan matrix
+    float32 menghemat setengah memory/bandwidth untuk jutaan vertex,
+    sedangkan komposisi matrix bisa tetap dihitung dalam float64
+    """
+    
+    def __init__(self, dtype=np.float64, accumulate_float64=True):
+        """
+        Args:
+            dtype: dtype untuk geometry buffer dan batched matrix (float32/float64)
+            accumulate_float64: True agar komposisi matrix tetap dalam float64
+        """
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype harus float32 atau float64, bukan {self.dtype}")
+        self.accumulate_float64 = accumulate_float64
+    
+    @property
+    def compose_dtype(self) -> np.dtype:
+        """dtype yang dipakai saat mengomposisi matrix"""
+        return np.dtype(np.float64) if self.accumulate_float64 else self.dtype
+    
+    def __repr__(self):
+        return (f"PrecisionPolicy(dtype={self.dtype.name}, "
+                f"accumulate_float64={self.accumulate_float64})")
+
+
+# Policy global (default: float64 penuh, sama seperti sebelumnya)
+_precision_policy = PrecisionPolicy()
+
+
+def get_precision_policy() -> PrecisionPolicy:
+    """Get precision policy global saat ini"""
+    return _precision_policy
+
+
+def set_precision_policy(policy: PrecisionPolicy) -> PrecisionPolicy:
+    """
+    Set precision policy global
+    Returns:
+        Policy sebelumnya
+    """
+    global _precision_policy
+    previous = _precision_policy
+    _precision_policy = policy
+    return previous
+
+
+@contextmanager
+def precision_scope(policy):
+    """
+    Context manager untuk memakai policy tertentu (misal per scene)
+    Args:
+        policy: PrecisionPolicy atau dtype (float32/float64)
+    """
+    if not isinstance(policy, PrecisionPolicy):
+        policy = PrecisionPolicy(policy)
+    previous = set_precision_policy(policy)
+    try:
+        yield policy
+    finally:
+        set_precision_policy(previous)
+
+
+# Counter global untuk versi matrix; setiap perubahan mendapat nomor unik
+# sehingga (versi) cukup sebagai cache key tanpa perlu id() object
+_version_counter = itertools.count(1)
+
+# Affine 2D disimpan sebagai matrix 2x3 (enam float a, b, c, d, e, f):
+#   [[a, b, c],
+#    [d, e, f]]     (baris bawah [0, 0, 1] selalu implisit)
+_IDENTITY = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+
+# Untuk input ndarray, di bawah jumlah titik ini aritmatika Python biasa lebih
+# cepat daripada overhead pemanggilan NumPy (lihat benchmarks/bench_small_matrix.py).
+# Input berupa list of tuples selalu lebih cepat lewat path skalar.
+NUMPY_CROSSOVER = 48
+
+# Jumlah baris per blok untuk matmul in-place (out overlap dengan input)
+_INPLACE_BLOCK = 16384
+
+
+class TransformKind(IntEnum):
+    """
+    Jenis transformasi, dipakai untuk memilih kernel yang paling murah
+    Urutan nilai: semakin besar semakin umum
+    """
+    IDENTITY = 0      # Tidak ada perubahan
+    TRANSLATION = 1   # Hanya pergeseran
+    SCALE = 2         # Skala per sumbu (+ translasi)
+    RIGID = 3         # Rotasi (+ translasi)
+    AFFINE = 4        # Affine umum
+
+
+# Alias modul untuk setiap jenis; akses atribut Enum relatif mahal di hot path
+_IDENTITY_KIND = TransformKind.IDENTITY
+_TRANSLATION = TransformKind.TRANSLATION
+_SCALE = TransformKind.SCALE
+_RIGID = TransformKind.RIGID
+_AFFINE = TransformKind.AFFINE
+
+
+def _combine_kinds(first: TransformKind, second: TransformKind) -> TransformKind:
+    """Jenis hasil komposisi dua transformasi"""
+    if first == _IDENTITY_KIND:
+        return second
+    if second == _IDENTITY_KIND:
+        return first
+    if {first, second} == {_SCALE, _RIGID}:
+        return _AFFINE
+    return max(first, second)
+
+
+def _classify(coeffs) -> TransformKind:
+    """Tentukan jenis transformasi dari koefisien 2x3"""
+    a, b, c, d, e, f = coeffs
+    if b == 0 and d == 0:
+        if a == 1 and e == 1:
+            if c == 0 and f == 0:
+                return _IDENTITY_KIND
+            return _TRANSLATION
+        return _SCALE
+    # Rotasi murni: kolom ortonormal dengan determinan positif
+    if (abs(a * a + d * d - 1) < 1e-12 and abs(b * b + e * e - 1) < 1e-12
+            and abs(a * b + d * e) < 1e-12 and a * e - b * d > 0):
+        return _RIGID
+    return _AFFINE
+
+
+def _multiply(m, n, kind_m, kind_n):
+    """Komposisi dua affine 2x3: hasil = m @ n, dengan kernel sesuai jenisnya"""
+    if kind_n == _IDENTITY_KIND:
+        return m
+    if kind_m == _IDENTITY_KIND:
+        return n
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    if kind_n == _TRANSLATION:
+        return (a, b, a * c2 + b * f2 + c, d, e, d * c2 + e * f2 + f)
+    if kind_m <= _SCALE and kind_n <= _SCALE:
+        # Keduanya diagonal: b = d = 0
+        return (a * a2, 0.0, a * c2 + c, 0.0, e * e2, e * f2 + f)
+    return (a * a2 + b * d2, a * b2 + b * e2, a * c2 + b * f2 + c,
+            d * a2 + e * d2, d * b2 + e * e2, d * c2 + e * f2 + f)
+
+
+def _round_float32(coeffs):
+    """Bulatkan koefisien ke presisi float32"""
+    return tuple(array('f', coeffs).tolist())
+
+
+# Operasi yang direkam secara lazy oleh TransformationMatrix:
+#   ('T', tx, ty)                 translasi
+#   ('R', angle, pivot_x, pivot_y) rotasi (derajat) terhadap pivot
+#   ('S', sx, sy, pivot_x, pivot_y) skala terhadap pivot
+#   ('M', coeffs, kind)           komposisi dengan affine lain
+
+def _append_fused(ops, op):
+    """
+    Tambahkan operasi ke chain sambil menggabungkan dengan operasi sebelumnya:
+    translasi berurutan dijumlahkan, rotasi/skala dengan pivot sama digabung,
+    dan sandwich T(a) @ X(pivot q) @ T(b) menjadi T(a + b) @ X(pivot q - b)
+    """
+    if op[0] == 'T' and op[1] == 0 and op[2] == 0:
+        return
+    if ops:
+        last = ops[-1]
+        if op[0] == last[0] == 'T':
+            tx, ty = last[1] + op[1], last[2] + op[2]
+            if tx == 0 and ty == 0:
+                ops.pop()
+            else:
+                ops[-1] = ('T', tx, ty)
+            return
+        if op[0] == last[0] == 'R' and op[2:] == last[2:]:
+            ops[-1] = ('R', last[1] + op[1], op[2], op[3])
+            return
+        if op[0] == last[0] == 'S' and op[3:] == last[3:]:
+            ops[-1] = ('S', last[1] * op[1], last[2] * op[2], op[3], op[4])
+            return
+        if (op[0] == 'T' and len(ops) >= 2 and last[0] in ('R', 'S')
+                and ops[-2][0] == 'T'):
+            first = ops[-2]
+            px, py = last[-2] - op[1], last[-1] - op[2]
+            del ops[-2:]
+            _append_fused(ops, ('T', first[1] + op[1], first[2] + op[2]))
+            _append_fused(ops, last[:-2] + (px, py))
+            return
+    ops.append(op)
+
+
+def _apply_op(coeffs, kind, op):
+    """Terapkan satu operasi (post-multiply) ke affine, dalam bentuk tertutup"""
+    name = op[0]
+    if name == 'T':
+        tx, ty = op[1], op[2]
+        if tx == 0 and ty == 0:
+            return coeffs, kind
+        a, b, c, d, e, f = coeffs
+        return ((a, b, a * tx + b * ty + c, d, e, d * tx + e * ty + f),
+                _combine_kinds(kind, _TRANSLATION))
+    if name == 'R':
+        angle_degrees, pivot_x, pivot_y = op[1], op[2], op[3]
+        if angle_degrees % 360 == 0:
+            return coeffs, kind
+        angle_rad = math.radians(angle_degrees)
+        cos_a = math.cos(angle_rad)
+        sin_a = math.sin(angle_rad)
+        # Bentuk tertutup dari T(pivot) @ R @ T(-pivot)
+        rotation = (cos_a, -sin_a, pivot_x - cos_a * pivot_x + sin_a * pivot_y,
+                    sin_a, cos_a, pivot_y - sin_a * pivot_x - cos_a * pivot_y)
+        return (_multiply(coeffs, rotation, kind, _RIGID),
+                _combine_kinds(kind, _RIGID))
+    if name == 'S':
+        sx, sy, pivot_x, pivot_y = op[1], op[2], op[3], op[4]
+        if sx == 1 and sy == 1:
+            return coeffs, kind
+        # Bentuk tertutup dari T(pivot) @ S @ T(-pivot)
+        scale = (sx, 0.0, pivot_x - sx * pivot_x, 0.0, sy, pivot_y - sy * pivot_y)
+        return (_multiply(coeffs, scale, kind, _SCALE),
+                _combine_kinds(kind, _SCALE))
+    other, other_kind = op[1], op[2]
+    return _multiply(coeffs, other, kind, other_kind), _combine_kinds(kind, other_kind)
 
 
 class TransformationMatrix:
-    """Class untuk transformasi matriks 2D"""
+    """
+    Class untuk transformasi matriks 2D
+    Matrix disimpan sebagai affine 2x3 (enam float Python) yang ditandai dengan
+    TransformKind. translate/rotate/scale/compose hanya direkam; seluruh chain
+    digabung menjadi satu matrix saat diterapkan atau dibaca
+    """
     
-    def __init__(self):
-        """Initialize dengan identity matrix"""
-        self.matrix = np.eye(3, dtype=np.float64)
+    def __init__(self, policy: PrecisionPolicy = None):
+        """
+        Initialize dengan identity matrix
+        Args:
+            policy: PrecisionPolicy (default: policy global saat ini)
+        """
+        self.policy = policy if policy is not None else get_precision_policy()
+        self._dtype = self.policy.compose_dtype
+        self._round32 = self._dtype == np.float32
+        self._set(_IDENTITY, _IDENTITY_KIND)
+    
+    def _set(self, coeffs, kind: TransformKind):
+        """Simpan koefisien baru beserta jenisnya dan naikkan versi"""
+        self._coeffs = _round_float32(coeffs) if self._round32 else coeffs
+        self._kind = kind
+        self._pending = []
+        self._array = None
+        self._affine_array = None
+        self.version = next(_version_counter)
+    
+    def _record(self, op):
+        """Rekam operasi tanpa menghitung matrix (lazy)"""
+        _append_fused(self._pending, op)
+        self._array = None
+        self._affine_array = None
+        self.version = next(_version_counter)
+        return self
+    
+    def _flush(self):
+        """Gabungkan operasi yang tertunda menjadi satu affine"""
+        coeffs, kind = self._coeffs, self._kind
+        for op in self._pending:
+            coeffs, kind = _apply_op(coeffs, kind, op)
+        self._pending = []
+        self._coeffs = _round_float32(coeffs) if self._round32 else coeffs
+        self._kind = kind
+    
+    @property
+    def kind(self) -> TransformKind:
+        """Jenis transformasi (identity, translation, scale, rigid, affine)"""
+        if self._pending:
+            self._flush()
+        return self._kind
+    
+    @property
+    def coefficients(self):
+        """Tuple (a, b, c, d, e, f) dari matrix [[a, b, c], [d, e, f], [0, 0, 1]]"""
+        if self._pending:
+            self._flush()
+        return self._coeffs
+    
+    @property
+    def affine(self) -> np.ndarray:
+        """Matrix affine 2x3 (read-only)"""
+        if self._affine_array is None:
+            affine = np.array(self.coefficients, dtype=self._dtype).reshape(2, 3)
+            affine.setflags(write=False)
+            self._affine_array = affine
+        return self._affine_array
+    
+    @property
+    def matrix(self) -> np.ndarray:
+        """Matrix 3x3 (read-only, gunakan set_matrix untuk mengubah)"""
+        if self._array is None:
+            a, b, c, d, e, f = self.coefficients
+            array = np.array([[a, b, c], [d, e, f], [0.0, 0.0, 1.0]], dtype=self._dtype)
+            array.setflags(write=False)
+            self._array = array
+        return self._array
+    
+    @matrix.setter
+    def matrix(self, value: np.ndarray):
+        self.set_matrix(value)
+    
+    def copy(self) -> 'TransformationMatrix':
+        """Salinan matrix ini (policy yang sama)"""
+        other = TransformationMatrix(self.policy)
+        other._set(self.coefficients, self._kind)
+        return other
     
     def reset(self):
         """Reset ke identity matrix"""
-        self.matrix = np.eye(3, dtype=np.float64)
+        self._set(_IDENTITY, _IDENTITY_KIND)
         return self
     
     def translate(self, tx, ty):
@@ -28,14 +339,9 @@ class TransformationMatrix:
         Returns:
             self untuk method chaining
         """
-        translation_matrix = np.array([
-            [1, 0, tx],
-            [0, 1, ty],
-            [0, 0, 1]
-        ], dtype=np.float64)
-        
-        self.matrix = np.dot(self.matrix, translation_matrix)
-        return self
+        if tx == 0 and ty == 0:
+            return self
+        return self._record(('T', tx, ty))
     
     def rotate(self, angle_degrees, pivot_x=0, pivot_y=0):
         """
@@ -47,34 +353,11 @@ class TransformationMatrix:
         Returns:
             self untuk method chaining
         """
-        # Konversi derajat ke radian
-        angle_rad = math.radians(angle_degrees)
-        cos_a = math.cos(angle_rad)
-        sin_a = math.sin(angle_rad)
-        
-        # Jika pivot bukan di origin, kita perlu:
-        # 1. Translate ke origin
-        # 2. Rotate
-        # 3. Translate kembali
-        
-        if pivot_x != 0 or pivot_y != 0:
-            # Translate ke origin
-            self.translate(-pivot_x, -pivot_y)
-        
-        # Matriks rotasi
-        rotation_matrix = np.array([
-            [cos_a, -sin_a, 0],
-            [sin_a,  cos_a, 0],
-            [0,      0,     1]
-        ], dtype=np.float64)
-        
-        self.matrix = np.dot(self.matrix, rotation_matrix)
-        
-        # Translate kembali jika pivot bukan di origin
-        if pivot_x != 0 or pivot_y != 0:
-            self.translate(pivot_x, pivot_y)
-        
-        return self
+        if angle_degrees % 360 == 0:
+            return self
+        # Pivot langsung disimpan; saat flush dihitung sebagai bentuk tertutup
+        # dari T(pivot) @ R @ T(-pivot), bukan tiga perkalian matrix
+        return self._record(('R', angle_degrees, pivot_x, pivot_y))
     
     def scale(self, sx, sy=None, pivot_x=0, pivot_y=0):
         """
@@ -89,30 +372,9 @@ class TransformationMatrix:
         """
         if sy is None:
             sy = sx  # Uniform scaling
-        
-        # Jika pivot bukan di origin, kita perlu:
-        # 1. Translate ke origin
-        # 2. Scale
-        # 3. Translate kembali
-        
-        if pivot_x != 0 or pivot_y != 0:
-            # Translate ke origin
-            self.translate(-pivot_x, -pivot_y)
-        
-        # Matriks skala
-        scale_matrix = np.array([
-            [sx, 0,  0],
-            [0,  sy, 0],
-            [0,  0,  1]
-        ], dtype=np.float64)
-        
-        self.matrix = np.dot(self.matrix, scale_matrix)
-        
-        # Translate kembali jika pivot bukan di origin
-        if pivot_x != 0 or pivot_y != 0:
-            self.translate(pivot_x, pivot_y)
-        
-        return self
+        if sx == 1 and sy == 1:
+            return self
+        return self._record(('S', sx, sy, pivot_x, pivot_y))
     
     def apply_to_point(self, x, y):
         """
@@ -123,41 +385,96 @@ class TransformationMatrix:
         Returns:
             Tuple (new_x, new_y) setelah transformasi
         """
-        # Buat vektor homogen [x, y, 1]
-        point = np.array([x, y, 1], dtype=np.float64)
-        
-        # Terapkan transformasi
-        transformed = np.dot(self.matrix, point)
-        
-        return (transformed[0], transformed[1])
+        if self._pending:
+            self._flush()
+        a, b, c, d, e, f = self._coeffs
+        kind = self._kind
+        if kind == _TRANSLATION:
+            return (x + c, y + f)
+        if kind <= _SCALE:
+            return (a * x + c, e * y + f)
+        return (a * x + b * y + c, d * x + e * y + f)
     
     def apply_to_points(self, points):
         """
         Terapkan transformasi ke array of points
+        List kecil/biasa memakai aritmatika skalar; ndarray (N, 2) dengan
+        minimal NUMPY_CROSSOVER titik memakai NumPy
         Args:
-            points: List of tuples [(x1,y1), (x2,y2), ...]
+            points: List of tuples [(x1,y1), (x2,y2), ...] atau ndarray (N, 2)
         Returns:
             List of tuples dengan koordinat yang sudah ditransformasi
         """
         if len(points) == 0:
             return []
+        if isinstance(points, np.ndarray) and len(points) >= NUMPY_CROSSOVER:
+            return list(zip(*self.apply_to_array(points).T.tolist()))
+        return self._apply_scalar(points)
+    
+    def _apply_scalar(self, points):
+        """Transformasi points dengan aritmatika Python biasa"""
+        if isinstance(points, np.ndarray):
+            points = points.tolist()
+        a, b, c, d, e, f = self.coefficients
+        if self._kind == _TRANSLATION:
+            return [(x + c, y + f) for x, y in points]
+        return [(a * x + b * y + c, d * x + e * y + f) for x, y in points]
+    
+    def apply_to_array(self, points, out: np.ndarray = None) -> np.ndarray:
+        """
+        Terapkan transformasi ke array (N, 2) dengan kernel sesuai jenisnya
+        Tidak membuat kolom homogen maupun tuple Python. ndarray atau object
+        buffer-protocol (array.array, memoryview, ...) dibaca tanpa copy
+        Args:
+            points: Array-like/buffer berisi N titik, bentuk (N, 2) atau datar (2N,)
+            out: ndarray (N, 2) milik caller untuk hasil (opsional, boleh
+                 sama dengan points untuk transformasi in-place)
+        Returns:
+            ndarray (N, 2): `out` jika diberikan, selain itu array baru dengan
+            dtype float input (atau dtype geometry dari policy)
+        """
+        points_array = np.asarray(points)
+        if points_array.dtype not in (np.float32, np.float64):
+            points_array = points_array.astype(self.policy.dtype)
+        points_array = points_array.reshape(-1, 2)
+        if out is None:
+            out = np.empty(points_array.shape, dtype=points_array.dtype)
+        elif out.shape != points_array.shape:
+            raise ValueError(f"out harus berukuran {points_array.shape}, bukan {out.shape}")
         
-        # Convert ke numpy array
-        points_array = np.array([(x, y, 1) for x, y in points], dtype=np.float64).T
-        
-        # Terapkan transformasi
-        transformed = np.dot(self.matrix, points_array)
-        
-        # Convert kembali ke list of tuples
-        return [(transformed[0, i], transformed[1, i]) for i in range(transformed.shape[1])]
+        kind = self.kind
+        if kind == _IDENTITY_KIND:
+            if out is not points_array:
+                np.copyto(out, points_array)
+            return out
+        affine = self.affine.astype(out.dtype, copy=False)
+        if kind == _TRANSLATION:
+            return np.add(points_array, affine[:, 2], out=out)
+        if kind == _SCALE:
+            np.multiply(points_array, affine.diagonal(), out=out)
+        elif np.may_share_memory(points_array, out):
+            # matmul menyalin seluruh operand yang overlap dengan out;
+            # per blok, copy sementaranya tetap kecil
+            linear = affine[:, :2].T
+            for start in range(0, len(out), _INPLACE_BLOCK):
+                block = slice(start, start + _INPLACE_BLOCK)
+                np.matmul(points_array[block], linear, out=out[block])
+        else:
+            np.matmul(points_array, affine[:, :2].T, out=out)
+        out += affine[:, 2]
+        return out
     
     def get_matrix(self):
         """Get matrix transformasi saat ini"""
         return self.matrix.copy()
     
     def set_matrix(self, matrix):
-        """Set matrix transformasi"""
-        self.matrix = np.array(matrix, dtype=np.float64)
+        """Set matrix transformasi (3x3 atau affine 2x3)"""
+        values = np.asarray(matrix, dtype=np.float64)
+        if values.shape not in ((3, 3), (2, 3)):
+            raise ValueError(f"Matrix harus berukuran 3x3 atau 2x3, bukan {values.shape}")
+        coeffs = tuple(values[:2].ravel().tolist())
+        self._set(coeffs, _classify(coeffs))
         return self
     
     def compose(self, other):
@@ -168,12 +485,29 @@ class TransformationMatrix:
         Returns:
             self untuk method chaining
         """
-        self.matrix = np.dot(self.matrix, other.matrix)
-        return self
+        if other.kind == _IDENTITY_KIND:
+            return self
+        return self._record(('M', other.coefficients, other.kind))
+    
+    def inverse(self) -> 'TransformationMatrix':
+        """
+        Matrix kebalikan sebagai TransformationMatrix baru (jenisnya tetap sama)
+        Dipakai untuk inverse mapping, misal warping image dari output ke source.
+        ValueError jika matrix singular (determinant nol)
+        """
+        a, b, c, d, e, f = self.coefficients
+        determinant = a * e - b * d
+        if determinant == 0:
+            raise ValueError("Matrix singular tidak memiliki inverse")
+        ia, ib = e / determinant, -b / determinant
+        id_, ie = -d / determinant, a / determinant
+        inverse = TransformationMatrix(self.policy)
+        inverse._set((ia, ib, -(ia * c + ib * f), id_, ie, -(id_ * c + ie * f)), self.kind)
+        return inverse
     
     def __str__(self):
         """String representation untuk debugging"""
-        return f"TransformationMatrix:\n{self.matrix}"
+        return f"TransformationMatrix ({self.kind.name.lower()}):\n{self.matrix}"
     
     def __repr__(self):
         """Representation untuk debugging"""
@@ -211,62 +545,21 @@ class Transform2D:
         # Matriks yang dibangun (dari kiri ke kanan):
         # T_user @ T_pivot @ Rotate @ Scale @ T_minus_pivot
         
-        # Langkah 1: Buat matriks translate ke -pivot
-        T_minus_pivot = np.array([
-            [1, 0, -self.pivot_x],
-            [0, 1, -self.pivot_y],
-            [0, 0, 1]
-        ], dtype=np.float64)
-        
-        # Langkah 2: Buat matriks scale
-        if self.scale_x != 1.0 or self.scale_y != 1.0:
-            sy = self.scale_y if self.scale_y is not None else self.scale_x
-            S = np.array([
-                [self.scale_x, 0, 0],
-                [0, sy, 0],
-                [0, 0, 1]
-            ], dtype=np.float64)
-        else:
-            S = np.eye(3, dtype=np.float64)
-        
-        # Langkah 3: Buat matriks rotate
-        if self.rotation_angle != 0.0:
-            angle_rad = math.radians(self.rotation_angle)
-            cos_a = math.cos(angle_rad)
-            sin_a = math.sin(angle_rad)
-            R = np.array([
-                [cos_a, -sin_a, 0],
-                [sin_a, cos_a, 0],
-                [0, 0, 1]
-            ], dtype=np.float64)
-        else:
-            R = np.eye(3, dtype=np.float64)
-        
-        # Langkah 4: Buat matriks translate kembali ke pivot
-        T_pivot = np.array([
-            [1, 0, self.pivot_x],
-            [0, 1, self.pivot_y],
-            [0, 0, 1]
-        ], dtype=np.float64)
+        # Dibangun dengan operasi TransformationMatrix (post-multiply) sehingga
+        # jenis transformasinya ikut tercatat: slider yang hanya menggeser
+        # menghasilkan matrix TRANSLATION yang diterapkan cukup dengan penjumlahan.
+        # T_pivot @ R @ S @ T_minus_pivot == rotate(pivot) lalu scale(pivot)
+        matrix = TransformationMatrix()
         
-        # Langkah 5: Buat matriks translate user
-        if self.translation_x != 0.0 or self.translation_y != 0.0:
-            T_user = np.array([
-                [1, 0, self.translation_x],
-                [0, 1, self.translation_y],
-                [0, 0, 1]
-            ], dtype=np.float64)
-        else:
-            T_user = np.eye(3, dtype=np.float64)
+        # Langkah 5: Translate user
+        matrix.translate(self.translation_x, self.translation_y)
         
-        # Gabungkan matriks dengan urutan yang benar: T_user @ T_pivot @ R @ S @ T_minus_pivot
-        # Karena kita ingin urutan aplikasi: T_minus_pivot -> S -> R -> T_pivot -> T_user
-        # Maka matriks final = T_user @ T_pivot @ R @ S @ T_minus_pivot
-        result_matrix = np.dot(T_user, np.dot(T_pivot, np.dot(R, np.dot(S, T_minus_pivot))))
+        # Langkah 4 + 3 + 1: Rotate terhadap pivot
+        matrix.rotate(self.rotation_angle, self.pivot_x, self.pivot_y)
         
-        # Buat TransformationMatrix dari hasil
-        matrix = TransformationMatrix()
-        matrix.set_matrix(result_matrix)
+        # Langkah 4 + 2 + 1: Scale terhadap pivot
+        sy = self.scale_y if self.scale_y is not None else self.scale_x
+        matrix.scale(self.scale_x, sy, self.pivot_x, self.pivot_y)
         
         return matrix
     
@@ -285,3 +578,74 @@ class Transform2D:
         return (f"Transform2D(tx={self.translation_x:.2f}, ty={self.translation_y:.2f}, "
                 f"rot={self.rotation_angle:.2f}°, "
                 f"sx={self.scale_x:.2f}, sy={self.scale_y:.2f})")
+
+
+def build_matrix_stack(translation_x, translation_y, rotation_angle, scale_x, scale_y,
+                       pivot_x=0.0, pivot_y=0.0, dtype=None) -> np.ndarray:
+    """
+    Bangun N matrix 3x3 dari kolom parameter sekaligus (versi batch Transform2D)
+    Semantik sama dengan Transform2D.get_matrix:
+    T_user @ T_pivot @ Rotate @ Scale @ T_minus_pivot
+    Args:
+        translation_x, translation_y: Translasi user, array (N,) atau skalar
+        rotation_angle: Sudut rotasi dalam derajat
+        scale_x, scale_y: Faktor skala
+        pivot_x, pivot_y: Titik pivot rotasi dan skala
+        dtype: dtype hasil (default: compose_dtype dari policy)
+    Returns:
+        ndarray (N, 3, 3)
+    """
+    if dtype is None:
+        dtype = _precision_policy.compose_dtype
+    tx, ty, angle, sx, sy, px, py = np.broadcast_arrays(
+        *(np.asarray(column, dtype=np.float64).ravel() for column in
+          (translation_x, translation_y, rotation_angle, scale_x, scale_y, pivot_x, pivot_y)))
+    
+    angle_rad = np.radians(angle)
+    cos_a = np.cos(angle_rad)
+    sin_a = np.sin(angle_rad)
+    
+    # Bagian linear: Rotate @ Scale
+    stack = np.zeros((len(tx), 3, 3), dtype=np.float64)
+    stack[:, 0, 0] = cos_a * sx
+    stack[:, 0, 1] = -sin_a * sy
+    stack[:, 1, 0] = sin_a * sx
+    stack[:, 1, 1] = cos_a * sy
+    # Translasi: t_user + pivot - (Rotate @ Scale) @ pivot
+    stack[:, 0, 2] = tx + px - (stack[:, 0, 0] * px + stack[:, 0, 1] * py)
+    stack[:, 1, 2] = ty + py - (stack[:, 1, 0] * px + stack[:, 1, 1] * py)
+    stack[:, 2, 2] = 1.0
+    return stack.astype(dtype, copy=False)
+
+
+def decompose_matrix_stack(stack, pivot_x=0.0, pivot_y=0.0):
+    """
+    Uraikan matrix stack kembali menjadi kolom parameter Transform2D
+    Kebalikan dari build_matrix_stack untuk matrix tanpa shear. Skala negatif
+    pada sumbu x dibaca sebagai rotasi +180° dengan scale_y bertanda terbalik,
+    yang menghasilkan matrix yang sama.
+    Args:
+        stack: ndarray (N, 3, 3) atau (N, 2, 3)
+        pivot_x, pivot_y: Pivot yang dipakai saat membangun matrix
+    Returns:
+        Tuple array (N,): (translation_x, translation_y, rotation_angle, scale_x, scale_y)
+    """
+    stack = np.asarray(stack, dtype=np.float64)
+    if stack.ndim != 3 or stack.shape[1:] not in ((3, 3), (2, 3)):
+        raise ValueError(f"Stack harus berukuran (N, 3, 3) atau (N, 2, 3), bukan {stack.shape}")
+    a = stack[:, 0, 0]
+    b = stack[:, 0, 1]
+    d = stack[:, 1, 0]
+    e = stack[:, 1, 1]
+    
+    scale_x = np.hypot(a, d)
+    rotation_angle = np.degrees(np.arctan2(d, a))
+    # scale_x == 0 tidak bisa diuraikan; scale_y dibiarkan 0
+    scale_y = np.divide(a * e - b * d, scale_x, out=np.zeros_like(scale_x),
+                        where=scale_x != 0)
+    
+    px, py = np.broadcast_arrays(np.asarray(pivot_x, dtype=np.float64),
+                                 np.asarray(pivot_y, dtype=np.float64))
+    translation_x = stack[:, 0, 2] - px + (a * px + b * py)
+    translation_y = stack[:, 1, 2] - py + (d * px + e * py)
+    return translation_x, translation_y, rotation_angle, scale_x, scale_y
@@ -0,0 +1,326 @@
+"""
+Profiling alokasi memory per frame dengan tracemalloc
+Setiap fase main loop (events, update, draw, tick) diukur terpisah sehingga
+alokasi di render path bisa dilacak; frame yang melewati budget ditandai
+beserta baris kode yang mengalokasikan memory di puncak frame tersebut
+Catatan: tracemalloc hanya melihat alokasi Python, bukan pixel buffer SDL;
+atribusi per baris bersifat perkiraan karena free-list dict/tuple CPython
+"""
+
+import contextlib
+import fnmatch
+import sys
+import tracemalloc
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+# Dipakai ulang saat profiler tidak aktif (nullcontext reentrant, tanpa alokasi baru)
+_NULL_PHASE = contextlib.nullcontext()
+
+# (lokasi "file:baris", byte, jumlah block)
+LineStat = Tuple[str, int, int]
+
+# Snapshot puncak diambil ulang setiap alokasi frame naik seperempat dari
+# snapshot sebelumnya, minimal 1/16 budget (byte di puncak >= 75% sebenarnya)
+_PEAK_CAPTURE_GROWTH = 4
+_PEAK_CAPTURE_MIN_STEP = 16
+
+
+def phase_scope(profiler: Optional['AllocationProfiler'], name: str):
+    """Context manager fase dari profiler, atau no-op jika profiler None"""
+    return profiler.phase(name) if profiler is not None else _NULL_PHASE
+
+
+class FrameAllocation:
+    """Alokasi satu frame per fase"""
+
+    def __init__(self, frame: int):
+        self.frame = frame
+        # name -> (allocated, retained): allocated = puncak di atas awal fase,
+        # retained = selisih memory saat fase selesai
+        self.phases: Dict[str, Tuple[int, int]] = {}
+        self.blocks = 0
+        self.top_lines: List[LineStat] = []
+
+    @property
+    def allocated(self) -> int:
+        """Total byte yang dialokasikan (puncak per fase) dalam frame"""
+        return sum(allocated for allocated, _ in self.phases.values())
+
+    @property
+    def retained(self) -> int:
+        """Selisih memory yang masih hidup di akhir frame"""
+        return sum(retained for _, retained in self.phases.values())
+
+
+class _Phase:
+    """Context manager satu fase dari AllocationProfiler.phase"""
+
+    __slots__ = ('_profiler', 'name', 'start', 'outer_peak')
+
+    def __init__(self, profiler: 'AllocationProfiler', name: str):
+        self._profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self._profiler._enter_phase(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._profiler._exit_phase(self)
+        return False
+
+
+# Trace function berhenti saat __exit__ fase pemiliknya dipanggil
+_PHASE_EXIT_CODE = _Phase.__exit__.__code__
+
+
+class AllocationProfiler:
+    """
+    Pengukur alokasi per fase main loop berbasis tracemalloc
+    Pemakaian per frame: begin_frame, beberapa `with profiler.phase(name)`,
+    lalu end_frame. Statistik per baris dihitung setiap snapshot_interval
+    frame karena biayanya jauh lebih besar dari pengukuran per fase: selama
+    frame tersebut trace function (sys.settrace) memeriksa memory di setiap
+    baris dan mengambil snapshot saat alokasi frame mencapai puncak baru,
+    sehingga objek sementara (Surface, matrix, list, string) yang sudah
+    dibebaskan sebelum end_frame tetap terhitung pada baris yang membuatnya.
+    Frame tersebut berjalan beberapa kali lebih lambat karena tracing. Jika
+    trace function lain sudah aktif (debugger, coverage), hanya memory yang
+    masih hidup di akhir frame yang terlihat
+    """
+
+    def __init__(self, budget_bytes: int = 64 * 1024, top: int = 10,
+                 snapshot_interval: int = 1, history: int = 600, traceback_depth: int = 1):
+        """
+        Args:
+            budget_bytes: Batas alokasi per frame; frame di atasnya ditandai
+            top: Jumlah baris teratas di laporan
+            snapshot_interval: Ambil snapshot setiap N frame (0 = tanpa statistik baris)
+            history: Jumlah frame di atas budget terakhir yang disimpan detailnya
+            traceback_depth: Kedalaman traceback tracemalloc
+        """
+        self.budget_bytes = budget_bytes
+        self.top = top
+        self.snapshot_interval = snapshot_interval
+        self.traceback_depth = traceback_depth
+        # Hanya frame di atas budget yang disimpan, supaya profiler sendiri tidak
+        # menahan objek per frame (free-list dict/tuple akan mengaburkan atribusi baris)
+        self.over_budget = deque(maxlen=history)
+        self.over_budget_count = 0
+        self.frame_count = 0
+        self.snapshot_frames = 0
+        self.max_allocated = 0
+        self._phase_totals: Dict[str, List[int]] = {}  # name -> [allocated, retained]
+        self._line_totals: Dict[str, List[int]] = {}   # lokasi -> [byte, block]
+        self._current: Optional[FrameAllocation] = None
+        self._snapshot = None
+        self._started_tracing = False
+        self._filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, fnmatch.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+        # Snapshot di puncak frame dan level memory berikutnya yang memicu snapshot baru
+        self._peak_snapshot = None
+        self._capture_level = 0
+        self._frame_start = 0
+        # Byte yang dipegang profiler sendiri (snapshot), dikurangkan dari pengukuran
+        self._overhead = 0
+        # Puncak efektif fase yang sedang berjalan (reset_peak dipakai ulang saat capture)
+        self._phase_peak = 0
+        self._traced_frame = None
+        self._trace_owner: Optional[_Phase] = None
+        # Satu bound method untuk semua frame (tanpa alokasi per event/frame)
+        self._trace_function = self._trace
+
+    def start(self):
+        """Mulai tracing (jika belum aktif)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_depth)
+            self._started_tracing = True
+
+    def stop(self):
+        """Hentikan tracing jika dimulai oleh profiler ini"""
+        self._uninstall_trace()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._current = None
+        self._snapshot = None
+        self._peak_snapshot = None
+        self._overhead = 0
+
+    def _memory(self) -> Tuple[int, int]:
+        """(current, peak) tracemalloc tanpa memory snapshot milik profiler"""
+        current, peak = tracemalloc.get_traced_memory()
+        return current - self._overhead, peak - self._overhead
+
+    def begin_frame(self, frame: int):
+        """Mulai mengukur satu frame"""
+        self._current = FrameAllocation(frame)
+        self._peak_snapshot = None
+        self._overhead = 0
+        if self.snapshot_interval and self.frame_count % self.snapshot_interval == 0:
+            before, _ = tracemalloc.get_traced_memory()
+            self._snapshot = tracemalloc.take_snapshot()
+            self._overhead = tracemalloc.get_traced_memory()[0] - before
+            self._frame_start = before
+            self._capture_level = before + max(self.budget_bytes // _PEAK_CAPTURE_MIN_STEP, 1)
+        else:
+            self._snapshot = None
+
+    def _install_trace(self, frame):
+        """Pasang trace function untuk frame baru dan frame blok `with` fase"""
+        if sys.gettrace() is not None:
+            return
+        sys.settrace(self._trace_function)
+        # Frame di atas blok `with` baru berjalan lagi setelah fase selesai
+        if frame.f_trace is None:
+            frame.f_trace = self._trace_function
+            self._traced_frame = frame
+
+    def _uninstall_trace(self):
+        if sys.gettrace() is self._trace_function:
+            sys.settrace(None)
+        if self._traced_frame is not None:
+            self._traced_frame.f_trace = None
+            self._traced_frame = None
+        self._trace_owner = None
+
+    def _trace(self, frame, event, arg):
+        """Trace function: ambil snapshot setiap alokasi frame mencapai level berikutnya"""
+        if tracemalloc.get_traced_memory()[0] - self._overhead >= self._capture_level:
+            self._capture_peak()
+        if frame.f_code is _PHASE_EXIT_CODE and frame.f_locals.get('self') is self._trace_owner:
+            # Fase yang memasang trace selesai: frame profiler berikutnya tidak di-trace
+            self._uninstall_trace()
+            return None
+        return self._trace_function
+
+    def _capture_peak(self):
+        """Ganti snapshot puncak dengan snapshot saat ini"""
+        raw_current, raw_peak = tracemalloc.get_traced_memory()
+        current = raw_current - self._overhead
+        self._phase_peak = max(self._phase_peak, raw_peak - self._overhead)
+        self._peak_snapshot = None
+        self._peak_snapshot = tracemalloc.take_snapshot()
+        # Snapshot lama dibebaskan, yang baru ditahan: perbarui overhead lalu
+        # reset puncak supaya memory sementara take_snapshot tidak terhitung
+        self._overhead += tracemalloc.get_traced_memory()[0] - raw_current
+        tracemalloc.reset_peak()
+        step = max((current - self._frame_start) // _PEAK_CAPTURE_GROWTH,
+                   self.budget_bytes // _PEAK_CAPTURE_MIN_STEP, 1)
+        self._capture_level = current + step
+
+    def phase(self, name: str) -> '_Phase':
+        """Ukur alokasi di dalam blok `with` sebagai fase `name` dari frame saat ini"""
+        return _Phase(self, name)
+
+    def _enter_phase(self, phase: '_Phase'):
+        phase.start, _ = self._memory()
+        phase.outer_peak = self._phase_peak
+        tracemalloc.reset_peak()
+        self._phase_peak = phase.start
+        # Trace hanya aktif di dalam fase dan dipasang setelah start diukur:
+        # dict f_locals yang dibuat CPython untuk frame yang di-trace tidak
+        # ikut terhitung sebagai memory awal fase
+        if self._snapshot is not None and self._trace_owner is None:
+            self._trace_owner = phase
+            # Frame 0: _enter_phase, 1: _Phase.__enter__, 2: blok `with`
+            self._install_trace(sys._getframe(2))
+
+    def _exit_phase(self, phase: '_Phase'):
+        if self._trace_owner is phase:
+            self._uninstall_trace()
+        current, peak = self._memory()
+        peak = max(peak, self._phase_peak)
+        self._phase_peak = max(phase.outer_peak, peak)
+        if self._current is not None:
+            allocated, retained = self._current.phases.get(phase.name, (0, 0))
+            self._current.phases[phase.name] = (allocated + peak - phase.start,
+                                                retained + current - phase.start)
+
+    def end_frame(self) -> Optional[FrameAllocation]:
+        """
+        Selesaikan frame: hitung statistik baris dan cek budget
+        Returns:
+            FrameAllocation frame tersebut, atau None jika begin_frame belum dipanggil
+        """
+        frame = self._current
+        if frame is None:
+            return None
+        self._current = None
+        if self._snapshot is not None:
+            if self._peak_snapshot is None or self._memory()[0] >= self._capture_level:
+                # Tanpa puncak di tengah frame: memory tertinggi ada di akhir frame
+                self._capture_peak()
+            peak = self._peak_snapshot.filter_traces(self._filters)
+            start = self._snapshot.filter_traces(self._filters)
+            self._snapshot = self._peak_snapshot = None
+            lines = []
+            # Byte yang hidup di puncak frame tetapi belum ada di awal frame,
+            # termasuk objek sementara yang sudah dibebaskan sebelum end_frame
+            for stat in peak.compare_to(start, 'lineno'):
+                if stat.size_diff <= 0:
+                    continue
+                location = f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}"
+                totals = self._line_totals.setdefault(location, [0, 0])
+                totals[0] += stat.size_diff
+                totals[1] += max(stat.count_diff, 0)
+                lines.append((location, stat.size_diff, max(stat.count_diff, 0)))
+            frame.blocks = sum(count for _, _, count in lines)
+            frame.top_lines = lines[:self.top]
+            self.snapshot_frames += 1
+            self._overhead = 0
+
+        for name, (allocated, retained) in frame.phases.items():
+            totals = self._phase_totals.setdefault(name, [0, 0])
+            totals[0] += allocated
+            totals[1] += retained
+        self.frame_count += 1
+        self.max_allocated = max(self.max_allocated, frame.allocated)
+        if frame.allocated > self.budget_bytes:
+            self.over_budget.append(frame)
+            self.over_budget_count += 1
+        return frame
+
+    def top_lines(self, limit: Optional[int] = None) -> List[LineStat]:
+        """Baris dengan byte terbesar di puncak semua frame yang di-snapshot"""
+        ranked = sorted(self._line_totals.items(), key=lambda item: item[1][0], reverse=True)
+        return [(location, size, count) for location, (size, count)
+                in ranked[:limit or self.top] if size > 0]
+
+    def summary(self) -> Dict[str, object]:
+        """
+        Ringkasan hasil profiling
+        Returns:
+            Dict dengan frames, rata-rata byte per fase per frame, max,
+            jumlah frame di atas budget dan baris teratas
+        """
+        frames = max(self.frame_count, 1)
+        return {
+            'frames': self.frame_count,
+            'budget': self.budget_bytes,
+            'phases': {name: {'allocated': allocated / frames, 'retained': retained / frames}
+                       for name, (allocated, retained) in self._phase_totals.items()},
+            'max_allocated': self.max_allocated,
+            'over_budget': self.over_budget_count,
+            'top_lines': self.top_lines(),
+        }
+
+    def report(self) -> str:
+        """Laporan teks untuk dicetak di akhir sesi"""
+        summary = self.summary()
+        lines = [f"Alokasi: {summary['frames']} frame, budget {self.budget_bytes / 1024:.0f} KB/frame, "
+                 f"{summary['over_budget']} frame di atas budget, "
+                 f"max {self.max_allocated / 1024:.1f} KB"]
+        for name, values in summary['phases'].items():
+            lines.append(f"  {name:8s} {values['allocated'] / 1024:8.1f} KB/frame dialokasikan, "
+                         f"{values['retained'] / 1024:8.1f} KB/frame tertahan")
+        if summary['top_lines']:
+            lines.append("  Baris teratas (byte baru yang hidup di puncak frame):")
+            frames = max(self.snapshot_frames, 1)
+            for location, size, count in summary['top_lines']:
+                lines.append(f"    {size / frames:10.0f} B/frame {count / frames:8.1f} obj/frame  {location}")
+        return "\n".join(lines)
@@ -0,0 +1,143 @@
+"""
+Render queue untuk mengurangi jumlah draw call pygame
+Primitive dikumpulkan per frame lalu digambar dengan call seminimal mungkin
+"""
+
+import pygame
+from typing import List, Tuple
+
+# Jenis primitive
+POLYGON = 'polygon'
+LINES = 'lines'
+CIRCLE = 'circle'
+BLIT = 'blit'
+
+
+class RenderQueue:
+    """
+    Antrian primitive untuk satu frame
+    Urutan submit dipertahankan (shape yang digambar belakangan tetap menimpa
+    yang sebelumnya); hanya primitive berurutan dengan jenis, warna dan tebal
+    yang sama yang digabung. Polyline yang bersambung (titik akhir = titik
+    awal berikutnya) digambar dengan satu pygame.draw.lines
+    """
+
+    def __init__(self):
+        # Item: (kind, color, width, payload)
+        self._items = []
+        self.draw_calls = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def clear(self):
+        """Kosongkan antrian tanpa menggambar"""
+        self._items.clear()
+
+    def add_polygon(self, points: List[Tuple[int, int]], color, width=0):
+        """Tambah polygon (width 0 = filled)"""
+        if len(points) >= 3:
+            self._items.append((POLYGON, color, width, points))
+
+    def add_polyline(self, points: List[Tuple[int, int]], color, width=1, closed=False):
+        """
+        Tambah polyline
+        Args:
+            points: Titik polyline
+            color: RGB color tuple
+            width: Tebal garis
+            closed: True untuk outline tertutup (edge terakhir ke titik pertama)
+        """
+        if len(points) < 2:
+            return
+        if closed:
+            points = list(points)
+            points.append(points[0])
+        self._items.append((LINES, color, width, points))
+
+    def add_segments(self, segments, color, width=1):
+        """Tambah beberapa segment (start, end); segment yang bersambung digabung saat flush"""
+        for start, end in segments:
+            self._items.append((LINES, color, width, [start, end]))
+
+    def add_circle(self, center: Tuple[int, int], radius: int, color):
+        """Tambah filled circle"""
+        self._items.append((CIRCLE, color, radius, center))
+
+    def add_blit(self, source: pygame.Surface, position: Tuple[int, int]):
+        """Tambah blit surface (misal text) pada posisi urutannya"""
+        self._items.append((BLIT, None, 0, (source, position)))
+
+    def flush(self, surface: pygame.Surface) -> int:
+        """
+        Gambar semua primitive ke surface lalu kosongkan antrian
+        Returns:
+            Jumlah draw call pygame yang dilakukan
+        """
+        calls = 0
+        pending = None  # polyline yang sedang dikumpulkan: (color, width, points)
+        for kind, color, width, payload in self._items:
+            if kind == LINES:
+                if pending is not None and pending[0] == color and pending[1] == width \
+                        and pending[2][-1] == payload[0]:
+                    pending[2].extend(payload[1:])
+                    continue
+                if pending is not None:
+                    calls += _draw_lines(surface, *pending)
+                pending = (color, width, list(payload))
+                continue
+            if pending is not None:
+                calls += _draw_lines(surface, *pending)
+                pending = None
+            if kind == POLYGON:
+                pygame.draw.polygon(surface, color, payload, width)
+            elif kind == CIRCLE:
+                pygame.draw.circle(surface, color, payload, width)
+            else:
+                surface.blit(*payload)
+            calls += 1
+        if pending is not None:
+            calls += _draw_lines(surface, *pending)
+        self._items.clear()
+        self.draw_calls = calls
+        return calls
+
+
+def _draw_lines(surface, color, width, points) -> int:
+    """Gambar polyline yang sudah digabung dengan satu call"""
+    if len(points) == 2:
+        pygame.draw.line(surface, color, points[0], points[1], width)
+    else:
+        pygame.draw.lines(surface, color, False, points, width)
+    return 1
+
+
+def grid_polyline(xs, ys, x_range, y_range) -> List[Tuple[int, int]]:
+    """
+    Susun garis grid vertikal dan horizontal menjadi satu polyline zig-zag
+    Penghubung antar garis berada di luar x_range/y_range (di luar layar)
+    sehingga seluruh grid bisa digambar dengan satu pygame.draw.lines
+    Args:
+        xs: Posisi screen garis vertikal
+        ys: Posisi screen garis horizontal
+        x_range, y_range: (min, max) screen yang sudah di luar area terlihat
+    Returns:
+        List titik polyline
+    """
+    points = []
+    low, high = y_range
+    for i, x in enumerate(xs):
+        ends = (low, high) if i % 2 == 0 else (high, low)
+        points.append((x, ends[0]))
+        points.append((x, ends[1]))
+    if points and ys:
+        # Pindah dari ujung garis vertikal terakhir ke awal garis horizontal
+        # lewat sudut di luar layar
+        last_x, last_y = points[-1]
+        points.append((x_range[0], last_y))
+    low, high = x_range
+    for i, y in enumerate(ys):
+        ends = (low, high) if i % 2 == 0 else (high, low)
+        points.append((ends[0], y))
+        points.append((ends[1], y))
+    return points
@@ -0,0 +1,200 @@
+"""
+Generator scene sintetis untuk pengujian skala
+Membuat campuran Rectangle, Triangle, Circle, Line dan Polygon secara
+deterministik (seeded), dari ratusan sampai jutaan shape
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Optional, Tuple, Union
+
+from .graphics import Shape2D, Rectangle, Triangle, Circle, Line, Polygon
+from .instancing import SharedGeometry, InstanceBatch
+from .matrix import build_matrix_stack
+
+SHAPE_KINDS = ('rectangle', 'triangle', 'circle', 'line', 'polygon')
+
+# Jumlah template triangle pada mode instanced (polygon: satu template per jumlah vertex)
+_TEMPLATES_PER_KIND = 16
+
+
+def _vertex_counts(rng: np.random.Generator, count: int, vertex_range: Tuple[int, int],
+                   distribution: str) -> np.ndarray:
+    """Jumlah vertex per shape (segment circle / titik polygon)"""
+    low, high = vertex_range
+    if low < 3 or high < low:
+        raise ValueError(f"vertex_range harus (min >= 3, max >= min), bukan {vertex_range}")
+    if distribution == 'uniform':
+        return rng.integers(low, high + 1, size=count)
+    if distribution == 'log':
+        # Banyak shape sederhana, sedikit shape dengan vertex banyak
+        values = np.exp(rng.uniform(math.log(low), math.log(high + 1), size=count))
+        return np.minimum(values.astype(int), high)
+    raise ValueError(f"vertex_distribution harus 'uniform' atau 'log', bukan {distribution!r}")
+
+
+def _positions(rng: np.random.Generator, count: int, half_extent: float,
+               clusters: int) -> np.ndarray:
+    """Posisi center shape: merata, atau mengelompok di sekitar beberapa cluster"""
+    if clusters <= 0:
+        return rng.uniform(-half_extent, half_extent, size=(count, 2))
+    centers = rng.uniform(-half_extent, half_extent, size=(clusters, 2))
+    spread = half_extent / (2 * math.sqrt(clusters))
+    points = centers[rng.integers(0, clusters, size=count)] + rng.normal(0, spread, (count, 2))
+    return np.clip(points, -half_extent, half_extent)
+
+
+def _star_polygon(rng: np.random.Generator, vertex_count: int) -> np.ndarray:
+    """
+    Polygon sederhana (tidak self-intersecting) dengan radius acak, ukuran unit
+    Sudut berjarak rata dengan jitter kurang dari setengah langkah, sehingga
+    urutan sudut tetap naik dan tidak ada celah >= pi (outline selalu simple)
+    """
+    step = 2 * np.pi / vertex_count
+    jitter = rng.uniform(-0.45 * step, 0.45 * step, size=vertex_count)
+    angles = rng.uniform(0, step) + np.arange(vertex_count) * step + jitter
+    radii = rng.uniform(0.6, 1.0, size=vertex_count)
+    return np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
+
+
+def generate_scene(count: int, seed: int = 0, mix: Optional[Dict[str, float]] = None,
+                   density: float = 200.0, extent: Optional[float] = None, clusters: int = 0,
+                   size_range: Tuple[float, float] = (10.0, 60.0),
+                   vertex_range: Tuple[int, int] = (5, 48), vertex_distribution: str = 'uniform',
+                   fill_ratio: float = 0.8,
+                   instanced: bool = False) -> Union[List[Shape2D], InstanceBatch]:
+    """
+    Buat scene acak yang deterministik untuk seed yang sama
+    Args:
+        count: Jumlah shape
+        seed: Seed random generator
+        mix: Bobot per jenis shape, misal {'circle': 3, 'line': 1} (default: rata)
+        density: Jumlah shape per area 1000x1000 (dipakai jika extent None)
+        extent: Setengah lebar area scene dalam world units (override density)
+        clusters: 0 untuk sebaran merata, > 0 untuk jumlah cluster
+        size_range: Rentang ukuran (radius / setengah lebar) shape
+        vertex_range: Rentang jumlah vertex untuk Circle dan Polygon
+        vertex_distribution: 'uniform' atau 'log' (lebih banyak shape sederhana)
+        fill_ratio: Proporsi shape yang filled (Line selalu outline)
+        instanced: True untuk InstanceBatch (SharedGeometry + matrix per instance),
+                   cocok untuk jutaan shape; False untuk list Shape2D
+    Returns:
+        List Shape2D, atau InstanceBatch jika instanced
+    """
+    mix = mix if mix is not None else {kind: 1.0 for kind in SHAPE_KINDS}
+    unknown = set(mix) - set(SHAPE_KINDS)
+    if unknown:
+        raise ValueError(f"Jenis shape tidak dikenal: {sorted(unknown)}")
+    weights = np.array([mix.get(kind, 0.0) for kind in SHAPE_KINDS], dtype=np.float64)
+    if weights.sum() <= 0:
+        raise ValueError("mix harus memiliki setidaknya satu bobot positif")
+
+    rng = np.random.default_rng(seed)
+    half_extent = extent if extent is not None else 500.0 * math.sqrt(max(count, 1) / density)
+
+    kinds = rng.choice(len(SHAPE_KINDS), size=count, p=weights / weights.sum())
+    centers = _positions(rng, count, half_extent, clusters)
+    sizes = rng.uniform(size_range[0], size_range[1], size=count)
+    aspects = rng.uniform(0.5, 1.5, size=count)
+    angles = rng.uniform(0, 360, size=count)
+    vertex_counts = _vertex_counts(rng, count, vertex_range, vertex_distribution)
+    fills = rng.random(count) < fill_ratio
+    colors = rng.integers(40, 230, size=(count, 3))
+
+    if instanced:
+        return _instanced_scene(rng, kinds, centers, sizes, aspects, angles,
+                                vertex_counts, fills, colors)
+
+    shapes = []
+    for i in range(count):
+        kind = SHAPE_KINDS[kinds[i]]
+        x, y = centers[i].tolist()
+        size = float(sizes[i])
+        color = tuple(colors[i].tolist())
+        fill = bool(fills[i])
+        if kind == 'rectangle':
+            width, height = 2 * size, 2 * size * float(aspects[i])
+            shape = Rectangle(x - width / 2, y - height / 2, width, height, color, fill)
+        elif kind == 'circle':
+            shape = Circle(x, y, size, color, fill, segments=int(vertex_counts[i]))
+        else:
+            # Triangle, Line dan Polygon: rotasi langsung di geometry
+            angle = math.radians(float(angles[i]))
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
+            if kind == 'triangle':
+                local = _star_polygon(rng, 3)
+            elif kind == 'line':
+                local = np.array([(-1.0, 0.0), (1.0, 0.0)])
+            else:
+                local = _star_polygon(rng, int(vertex_counts[i]))
+            points = [(x + size * (cos_a * px - sin_a * py), y + size * (sin_a * px + cos_a * py))
+                      for px, py in local.tolist()]
+            if kind == 'triangle':
+                (x1, y1), (x2, y2), (x3, y3) = points
+                shape = Triangle(x1, y1, x2, y2, x3, y3, color, fill)
+            elif kind == 'line':
+                (x1, y1), (x2, y2) = points
+                shape = Line(x1, y1, x2, y2, color)
+            else:
+                shape = Polygon(points, color, fill)
+        shapes.append(shape)
+    return shapes
+
+
+def _instanced_scene(rng, kinds, centers, sizes, aspects, angles, vertex_counts,
+                     fills, colors) -> InstanceBatch:
+    """
+    Versi instanced: geometry unit per template, matrix per instance dibangun
+    sekaligus dengan build_matrix_stack lalu ditambahkan per template
+    """
+    count = len(kinds)
+    kind_names = np.array(SHAPE_KINDS)[kinds]
+    is_line = kind_names == 'line'
+    fills = fills & ~is_line
+    scale_x = sizes.copy()
+    scale_y = sizes.copy()
+    scale_x[kind_names == 'rectangle'] *= 2
+    scale_y[kind_names == 'rectangle'] *= 2 * aspects[kind_names == 'rectangle']
+    rotation = np.where((kind_names == 'rectangle') | (kind_names == 'circle'), 0.0, angles)
+    matrices = build_matrix_stack(centers[:, 0], centers[:, 1], rotation, scale_x, scale_y)
+
+    # Key template: (jenis, varian, fill); varian = jumlah vertex atau index template
+    variants = np.zeros(count, dtype=np.int64)
+    circle_or_polygon = (kind_names == 'circle') | (kind_names == 'polygon')
+    variants[circle_or_polygon] = vertex_counts[circle_or_polygon]
+    is_triangle = kind_names == 'triangle'
+    variants[is_triangle] = rng.integers(0, _TEMPLATES_PER_KIND, size=int(is_triangle.sum()))
+
+    template_rng = np.random.default_rng(rng.integers(0, 2 ** 32))
+    templates = {}
+    batch = InstanceBatch()
+    # Key digabung menjadi satu integer supaya pengelompokan cukup satu argsort
+    variant_span = int(variants.max()) + 1 if count else 1
+    keys = (kinds.astype(np.int64) * variant_span + variants) * 2 + fills
+    order = np.argsort(keys, kind='stable')
+    unique_keys, starts = np.unique(keys[order], return_index=True)
+    ends = np.append(starts[1:], count)
+    for key, start, end in zip(unique_keys.tolist(), starts.tolist(), ends.tolist()):
+        members = order[start:end]
+        kind_index, remainder = divmod(key, variant_span * 2)
+        variant, fill = divmod(remainder, 2)
+        kind = SHAPE_KINDS[kind_index]
+        template_key = (kind, variant, bool(fill))
+        geometry = templates.get(template_key)
+        if geometry is None:
+            geometry = templates[template_key] = _unit_geometry(template_rng, kind, variant, bool(fill))
+        batch.add_many(geometry, matrices[members], colors[members])
+    return batch
+
+
+def _unit_geometry(rng: np.random.Generator, kind: str, variant: int, fill: bool) -> SharedGeometry:
+    """Geometry ukuran unit dengan center di origin untuk satu template"""
+    if kind == 'rectangle':
+        return SharedGeometry([(-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5)], fill)
+    if kind == 'circle':
+        return SharedGeometry.circle(1.0, segments=variant, fill=fill)
+    if kind == 'line':
+        return SharedGeometry([(-1.0, 0.0), (1.0, 0.0)], fill=False)
+    if kind == 'triangle':
+        return SharedGeometry(_star_polygon(rng, 3), fill)
+    return SharedGeometry(_star_polygon(rng, variant), fill)
@@ -0,0 +1,152 @@
+"""
+Mipmap dan cache texture untuk image di canvas
+Image di-downsample menjadi pyramid (setiap level setengah ukuran level
+sebelumnya); surface yang sudah di-scale/rotasi disimpan di TextureCache
+dengan key (image, zoom, angle) yang dikuantisasi sehingga pan dan
+perubahan zoom kecil memakai ulang surface tanpa resampling
+"""
+
+import math
+import numpy as np
+import pygame
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+# Zoom dikuantisasi dalam skala log2: 16 langkah per oktaf (~4.4% per langkah)
+ZOOM_STEPS_PER_OCTAVE = 16
+# Sudut rotasi dikuantisasi per derajat
+ANGLE_STEP = 1.0
+
+
+def build_mipmaps(pixels: np.ndarray) -> List[np.ndarray]:
+    """
+    Pyramid mipmap dengan box filter 2x2
+    Args:
+        pixels: Array uint8 (H, W, C)
+    Returns:
+        List level, dimulai dari pixels sendiri sampai sisi terpanjang 1 pixel;
+        sisi ganjil dibulatkan ke bawah (baris/kolom terakhir diabaikan)
+    """
+    levels = [pixels]
+    while max(levels[-1].shape[:2]) > 1:
+        level = levels[-1]
+        height, width, channels = level.shape
+        # Sisi yang sudah 1 pixel tidak diperkecil lagi
+        step_y = 2 if height > 1 else 1
+        step_x = 2 if width > 1 else 1
+        half_height, half_width = height // step_y, width // step_x
+        # Jumlah blok dari slice berjarak step (uint16 cukup untuk 4 x 255)
+        summed = np.zeros((half_height, half_width, channels), dtype=np.uint16)
+        for dy in range(step_y):
+            for dx in range(step_x):
+                summed += level[dy:half_height * step_y:step_y, dx:half_width * step_x:step_x]
+        count = step_x * step_y
+        summed += count // 2
+        summed //= count
+        levels.append(summed.astype(np.uint8))
+    return levels
+
+
+def quantize_zoom(zoom: float, steps_per_octave: int = ZOOM_STEPS_PER_OCTAVE) -> float:
+    """Bulatkan zoom ke langkah terdekat pada skala log2"""
+    return 2.0 ** (round(math.log2(zoom) * steps_per_octave) / steps_per_octave)
+
+
+def quantize_angle(angle: float, step: float = ANGLE_STEP) -> float:
+    """Bulatkan sudut (derajat) ke kelipatan step, dinormalisasi ke [0, 360)"""
+    return (round(angle / step) * step) % 360.0
+
+
+def mip_level_for(zoom: float, level_count: int) -> int:
+    """
+    Level mipmap untuk zoom tertentu: level terkecil yang masih >= ukuran tampil,
+    sehingga scaling dari level tersebut selalu di antara 0.5x dan 1x (atau perbesaran)
+    """
+    if zoom >= 1.0:
+        return 0
+    return min(int(math.floor(-math.log2(zoom))), level_count - 1)
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Ukuran pixel buffer surface dalam byte"""
+    return surface.get_pitch() * surface.get_height()
+
+
+class TextureCache:
+    """
+    Cache LRU untuk surface yang sudah di-transformasi, dibatasi total byte
+    Surface yang paling lama tidak dipakai dibuang saat batas terlampaui;
+    surface yang lebih besar dari batas dikembalikan tanpa disimpan
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Batas total pixel buffer semua surface di cache
+        """
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (surface, ukuran byte), urutan dari yang paling lama tidak dipakai
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key) -> Optional[pygame.Surface]:
+        """Surface untuk key (dan tandai baru dipakai), atau None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, surface: pygame.Surface):
+        """Simpan surface lalu buang entry LRU sampai total byte di bawah batas"""
+        size = surface_bytes(surface)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes_used -= old[1]
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (surface, size)
+        self.bytes_used += size
+        while self.bytes_used > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.bytes_used -= evicted_size
+            self.evictions += 1
+
+    def get_or_create(self, key, factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Surface dari cache, atau buat dengan factory() lalu simpan
+        Args:
+            key: Key hashable
+            factory: Fungsi tanpa argumen yang membuat surface saat miss
+        """
+        surface = self.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = factory()
+        self.put(key, surface)
+        return surface
+
+    def clear(self):
+        """Kosongkan cache (statistik hit/miss tetap)"""
+        self._entries.clear()
+        self.bytes_used = 0
+
+
+# Cache bersama untuk semua ImageShape (batas byte berlaku untuk semua image)
+_texture_cache = TextureCache()
+
+
+def get_texture_cache() -> TextureCache:
+    """Cache texture global yang dipakai ImageShape secara default"""
+    return _texture_cache
@@ -0,0 +1,161 @@
+"""
+Rekam dan replay input trace
+Event keyboard/mouse disimpan per frame ke file JSON lines (gzip) sehingga
+sesi interaktif bisa diputar ulang secara deterministik dalam mode headless
+"""
+
+import gzip
+import json
+import pygame
+from typing import Dict, List, Optional
+
+TRACE_VERSION = 1
+
+# Nama event dan atribut yang disimpan untuk setiap jenis event
+_EVENT_FIELDS = {
+    pygame.KEYDOWN: ('KEYDOWN', ('key', 'mod', 'unicode', 'scancode')),
+    pygame.KEYUP: ('KEYUP', ('key', 'mod', 'unicode', 'scancode')),
+    pygame.MOUSEMOTION: ('MOUSEMOTION', ('pos', 'rel', 'buttons')),
+    pygame.MOUSEBUTTONDOWN: ('MOUSEBUTTONDOWN', ('pos', 'button')),
+    pygame.MOUSEBUTTONUP: ('MOUSEBUTTONUP', ('pos', 'button')),
+    pygame.MOUSEWHEEL: ('MOUSEWHEEL', ('x', 'y', 'flipped', 'pos')),
+    pygame.QUIT: ('QUIT', ()),
+}
+_EVENT_TYPES = {name: event_type for event_type, (name, _) in _EVENT_FIELDS.items()}
+
+
+def encode_event(event: pygame.event.Event) -> Optional[dict]:
+    """
+    Ubah event pygame menjadi dict JSON
+    Returns:
+        Dict {'t': nama, ...atribut}, atau None jika jenis event tidak direkam
+    """
+    spec = _EVENT_FIELDS.get(event.type)
+    if spec is None:
+        return None
+    name, fields = spec
+    record = {'t': name}
+    for field in fields:
+        if hasattr(event, field):
+            value = getattr(event, field)
+            record[field] = list(value) if isinstance(value, tuple) else value
+    return record
+
+
+def decode_event(record: dict) -> pygame.event.Event:
+    """Kebalikan dari encode_event"""
+    attributes = {key: tuple(value) if isinstance(value, list) else value
+                  for key, value in record.items() if key not in ('t', 'f')}
+    return pygame.event.Event(_EVENT_TYPES[record['t']], attributes)
+
+
+class InputRecorder:
+    """
+    Tulis event input per frame ke file trace (JSON lines, gzip)
+    Baris pertama header (ukuran window, fps), lalu satu baris per event
+    {'f': frame, 't': jenis, ...} dan satu baris {'f': frame, 'sliders': {...}}
+    setiap kali nilai slider berubah
+    """
+
+    def __init__(self, path: str, width: int, height: int, fps: int):
+        """
+        Args:
+            path: File tujuan (.jsonl.gz)
+            width, height: Ukuran window saat merekam
+            fps: Target fps aplikasi
+        """
+        self.path = path
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+        self._last_sliders = None
+        self.event_count = 0
+        self._write({'version': TRACE_VERSION, 'width': width, 'height': height, 'fps': fps})
+
+    def _write(self, record: dict):
+        self._file.write(json.dumps(record, separators=(',', ':')))
+        self._file.write('\n')
+
+    def record_events(self, frame: int, events: List[pygame.event.Event]):
+        """Simpan event yang diproses pada frame tertentu"""
+        for event in events:
+            record = encode_event(event)
+            if record is not None:
+                record['f'] = frame
+                self._write(record)
+                self.event_count += 1
+
+    def record_sliders(self, frame: int, sliders: Dict[str, float]):
+        """Simpan nilai slider jika berbeda dari yang terakhir disimpan"""
+        if sliders != self._last_sliders:
+            self._write({'f': frame, 'sliders': sliders})
+            self._last_sliders = dict(sliders)
+
+    def close(self):
+        """Tutup file trace"""
+        if not self._file.closed:
+            self._file.close()
+
+
+class Replayer:
+    """
+    Putar ulang file trace dari InputRecorder
+    Event diberikan per frame sesuai index saat direkam; nilai slider yang
+    tersimpan dipakai untuk memeriksa bahwa replay berjalan deterministik
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: File trace (.jsonl.gz)
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as trace_file:
+            lines = [json.loads(line) for line in trace_file if line.strip()]
+        if not lines or lines[0].get('version') != TRACE_VERSION:
+            raise ValueError(f"{path} bukan trace versi {TRACE_VERSION}")
+        header = lines[0]
+        self.width = header['width']
+        self.height = header['height']
+        self.fps = header['fps']
+
+        self._events: Dict[int, List[dict]] = {}
+        self._sliders: Dict[int, Dict[str, float]] = {}
+        for record in lines[1:]:
+            if 'sliders' in record:
+                self._sliders[record['f']] = record['sliders']
+            else:
+                self._events.setdefault(record['f'], []).append(record)
+        frames = list(self._events) + list(self._sliders)
+        self.frame_count = max(frames) + 1 if frames else 0
+        self.mismatches: List[int] = []
+        self.frame_times: List[float] = []
+
+    def events_for(self, frame: int) -> List[pygame.event.Event]:
+        """Event yang harus diproses pada frame tertentu"""
+        return [decode_event(record) for record in self._events.get(frame, ())]
+
+    def check_sliders(self, frame: int, sliders: Dict[str, float]):
+        """Catat frame di mana nilai slider berbeda dari rekaman"""
+        expected = self._sliders.get(frame)
+        if expected is not None and expected != sliders:
+            self.mismatches.append(frame)
+
+    def timing_summary(self) -> Dict[str, float]:
+        """
+        Statistik waktu frame hasil replay (milidetik)
+        Returns:
+            Dict dengan frames, mean, p50, p95, p99 dan max
+        """
+        if not self.frame_times:
+            return {'frames': 0}
+        times = sorted(self.frame_times)
+
+        def percentile(fraction):
+            return times[min(len(times) - 1, int(fraction * len(times)))] * 1000
+
+        return {
+            'frames': len(times),
+            'mean': sum(times) / len(times) * 1000,
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'p99': percentile(0.99),
+            'max': times[-1] * 1000,
+        }
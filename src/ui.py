@@ -4,10 +4,37 @@ Menggunakan Pygame untuk UI components
 """
 
 import pygame
-from typing import Optional, Callable
+from typing import Optional, Callable, List
 from .matrix import Transform2D
 
 
+def coalesce_motion_events(events: List[pygame.event.Event]) -> List[pygame.event.Event]:
+    """
+    Gabungkan MOUSEMOTION yang berurutan menjadi satu event dengan posisi terakhir
+    Urutan relatif terhadap event lain (klik, keyboard) dipertahankan dan
+    `rel` dijumlahkan sehingga total pergerakan tidak hilang
+    Args:
+        events: Event dari pygame.event.get()
+    Returns:
+        List event baru
+    """
+    result = []
+    for event in events:
+        if event.type == pygame.MOUSEMOTION and result and result[-1].type == pygame.MOUSEMOTION:
+            previous = result[-1]
+            attributes = dict(event.dict)
+            if 'rel' in attributes and 'rel' in previous.dict:
+                attributes['rel'] = (previous.rel[0] + event.rel[0], previous.rel[1] + event.rel[1])
+            result[-1] = pygame.event.Event(pygame.MOUSEMOTION, attributes)
+        else:
+            result.append(event)
+    return result
+
+
+# Tinggi baris (pixel) untuk index hit-test ControlPanel
+_HIT_ROW = 16
+
+
 class Button:
     """Class untuk button di UI"""
     
@@ -34,6 +61,11 @@ class Button:
         self.callback = callback
         self.is_hovered = False
     
+    @property
+    def hit_rect(self) -> pygame.Rect:
+        """Area yang bisa menerima event mouse"""
+        return self.rect
+    
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
         Handle pygame event
@@ -49,16 +81,28 @@ class Button:
                 return True
         return False
     
-    def draw(self, surface: pygame.Surface):
-        """Draw button ke surface"""
+    def render_key(self):
+        """State visual button; button digambar ulang hanya jika berubah"""
+        return (self.is_hovered, self.text, self.color, self.hover_color, self.text_color)
+    
+    def draw(self, surface: pygame.Surface, offset=(0, 0)) -> pygame.Rect:
+        """
+        Draw button ke surface
+        Args:
+            surface: Surface tujuan
+            offset: Posisi top-left surface dalam koordinat layar
+        Returns:
+            Rect area yang digambar (koordinat surface)
+        """
+        rect = self.rect.move(-offset[0], -offset[1])
         color = self.hover_color if self.is_hovered else self.color
-        pygame.draw.rect(surface, color, self.rect)
-        pygame.draw.rect(surface, (100, 100, 100), self.rect, 2)
+        pygame.draw.rect(surface, color, rect)
+        pygame.draw.rect(surface, (100, 100, 100), rect, 2)
         
         # Draw text centered
         text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=rect.center)
+        return rect.union(surface.blit(text_surface, text_rect))
 
 
 class Slider:
@@ -86,6 +130,11 @@ class Slider:
         self.is_dragging = False
         self.knob_radius = 8
     
+    @property
+    def hit_rect(self) -> pygame.Rect:
+        """Area yang bisa menerima event mouse (track + knob di kedua ujung)"""
+        return self.rect.inflate((self.knob_radius + 5) * 2, 10)
+    
     def get_normalized_value(self) -> float:
         """Get value normalized ke 0-1"""
         if self.max_val == self.min_val:
@@ -135,16 +184,29 @@ class Slider:
         
         return False
     
-    def draw(self, surface: pygame.Surface):
-        """Draw slider ke surface"""
+    def render_key(self):
+        """State visual slider; slider digambar ulang hanya jika berubah"""
+        return (self.value, self.label)
+    
+    def draw(self, surface: pygame.Surface, offset=(0, 0)) -> pygame.Rect:
+        """
+        Draw slider ke surface
+        Args:
+            surface: Surface tujuan
+            offset: Posisi top-left surface dalam koordinat layar
+        Returns:
+            Rect area yang digambar (koordinat surface)
+        """
+        rect = self.rect.move(-offset[0], -offset[1])
         # Draw track
-        pygame.draw.rect(surface, (150, 150, 150), self.rect)
-        pygame.draw.rect(surface, (100, 100, 100), self.rect, 1)
+        painted = pygame.draw.rect(surface, (150, 150, 150), rect)
+        pygame.draw.rect(surface, (100, 100, 100), rect, 1)
         
         # Draw knob
-        knob_x = self.rect.x + self.get_normalized_value() * self.rect.width
-        knob_y = self.rect.centery
-        pygame.draw.circle(surface, (50, 50, 50), (int(knob_x), knob_y), self.knob_radius)
+        knob_x = rect.x + self.get_normalized_value() * rect.width
+        knob_y = rect.centery
+        painted = painted.union(
+            pygame.draw.circle(surface, (50, 50, 50), (int(knob_x), knob_y), self.knob_radius))
         pygame.draw.circle(surface, (200, 200, 200), (int(knob_x), knob_y), self.knob_radius - 2)
         
         # Draw label and value
@@ -153,12 +215,13 @@ class Slider:
             text_surface = self.font.render(label_text, True, (0, 0, 0))
             text_rect = text_surface.get_rect()
             # Draw label centered above the slider to avoid vertical overlap
-            label_x = self.rect.x + (self.rect.width - text_rect.width) // 2
-            label_y = self.rect.y - text_rect.height - 6
+            label_x = rect.x + (rect.width - text_rect.width) // 2
+            label_y = rect.y - text_rect.height - 6
             # If there's no room above (rare inside small panels), clamp
             if label_y < 0:
-                label_y = self.rect.y - text_rect.height
-            surface.blit(text_surface, (label_x, label_y))
+                label_y = rect.y - text_rect.height
+            painted = painted.union(surface.blit(text_surface, (label_x, label_y)))
+        return painted
 
 
 class TextLabel:
@@ -185,10 +248,21 @@ class TextLabel:
         """Update teks label"""
         self.text = text
     
-    def draw(self, surface: pygame.Surface):
-        """Draw label ke surface"""
+    def render_key(self):
+        """State visual label; label digambar ulang hanya jika berubah"""
+        return (self.text, self.color, self.bg_color)
+    
+    def draw(self, surface: pygame.Surface, offset=(0, 0)) -> pygame.Rect:
+        """
+        Draw label ke surface
+        Args:
+            surface: Surface tujuan
+            offset: Posisi top-left surface dalam koordinat layar
+        Returns:
+            Rect area yang digambar (koordinat surface)
+        """
         text_surface = self.font.render(self.text, True, self.color, self.bg_color)
-        surface.blit(text_surface, (self.x, self.y))
+        return surface.blit(text_surface, (self.x - offset[0], self.y - offset[1]))
 
 
 class ControlPanel:
@@ -277,6 +351,22 @@ class ControlPanel:
         self.matrix_label = TextLabel(x + 20, button_y + 120, "", 
                           font_size=16, color=(100, 100, 100))
         
+        # Index hit-test: widget per baris (bucket y) dan widget yang sedang di-drag
+        self._widgets = [
+            self.zoom_slider, self.translate_x_slider, self.translate_y_slider,
+            self.rotate_slider, self.scale_x_slider, self.scale_y_slider,
+            self.reset_button, self.reset_center_button, self.reset_camera_button,
+        ]
+        self._hit_index = self._build_hit_index(self._widgets)
+        self._captured = None
+        self._hovered = None
+        
+        # Surface panel yang di-cache; per widget disimpan render key dan area
+        # yang terakhir digambar sehingga hanya widget yang berubah digambar ulang
+        self._drawables = [self.title_label] + self._widgets + [self.matrix_label]
+        self._surface: Optional[pygame.Surface] = None
+        self._render_state = {}
+        
         # Callback untuk perubahan transformasi
         self.on_transform_changed: Optional[Callable] = None
         self.on_zoom_changed: Optional[Callable] = None
@@ -341,41 +431,118 @@ class ControlPanel:
         self.transform.pivot_y = pivot_y
         return self.transform.get_matrix()
     
-    def handle_event(self, event: pygame.event.Event):
-        """Handle pygame event untuk semua controls"""
-        self.zoom_slider.handle_event(event)
-        self.translate_x_slider.handle_event(event)
-        self.translate_y_slider.handle_event(event)
-        self.rotate_slider.handle_event(event)
-        self.scale_x_slider.handle_event(event)
-        self.scale_y_slider.handle_event(event)
-        self.reset_button.handle_event(event)
-        self.reset_center_button.handle_event(event)
-        self.reset_camera_button.handle_event(event)
+    @staticmethod
+    def _build_hit_index(widgets):
+        """Kelompokkan widget per baris setinggi _HIT_ROW pixel"""
+        index = {}
+        for widget in widgets:
+            rect = widget.hit_rect
+            for row in range(rect.top // _HIT_ROW, (rect.bottom - 1) // _HIT_ROW + 1):
+                index.setdefault(row, []).append(widget)
+        return index
     
-    def draw(self, surface: pygame.Surface):
-        """Draw panel dan semua controls"""
-        # Draw panel background
-        pygame.draw.rect(surface, self.bg_color, self.rect)
-        pygame.draw.rect(surface, self.border_color, self.rect, 2)
+    @property
+    def is_dragging(self) -> bool:
+        """True selama ada slider yang sedang di-drag"""
+        return self._captured is not None
+    
+    def widget_at(self, pos):
+        """Widget yang berada di bawah posisi mouse (atau None)"""
+        for widget in self._hit_index.get(pos[1] // _HIT_ROW, ()):
+            if widget.hit_rect.collidepoint(pos):
+                return widget
+        return None
+    
+    def _set_hovered(self, widget):
+        """Update hover hanya untuk button lama dan baru"""
+        if widget is self._hovered:
+            return
+        if self._hovered is not None:
+            self._hovered.is_hovered = False
+        if widget is not None:
+            widget.is_hovered = True
+        self._hovered = widget
+    
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Handle pygame event untuk controls
+        Event hanya diteruskan ke widget di bawah cursor, atau ke slider yang
+        sedang di-drag (capture) sampai mouse dilepas
+        Returns:
+            True jika event handled oleh salah satu widget
+        """
+        if event.type == pygame.MOUSEMOTION:
+            if self._captured is not None:
+                return self._captured.handle_event(event)
+            widget = self.widget_at(event.pos)
+            self._set_hovered(widget if isinstance(widget, Button) else None)
+            return False
         
-        # Draw title
-        self.title_label.draw(surface)
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            widget = self.widget_at(event.pos)
+            if widget is None:
+                return False
+            handled = widget.handle_event(event)
+            if isinstance(widget, Slider) and widget.is_dragging:
+                self._captured = widget
+            return handled
         
-        # Draw zoom slider (camera control)
-        self.zoom_slider.draw(surface)
+        if event.type == pygame.MOUSEBUTTONUP and self._captured is not None:
+            if event.button == 1:
+                self._captured.handle_event(event)
+                self._captured = None
+            return True
         
-        # Draw transform sliders
-        self.translate_x_slider.draw(surface)
-        self.translate_y_slider.draw(surface)
-        self.rotate_slider.draw(surface)
-        self.scale_x_slider.draw(surface)
-        self.scale_y_slider.draw(surface)
+        return False
+    
+    def invalidate(self):
+        """Paksa seluruh panel digambar ulang pada draw berikutnya"""
+        self._surface = None
+    
+    def _repaint_all(self):
+        """Gambar background, border dan semua widget ke surface cache"""
+        self._surface = pygame.Surface(self.rect.size)
+        local_rect = self._surface.get_rect()
+        pygame.draw.rect(self._surface, self.bg_color, local_rect)
+        pygame.draw.rect(self._surface, self.border_color, local_rect, 2)
+        self._render_state = {}
+        for widget in self._drawables:
+            painted = widget.draw(self._surface, self.rect.topleft)
+            self._render_state[id(widget)] = (widget.render_key(), painted)
+    
+    def _repaint_dirty(self) -> int:
+        """
+        Gambar ulang widget yang render key-nya berubah
+        Returns:
+            Jumlah widget yang digambar ulang
+        """
+        dirty = [widget for widget in self._drawables
+                 if widget.render_key() != self._render_state[id(widget)][0]]
+        if not dirty:
+            return 0
         
-        # Draw buttons
-        self.reset_button.draw(surface)
-        self.reset_center_button.draw(surface)
-        self.reset_camera_button.draw(surface)
+        # Hapus area lama; widget lain yang beririsan dengan area itu ikut digambar ulang
+        interior = self._surface.get_rect().inflate(-4, -4)
+        cleared = [self._render_state[id(widget)][1].clip(interior) for widget in dirty]
+        for rect in cleared:
+            self._surface.fill(self.bg_color, rect)
+        for widget in self._drawables:
+            if widget not in dirty and self._render_state[id(widget)][1].collidelist(cleared) != -1:
+                dirty.append(widget)
         
-        # Draw matrix label
-        self.matrix_label.draw(surface)
+        for widget in self._drawables:
+            if widget in dirty:
+                painted = widget.draw(self._surface, self.rect.topleft)
+                self._render_state[id(widget)] = (widget.render_key(), painted)
+        return len(dirty)
+    
+    def draw(self, surface: pygame.Surface):
+        """
+        Draw panel dan semua controls
+        Panel disimpan di surface cache: pada frame tanpa perubahan cukup satu blit
+        """
+        if self._surface is None:
+            self._repaint_all()
+        else:
+            self._repaint_dirty()
+        surface.blit(self._surface, self.rect.topleft)
@@ -0,0 +1,203 @@
+"""
+Test untuk export scene
+Unit tests untuk export_svg, PNGStreamWriter dan export_png
+"""
+
+import sys
+import os
+import base64
+import io
+import xml.etree.ElementTree as ET
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+from PIL import Image
+
+from src.export import PNGStreamWriter, export_png, export_svg
+from src.graphics import Rectangle, Line
+from src.imaging import ImageShape
+from src.instancing import SharedGeometry, InstanceBatch
+from src.matrix import TransformationMatrix, build_matrix_stack
+from src.render import RenderQueue
+from src.scene import generate_scene
+
+SVG = '{http://www.w3.org/2000/svg}'
+
+
+def _render_surface(shapes, width, height, view_matrix=None, background=(255, 255, 255)):
+    """Render referensi ke satu surface penuh"""
+    surface = pygame.Surface((width, height))
+    surface.fill(background)
+    queue = RenderQueue()
+    for shape in shapes:
+        shape.submit(queue, surface, view_matrix=view_matrix)
+    queue.flush(surface)
+    return np.frombuffer(pygame.image.tobytes(surface, 'RGB'), dtype=np.uint8).reshape(height, width, 3)
+
+
+def _grid_batch(columns, rows, spacing=10.0, size=6.0):
+    """InstanceBatch berisi kotak filled di grid"""
+    geometry = SharedGeometry([(-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5)], fill=True)
+    xs, ys = np.meshgrid(np.arange(columns) * spacing + spacing / 2,
+                         np.arange(rows) * spacing + spacing / 2)
+    count = columns * rows
+    matrices = build_matrix_stack(xs.ravel(), ys.ravel(), np.zeros(count),
+                                  np.full(count, size), np.full(count, size))
+    batch = InstanceBatch()
+    batch.add_many(geometry, matrices, (200, 30, 30))
+    return batch
+
+
+class TestExportSVG:
+    """Test class untuk export_svg"""
+
+    def test_valid_document(self):
+        """SVG bisa di-parse dan berisi satu elemen per shape"""
+        shapes = [Rectangle(10, 10, 50, 30, (255, 0, 0), True),
+                  Rectangle(100, 100, 20, 20, (0, 128, 255), False),
+                  Line(0, 0, 50, 50, (0, 0, 0))]
+        out = io.StringIO()
+        written = export_svg(out, shapes, 200, 200)
+        assert written == 3
+        root = ET.fromstring(out.getvalue())
+        assert root.get('viewBox') == '0 0 200 200'
+        polygons = root.findall(f'{SVG}polygon')
+        assert [p.get('fill') for p in polygons] == ['#ff0000', 'none']
+        assert polygons[1].get('stroke') == '#0080ff'
+        assert len(root.findall(f'{SVG}polyline')) == 1
+        assert root.find(f'{SVG}rect').get('fill') == '#ffffff'
+
+    def test_camera_and_culling(self, tmp_path):
+        """View matrix diterapkan dan shape di luar dokumen di-skip"""
+        shapes = [Rectangle(0, 0, 10, 10, (0, 0, 0), True),
+                  Rectangle(500, 500, 10, 10, (0, 0, 0), True)]
+        view = TransformationMatrix().translate(20, 30)
+        path = tmp_path / 'scene.svg'
+        assert export_svg(str(path), shapes, 100, 100, view) == 1
+        polygon = ET.parse(path).getroot().find(f'{SVG}polygon')
+        points = [tuple(map(float, p.split(','))) for p in polygon.get('points').split()]
+        assert points[0] == (20.0, 30.0)
+
+    def test_line_thickness(self):
+        """Line memakai thickness-nya sendiri, juga untuk culling di tepi dokumen"""
+        shapes = [Line(0, 50, 100, 50, (0, 0, 0), thickness=8),
+                  Line(0, -6, 100, -6, (0, 0, 0), thickness=16),
+                  Rectangle(10, 10, 20, 20, (0, 0, 0), False)]
+        out = io.StringIO()
+        assert export_svg(out, shapes, 100, 100) == 3
+        root = ET.fromstring(out.getvalue())
+        assert [p.get('stroke-width') for p in root.findall(f'{SVG}polyline')] == ['8', '16']
+        assert root.find(f'{SVG}polygon').get('stroke-width') == '2'
+
+    def test_instanced_chunks(self):
+        """Instance ditulis per potongan; jumlahnya tidak bergantung chunk_size"""
+        batch = _grid_batch(20, 15)
+        counts = []
+        for chunk_size in (7, 1000):
+            out = io.StringIO()
+            counts.append(export_svg(out, [], 200, 150, instance_batch=batch,
+                                     chunk_size=chunk_size, background=None))
+            root = ET.fromstring(out.getvalue())
+            assert len(root.findall(f'{SVG}polygon')) == counts[-1]
+        assert counts == [300, 300]
+
+    def test_image_embedded(self):
+        """ImageShape ditulis sebagai <image> berisi pixels asli dan matrix layar"""
+        pixels = np.random.default_rng(5).integers(0, 256, size=(6, 8, 3), dtype=np.uint8)
+        image = ImageShape(10, 20, pixels, width=16, height=12, interpolation='nearest')
+        image.apply_transform(TransformationMatrix().rotate(90, 10, 20))
+        view = TransformationMatrix().translate(50, 10)
+        out = io.StringIO()
+        assert export_svg(out, [Rectangle(0, 0, 5, 5), image], 100, 100, view) == 2
+        root = ET.fromstring(out.getvalue())
+        assert len(root.findall(f'{SVG}polygon')) == 1
+        element = root.find(f'{SVG}image')
+        assert (element.get('width'), element.get('height')) == ('8', '6')
+        header, data = element.get('href').split(',', 1)
+        assert header == 'data:image/png;base64'
+        embedded = Image.open(io.BytesIO(base64.b64decode(data)))
+        assert embedded.mode == 'RGBA'
+        assert np.array_equal(np.asarray(embedded)[..., :3], pixels)
+        # Corner pixel (8, 6) image jatuh di vertex layar shape yang sama
+        a, b, c, d, e, f = map(float, element.get('transform')[len('matrix('):-1].split())
+        corner = (a * 8 + c * 6 + e, b * 8 + d * 6 + f)
+        assert corner == pytest.approx(tuple(image.get_screen_vertices(view)[2]))
+
+
+class TestPNGStreamWriter:
+    """Test class untuk encoder PNG bertahap"""
+
+    def test_round_trip(self):
+        """Pixel yang ditulis per strip terbaca sama persis oleh Pillow"""
+        pixels = np.random.default_rng(3).integers(0, 256, size=(37, 23, 3), dtype=np.uint8)
+        out = io.BytesIO()
+        writer = PNGStreamWriter(out, 23, 37)
+        for top in range(0, 37, 10):
+            writer.write_rows(pixels[top:top + 10])
+        writer.close()
+        image = Image.open(io.BytesIO(out.getvalue()))
+        assert image.mode == 'RGB' and image.size == (23, 37)
+        assert np.array_equal(np.asarray(image), pixels)
+
+    def test_rgba_round_trip(self):
+        """Mode RGBA menyimpan alpha"""
+        pixels = np.random.default_rng(4).integers(0, 256, size=(9, 5, 4), dtype=np.uint8)
+        out = io.BytesIO()
+        writer = PNGStreamWriter(out, 5, 9, channels=4)
+        writer.write_rows(pixels)
+        writer.close()
+        image = Image.open(io.BytesIO(out.getvalue()))
+        assert image.mode == 'RGBA'
+        assert np.array_equal(np.asarray(image), pixels)
+
+    def test_row_count_checked(self):
+        """Jumlah baris yang salah ditolak"""
+        writer = PNGStreamWriter(io.BytesIO(), 4, 4)
+        with pytest.raises(ValueError):
+            writer.write_rows(np.zeros((5, 4, 3), dtype=np.uint8))
+        writer.write_rows(np.zeros((2, 4, 3), dtype=np.uint8))
+        with pytest.raises(ValueError):
+            writer.close()
+
+
+class TestExportPNG:
+    """Test class untuk export_png"""
+
+    def test_matches_single_surface(self):
+        """Hasil per strip sama dengan render ke satu surface (shape filled)"""
+        shapes = [shape for shape in generate_scene(200, seed=2, extent=300) if shape.fill]
+        view = TransformationMatrix().translate(320, 240)
+        out = io.BytesIO()
+        strips = export_png(out, shapes, 640, 480, view, strip_height=64)
+        assert strips == 8
+        image = np.asarray(Image.open(io.BytesIO(out.getvalue())))
+        assert np.array_equal(image, _render_surface(shapes, 640, 480, view))
+
+    def test_outlines_close_to_single_surface(self):
+        """Outline yang terpotong batas strip berbeda paling banyak beberapa pixel"""
+        shapes = generate_scene(200, seed=2, extent=300)
+        view = TransformationMatrix().translate(320, 240)
+        out = io.BytesIO()
+        export_png(out, shapes, 640, 480, view, strip_height=50)
+        image = np.asarray(Image.open(io.BytesIO(out.getvalue())))
+        different = (image != _render_surface(shapes, 640, 480, view)).any(axis=2)
+        assert different.mean() < 0.005
+
+    def test_instanced_and_shapes(self, tmp_path):
+        """Instance digambar di belakang shapes, background di luar keduanya"""
+        batch = _grid_batch(10, 10)
+        shapes = [Rectangle(40, 40, 20, 20, (0, 0, 255), True)]
+        path = tmp_path / 'scene.png'
+        export_png(str(path), shapes, 100, 100, instance_batch=batch,
+                   background=(0, 255, 0), strip_height=32, chunk_size=16)
+        image = np.asarray(Image.open(path))
+        assert image.shape == (100, 100, 3)
+        assert tuple(image[5, 5]) == (200, 30, 30)
+        assert tuple(image[50, 50]) == (0, 0, 255)
+        assert tuple(image[0, 0]) == (0, 255, 0)
@@ -0,0 +1,293 @@
+"""
+Test untuk utilitas geometri
+Unit tests untuk convex hull dan bounding box
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from src.geometry import (
+    EMPTY_BOUNDS, convex_hull, bounds_of, bounds_intersect, bounds_contain_point,
+    clip_polygon, clip_segments, polygon_metrics, batch_polygon_metrics,
+    douglas_peucker_importance, simplify_polyline, PolylineLOD, triangulate, triangle_areas,
+    points_in_triangles, points_in_polygon, rasterize_triangles, distance_to_edges
+)
+
+
+class TestConvexHull:
+    """Test class untuk convex_hull"""
+
+    def test_square_with_interior_points(self):
+        """Titik interior dan kolinear dibuang"""
+        points = [(0, 0), (2, 0), (1, 0), (2, 2), (0, 2), (1, 1)]
+        hull = convex_hull(points)
+        assert sorted(map(tuple, hull.tolist())) == [(0, 0), (0, 2), (2, 0), (2, 2)]
+
+    def test_counter_clockwise(self):
+        """Hull berorientasi positif (luas bertanda > 0)"""
+        rng = np.random.default_rng(1)
+        hull = convex_hull(rng.uniform(-1, 1, size=(200, 2)))
+        x, y = hull[:, 0], hull[:, 1]
+        assert np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)) > 0
+
+    def test_degenerate(self):
+        """Kurang dari tiga titik unik dikembalikan apa adanya"""
+        assert len(convex_hull([(1, 1), (1, 1)])) == 1
+        assert len(convex_hull(np.empty((0, 2)))) == 0
+
+
+class TestBounds:
+    """Test class untuk helper bounding box"""
+
+    def test_bounds_of(self):
+        """Bounds dari titik dan dari input kosong"""
+        assert bounds_of([(1, 5), (-2, 3)]) == (-2, 3, 1, 5)
+        assert bounds_of(np.empty((0, 2))) == EMPTY_BOUNDS
+
+    def test_intersect_and_contain(self):
+        """Irisan bounds dan point containment"""
+        assert bounds_intersect((0, 0, 10, 10), (10, 10, 20, 20))
+        assert not bounds_intersect((0, 0, 10, 10), (11, 0, 20, 10))
+        assert not bounds_intersect(EMPTY_BOUNDS, (0, 0, 10, 10))
+        assert bounds_contain_point((0, 0, 10, 10), 5, 10)
+        assert not bounds_contain_point((0, 0, 10, 10), 5, 11)
+
+
+class TestClipping:
+    """Test class untuk clip_polygon dan clip_segments"""
+
+    @staticmethod
+    def _area(polygon):
+        x, y = polygon[:, 0], polygon[:, 1]
+        return abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))) / 2
+
+    def test_polygon_inside_unchanged(self):
+        """Polygon di dalam rectangle tidak berubah"""
+        square = np.array([(1, 1), (4, 1), (4, 4), (1, 4)], dtype=float)
+        assert np.array_equal(clip_polygon(square, (0, 0, 10, 10)), square)
+
+    def test_polygon_clipped_to_rect(self):
+        """Polygon besar di-clip menjadi rectangle itu sendiri"""
+        huge = [(-1e6, -1e6), (1e6, -1e6), (1e6, 1e6), (-1e6, 1e6)]
+        clipped = clip_polygon(huge, (0, 0, 10, 20))
+        assert bounds_of(clipped) == (0, 0, 10, 20)
+        assert self._area(clipped) == 200
+
+    def test_polygon_partial(self):
+        """Segitiga yang memotong sisi rectangle mempertahankan luas irisannya"""
+        clipped = clip_polygon([(-10, 0), (10, 0), (0, 10)], (0, 0, 10, 10))
+        assert np.isclose(self._area(clipped), 50)
+        assert len(clip_polygon([(20, 20), (30, 20), (25, 30)], (0, 0, 10, 10))) == 0
+
+    def test_segments(self):
+        """Segment dipotong di sisi rectangle, segment di luar disembunyikan"""
+        starts, ends, visible = clip_segments(
+            [(-5, 5), (20, 20), (5, 5), (5, -5)], [(15, 5), (30, 30), (6, 6), (5, 5)],
+            (0, 0, 10, 10))
+        assert visible.tolist() == [True, False, True, True]
+        assert np.allclose(starts[0], (0, 5)) and np.allclose(ends[0], (10, 5))
+        assert np.allclose(starts[3], (5, 0)) and np.allclose(ends[3], (5, 5))
+
+
+class TestPolygonMetrics:
+    """Test class untuk area, centroid dan keliling polygon"""
+
+    def test_square(self):
+        """Square: area positif (CCW), centroid di tengah, keliling 4 sisi"""
+        metrics = polygon_metrics([(0, 0), (10, 0), (10, 10), (0, 10)])
+        assert metrics.area == 100
+        assert metrics.centroid == (5, 5)
+        assert metrics.perimeter == 40
+        assert metrics.bounds == (0, 0, 10, 10)
+
+    def test_signed_area_orientation(self):
+        """Urutan searah jarum jam menghasilkan area negatif, centroid sama"""
+        metrics = polygon_metrics([(0, 0), (0, 10), (10, 10), (10, 0)])
+        assert metrics.area == -100
+        assert metrics.centroid == (5, 5)
+
+    def test_area_weighted_centroid(self):
+        """Centroid berbobot area berbeda dari rata-rata vertex"""
+        # L-shape: vertex rata-rata tidak berada di pusat massa
+        points = [(0, 0), (20, 0), (20, 10), (10, 10), (10, 30), (0, 30)]
+        metrics = polygon_metrics(points)
+        assert metrics.area == 400
+        assert np.allclose(metrics.centroid, (7.5, 12.5))
+        assert not np.allclose(metrics.centroid, np.mean(points, axis=0))
+
+    def test_degenerate_falls_back_to_mean(self):
+        """Garis dan titik kolinear: area nol, centroid = rata-rata vertex"""
+        line = polygon_metrics([(0, 0), (3, 4)])
+        assert line.area == 0 and line.centroid == (1.5, 2) and line.perimeter == 5
+        collinear = polygon_metrics([(0, 0), (1, 1), (4, 4)])
+        assert collinear.area == 0
+        assert np.allclose(collinear.centroid, (5 / 3, 5 / 3))
+        empty = polygon_metrics(np.empty((0, 2)))
+        assert empty.area == 0 and empty.bounds == EMPTY_BOUNDS
+
+    def test_far_from_origin(self):
+        """Presisi tetap terjaga untuk polygon jauh dari origin"""
+        metrics = polygon_metrics([(1e9, 1e9), (1e9 + 1, 1e9), (1e9 + 1, 1e9 + 1), (1e9, 1e9 + 1)])
+        assert np.isclose(metrics.area, 1)
+        assert np.allclose(metrics.centroid, (1e9 + 0.5, 1e9 + 0.5), rtol=0, atol=1e-6)
+
+    def test_batch_matches_single(self):
+        """batch_polygon_metrics sama dengan polygon_metrics per polygon"""
+        rng = np.random.default_rng(0)
+        polygons = [rng.uniform(-50, 50, size=(n, 2)) for n in (3, 4, 7, 2, 1, 0, 12)]
+        polygons.append([(0, 0), (1, 1), (2, 2)])
+        areas, centroids, perimeters, bounds = batch_polygon_metrics(polygons)
+        for i, polygon in enumerate(polygons):
+            metrics = polygon_metrics(polygon)
+            assert np.isclose(areas[i], metrics.area)
+            assert np.allclose(centroids[i], metrics.centroid)
+            assert np.isclose(perimeters[i], metrics.perimeter)
+            assert tuple(bounds[i]) == metrics.bounds
+
+    def test_batch_empty(self):
+        """Tanpa polygon menghasilkan array kosong"""
+        areas, centroids, perimeters, bounds = batch_polygon_metrics([])
+        assert areas.shape == (0,) and centroids.shape == (0, 2) and bounds.shape == (0, 4)
+
+
+def _max_deviation(points, simplified):
+    """Jarak terjauh vertex asli ke polygon hasil simplifikasi (brute force)"""
+    starts = simplified
+    ends = np.roll(simplified, -1, axis=0)
+    chord = ends - starts
+    length2 = np.maximum((chord ** 2).sum(axis=1), 1e-300)
+    offset = points[:, None, :] - starts[None]
+    t = np.clip((offset * chord[None]).sum(axis=2) / length2, 0, 1)
+    distance = np.hypot(*(offset - t[..., None] * chord[None]).transpose(2, 0, 1))
+    return distance.min(axis=1).max()
+
+
+class TestSimplification:
+    """Test class untuk Douglas-Peucker dan PolylineLOD"""
+
+    @staticmethod
+    def _wobbly_circle(count=2000):
+        angles = np.linspace(0, 2 * np.pi, count, endpoint=False)
+        radius = 100 + 3 * np.sin(angles * 17) + np.random.default_rng(1).normal(0, 0.2, count)
+        return np.column_stack((radius * np.cos(angles), radius * np.sin(angles)))
+
+    def test_straight_line_keeps_endpoints(self):
+        """Vertex kolinear di tengah polyline terbuka dihapus"""
+        points = np.column_stack((np.arange(10.0), 2 * np.arange(10.0)))
+        simplified = simplify_polyline(points, 0.01, closed=False)
+        assert np.array_equal(simplified, points[[0, -1]])
+
+    def test_deviation_within_tolerance(self):
+        """Semua vertex asli berada dalam toleransi dari hasil simplifikasi"""
+        points = self._wobbly_circle()
+        for tolerance in (0.1, 1.0, 5.0):
+            simplified = simplify_polyline(points, tolerance)
+            assert len(simplified) < len(points)
+            assert _max_deviation(points, simplified) <= tolerance + 1e-9
+
+    def test_importance_nested(self):
+        """Toleransi lebih besar menghasilkan subset dari toleransi lebih kecil"""
+        points = self._wobbly_circle()
+        importance = douglas_peucker_importance(points)
+        fine = set(np.flatnonzero(importance > 0.5))
+        coarse = set(np.flatnonzero(importance > 2.0))
+        assert coarse < fine
+
+    def test_lod_levels(self):
+        """Level makin kasar makin sedikit vertex, minimal 3 untuk polygon"""
+        lod = PolylineLOD(self._wobbly_circle(), level_count=12)
+        counts = [len(lod.vertices(level)) for level in range(len(lod))]
+        assert len(counts) == 13
+        assert counts == sorted(counts, reverse=True)
+        assert counts[-1] == 3
+
+    def test_level_for(self):
+        """Toleransi di bawah level terhalus memakai vertex asli"""
+        lod = PolylineLOD(self._wobbly_circle(), level_count=8)
+        assert lod.level_for(lod.base_tolerance / 2) is None
+        assert lod.level_for(lod.base_tolerance) == 0
+        assert lod.level_for(lod.base_tolerance * 5) == 2
+        assert lod.level_for(1e9) == 8
+        assert PolylineLOD([(1, 1), (1, 1), (1, 1)]).level_for(1.0) is None
+
+
+class TestTriangulation:
+    """Test class untuk ear clipping, point-in-triangle dan rasterizer"""
+
+    L_SHAPE = [(0, 0), (20, 0), (20, 10), (10, 10), (10, 30), (0, 30)]
+
+    @staticmethod
+    def _assert_valid(points, triangles):
+        """N - 2 segitiga yang luasnya berjumlah luas polygon (tanpa tumpang tindih)"""
+        assert len(triangles) == len(points) - 2
+        assert np.isclose(triangle_areas(points, triangles).sum(),
+                          abs(polygon_metrics(points).area))
+
+    def test_convex_and_concave(self):
+        """Polygon convex dan concave dalam dua orientasi"""
+        for points in ([(0, 0), (10, 0), (10, 10), (0, 10)], self.L_SHAPE, self.L_SHAPE[::-1]):
+            self._assert_valid(np.array(points, dtype=float), triangulate(points))
+
+    def test_random_star_polygons(self):
+        """Polygon bintang acak (sangat concave) tetap valid"""
+        rng = np.random.default_rng(2)
+        for count in (5, 17, 60, 400):
+            angles = np.sort(rng.uniform(0, 2 * np.pi, count))
+            radii = rng.uniform(0.2, 1.0, count)
+            points = np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
+            self._assert_valid(points, triangulate(points))
+
+    def test_collinear_vertices(self):
+        """Vertex kolinear di sisi polygon tidak merusak triangulasi"""
+        points = np.array([(0, 0), (5, 0), (10, 0), (10, 10), (5, 10), (0, 10)], dtype=float)
+        self._assert_valid(points, triangulate(points))
+
+    def test_degenerate(self):
+        """Polygon tanpa area tidak menghasilkan segitiga"""
+        assert triangulate([(0, 0), (1, 1)]).shape == (0, 3)
+        assert triangulate([(0, 0), (1, 1), (2, 2)]).shape == (0, 3)
+
+    def test_points_in_triangles(self):
+        """Titik di notch L-shape berada di luar walau masuk bounding box"""
+        triangles = triangulate(self.L_SHAPE)
+        inside = points_in_triangles(self.L_SHAPE, triangles,
+                                     [(5, 5), (15, 5), (5, 25), (15, 20), (20, 10), (-1, 5)])
+        assert inside.tolist() == [True, True, True, False, True, False]
+
+    def test_points_in_polygon_matches_triangles(self):
+        """Crossing number sama dengan tes segitiga untuk polygon bintang acak"""
+        rng = np.random.default_rng(4)
+        count = 300
+        angles = np.linspace(0, 2 * np.pi, count, endpoint=False)
+        radii = rng.uniform(0.2, 1.0, count)
+        points = np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
+        queries = rng.uniform(-1, 1, size=(500, 2))
+        expected = points_in_triangles(points, triangulate(points), queries)
+        assert np.array_equal(points_in_polygon(points, queries), expected)
+        assert points_in_polygon(self.L_SHAPE, [(5, 25), (15, 20)]).tolist() == [True, False]
+        assert not points_in_polygon([(0, 0), (1, 1)], [(0.5, 0.5)]).any()
+
+    def test_rasterize_square(self):
+        """Square 10x10 menutup tepat 100 pixel"""
+        points = [(2, 3), (12, 3), (12, 13), (2, 13)]
+        mask = rasterize_triangles(points, triangulate(points), 20, 20)
+        assert mask.sum() == 100
+        assert mask[3:13, 2:12].all()
+
+    def test_rasterize_concave_area(self):
+        """Jumlah pixel L-shape sama dengan luasnya, bagian luar surface dipotong"""
+        points = np.array(self.L_SHAPE, dtype=float)
+        assert rasterize_triangles(points, triangulate(points), 40, 40).sum() == 400
+        assert rasterize_triangles(points - 5, triangulate(points), 40, 40).sum() == 15 * 5 + 5 * 20
+
+    def test_distance_to_edges(self):
+        """Jarak ke edge polygon dan polyline terbuka"""
+        square = [(0, 0), (10, 0), (10, 10), (0, 10)]
+        assert distance_to_edges(square, 5, 5) == 5
+        assert distance_to_edges(square, 13, 14) == 5
+        assert distance_to_edges([(0, 0), (10, 0)], 5, 3, closed=False) == 3
@@ -0,0 +1,371 @@
+"""
+Test untuk objek grafis 2D
+Unit tests untuk Point2D dan Shape2D
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pygame
+import pytest
+
+from src.matrix import TransformationMatrix, precision_scope
+from src.graphics import Point2D, Shape2D, Rectangle, Circle, Line, Polygon, Grid, compute_metrics
+from src.render import RenderQueue
+
+
+class TestPoint2D:
+    """Test class untuk Point2D"""
+
+    def test_slots(self):
+        """Point2D tidak punya __dict__ per instance"""
+        point = Point2D(1, 2)
+        assert not hasattr(point, '__dict__')
+        with pytest.raises(AttributeError):
+            point.z = 3
+
+    def test_transform(self):
+        """API Point2D tetap sama"""
+        point = Point2D(1, 2).transform(TransformationMatrix().translate(10, 20))
+        assert point.to_tuple() == (11, 22)
+
+
+class TestShape2D:
+    """Test class untuk Shape2D"""
+
+    def test_vertices_array(self):
+        """Original points disimpan sebagai array (N, 2)"""
+        rect = Rectangle(0, 0, 10, 20)
+        assert isinstance(rect.vertices, np.ndarray)
+        assert rect.vertices.shape == (4, 2)
+        assert [p.to_tuple() for p in rect.original_points][2] == (10, 20)
+
+    def test_apply_transform(self):
+        """Transformasi tidak membuat Point2D dan hasilnya benar"""
+        rect = Rectangle(0, 0, 10, 20)
+        rect.apply_transform(TransformationMatrix().translate(5, 5))
+        assert rect.get_points() == [(5, 5), (15, 5), (15, 25), (5, 25)]
+        assert rect.transformed_points[0].to_tuple() == (5, 5)
+
+        rect.reset_transform()
+        assert rect.get_points() == rect.get_points(transformed=False)
+
+    def test_transformed_points_setter(self):
+        """Setter transformed_points tetap menerima list Point2D"""
+        shape = Shape2D([(0, 0), (1, 0), (1, 1)])
+        shape.transformed_points = [Point2D(2, 2), Point2D(3, 2), Point2D(3, 3)]
+        assert shape.get_points() == [(2, 2), (3, 2), (3, 3)]
+
+    def test_original_points_compatibility(self):
+        """Mutasi original_points seperti list lama mengubah geometry"""
+        shape = Shape2D([(0, 0), (4, 0), (4, 4)])
+        version = shape.geometry_version
+        shape.original_points[1] = Point2D(8, 0)
+        shape.original_points.append((0, 4))
+        assert shape.get_points(transformed=False) == [(0, 0), (8, 0), (4, 4), (0, 4)]
+        assert shape.geometry_version > version
+        del shape.original_points[2]
+        assert len(shape.original_points) == 3 and shape.area == 16
+        shape.original_points = [Point2D(1, 1), Point2D(2, 1), Point2D(2, 2)]
+        assert [p.to_tuple() for p in shape.original_points] == [(1, 1), (2, 1), (2, 2)]
+        assert shape.center == pytest.approx((5 / 3, 4 / 3))
+        with pytest.raises(AttributeError):
+            shape.center = (0, 0)
+
+    def test_transformed_points_mutation(self):
+        """Item assignment pada transformed_points sama dengan setter"""
+        shape = Shape2D([(0, 0), (1, 0), (1, 1)])
+        shape.transformed_points[0] = Point2D(-1, -1)
+        assert shape.get_points() == [(-1, -1), (1, 0), (1, 1)]
+        shape.apply_transform(TransformationMatrix().translate(1, 0))
+        assert shape.get_points()[0] == (1, 0)
+
+    def test_float32_geometry(self):
+        """Shape yang dibuat dalam scope float32 memakai buffer float32"""
+        with precision_scope(np.float32):
+            rect = Rectangle(0, 0, 10, 20)
+        rect.apply_transform(TransformationMatrix().translate(5, 5))
+        assert rect.vertices.dtype == np.float32
+        assert rect.transformed_vertices.dtype == np.float32
+        assert rect.get_points()[2] == (15, 25)
+
+    def test_lazy_transform_cache(self):
+        """Transformed vertices dihitung lazy dan di-cache per versi matrix"""
+        rect = Rectangle(0, 0, 10, 20)
+        matrix = TransformationMatrix().translate(5, 5)
+        rect.apply_transform(matrix)
+        first = rect.transformed_vertices
+        assert rect.transformed_vertices is first
+
+        # Perubahan matrix membuat cache invalid
+        matrix.translate(1, 1)
+        assert rect.get_points()[0] == (6, 6)
+
+    def test_screen_cache_separate(self):
+        """Cache screen-space tidak menimpa cache world-space"""
+        rect = Rectangle(0, 0, 10, 20)
+        rect.apply_transform(TransformationMatrix().translate(5, 5))
+        world = rect.transformed_vertices
+        camera = TransformationMatrix().scale(2)
+        assert rect.get_points(view_matrix=camera)[0] == (10, 10)
+        assert rect.transformed_vertices is world
+        assert rect.get_screen_vertices(camera) is rect.get_screen_vertices(camera)
+
+    def test_set_points_bumps_version(self):
+        """Mengganti geometry membuat cache invalid"""
+        shape = Shape2D([(0, 0), (1, 0), (1, 1)])
+        version = shape.geometry_version
+        shape.get_points()
+        shape.set_points([(2, 2), (4, 2), (4, 4)])
+        assert shape.geometry_version == version + 1
+        assert shape.get_points() == [(2, 2), (4, 2), (4, 4)]
+
+
+class TestShapeBounds:
+    """Test class untuk hull dan bounding box shape"""
+
+    def test_local_bounds_and_hull(self):
+        """Hull dan bounds lokal dihitung dari original points"""
+        shape = Shape2D([(0, 0), (10, 0), (5, 2), (10, 10), (0, 10)])
+        assert shape.local_bounds == (0, 0, 10, 10)
+        assert len(shape.hull) == 4
+
+    def test_world_bounds_match_vertices(self):
+        """World bounds dari hull sama dengan bounds semua vertex"""
+        circle = Circle(20, 30, 15, segments=24)
+        circle.apply_transform(TransformationMatrix().rotate(37, 20, 30).scale(2, 0.5))
+        vertices = circle.transformed_vertices
+        assert np.allclose(circle.world_bounds, (*vertices.min(axis=0), *vertices.max(axis=0)))
+
+    def test_world_bounds_cached_per_version(self):
+        """Bounds dihitung ulang hanya saat matrix atau geometry berubah"""
+        rect = Rectangle(0, 0, 10, 20)
+        bounds = rect.world_bounds
+        assert rect.world_bounds is bounds
+        rect.transform_matrix.translate(5, 0)
+        assert rect.world_bounds == (5, 0, 15, 20)
+        rect.set_points([(0, 0), (1, 1)])
+        assert rect.world_bounds == (5, 0, 6, 1)
+
+    def test_culling(self):
+        """Shape di luar surface tidak digambar"""
+        surface = pygame.Surface((50, 50))
+        surface.fill((0, 0, 0))
+        rect = Rectangle(0, 0, 10, 10, color=(255, 0, 0))
+        camera = TransformationMatrix().translate(100, 100)
+        assert not rect.is_visible(surface, camera)
+        rect.draw(surface, view_matrix=camera)
+        assert surface.get_at((5, 5))[:3] == (0, 0, 0)
+        assert rect.is_visible(surface)
+        rect.draw(surface)
+        assert surface.get_at((5, 5))[:3] == (255, 0, 0)
+
+    def test_clipped_points_at_high_zoom(self):
+        """Saat zoom besar polygon yang diberikan ke pygame tetap di sekitar surface"""
+        surface = pygame.Surface((50, 40))
+        surface.fill((0, 0, 0))
+        circle = Circle(0, 0, 10, color=(0, 255, 0))
+        camera = TransformationMatrix().translate(25, 20).scale(1e5)
+        points = np.array(circle.get_clipped_points(surface, camera))
+        assert points.min() >= -10 and points.max() <= 60
+        circle.draw(surface, view_matrix=camera)
+        assert surface.get_at((0, 0))[:3] == (0, 255, 0)
+
+    def test_clipped_edges(self):
+        """Outline di-clip per edge, tanpa edge tambahan di tepi surface"""
+        surface = pygame.Surface((50, 50))
+        rect = Rectangle(-100, 10, 200, 20, fill=False)
+        edges = rect.get_clipped_edges(surface)
+        assert len(edges) == 2
+        assert all(-8 <= x <= 58 for edge in edges for x, _ in edge)
+
+
+class TestShapeMetrics:
+    """Test class untuk metrik shape yang di-cache"""
+
+    def test_center_is_centroid(self):
+        """get_center memakai centroid berbobot area"""
+        shape = Polygon([(0, 0), (20, 0), (20, 10), (10, 10), (10, 30), (0, 30)])
+        assert np.allclose(shape.get_center(), (7.5, 12.5))
+        assert shape.area == 400 and shape.perimeter == 100
+
+    def test_line_center_is_midpoint(self):
+        """Line tidak punya area, center = titik tengah"""
+        line = Line(0, 0, 10, 4)
+        assert line.get_center() == (5, 2)
+        assert line.area == 0
+
+    def test_metrics_cached_per_geometry(self):
+        """Metrics dihitung ulang hanya saat geometry berubah, bukan saat transform"""
+        rect = Rectangle(0, 0, 10, 20)
+        metrics = rect.metrics
+        rect.apply_transform(TransformationMatrix().rotate(30))
+        assert rect.metrics is metrics
+        rect.set_points([(0, 0), (4, 0), (4, 4), (0, 4)])
+        assert rect.metrics is not metrics
+        assert rect.get_center() == (2, 2)
+        assert rect.local_bounds == (0, 0, 4, 4)
+
+    def test_compute_metrics_fills_cache(self):
+        """Versi batch sama dengan metrics per shape dan mengisi cache"""
+        shapes = [Rectangle(0, 0, 10, 20), Circle(5, 5, 3, segments=12),
+                  Line(0, 0, 3, 4), Polygon([(0, 0), (6, 0), (0, 3)])]
+        cached = shapes[0].metrics
+        areas, centroids, perimeters, bounds = compute_metrics(shapes)
+        assert shapes[0].metrics is cached
+        for i, shape in enumerate(shapes):
+            assert np.isclose(areas[i], shape.area)
+            assert np.allclose(centroids[i], shape.get_center())
+            assert np.isclose(perimeters[i], shape.perimeter)
+            assert np.allclose(bounds[i], shape.local_bounds)
+        assert compute_metrics([])[1].shape == (0, 2)
+
+
+class TestShapeLOD:
+    """Test class untuk level simplifikasi saat rendering"""
+
+    @staticmethod
+    def _big_polygon(count=4000):
+        angles = np.linspace(0, 2 * np.pi, count, endpoint=False)
+        radius = 200 + 5 * np.sin(angles * 31)
+        return Polygon(np.column_stack((400 + radius * np.cos(angles),
+                                        300 + radius * np.sin(angles))).tolist())
+
+    def test_small_shape_uses_original_vertices(self):
+        """Shape dengan sedikit vertex tidak memakai LOD"""
+        assert Circle(0, 0, 10, segments=64).get_lod_level() is None
+
+    def test_level_follows_zoom(self):
+        """Zoom out memilih level lebih kasar, zoom in kembali ke detail penuh"""
+        shape = self._big_polygon()
+        far = TransformationMatrix().scale(0.05)
+        near = TransformationMatrix().scale(1000)
+        coarse, coarse_level = shape._render_vertices(far)
+        assert coarse_level is not None and len(coarse) < len(shape.vertices) / 10
+        full, full_level = shape._render_vertices(near)
+        assert full_level is None and len(full) == len(shape.vertices)
+
+    def test_shape_scale_counts(self):
+        """Scale transform shape ikut menentukan level, sama seperti zoom camera"""
+        shape = self._big_polygon()
+        level_at_zoom = shape.get_lod_level(TransformationMatrix().scale(0.1))
+        shape.apply_transform(TransformationMatrix().scale(0.1))
+        assert shape.get_lod_level() == level_at_zoom
+
+    def test_render_within_pixel_tolerance(self):
+        """Vertex yang digambar berada dalam toleransi pixel dari bentuk asli"""
+        shape = self._big_polygon()
+        view = TransformationMatrix().scale(0.5)
+        drawn, level = shape._render_vertices(view)
+        assert level is not None
+        original = view.apply_to_array(shape.vertices)
+        chord = np.roll(drawn, -1, axis=0) - drawn
+        offset = original[:, None, :] - drawn[None]
+        t = np.clip((offset * chord[None]).sum(axis=2) / (chord ** 2).sum(axis=1), 0, 1)
+        deviation = np.hypot(*(offset - t[..., None] * chord[None]).transpose(2, 0, 1))
+        assert deviation.min(axis=1).max() <= 0.5 + 1e-9
+
+    def test_lod_invalidated_by_geometry(self):
+        """LOD dihitung ulang saat geometry berubah"""
+        shape = self._big_polygon()
+        lod = shape.lod
+        shape.set_points(self._big_polygon(3000).vertices)
+        assert shape.lod is not lod
+        assert len(shape.lod.points) == 3000
+
+    def test_submit_draws_simplified(self):
+        """Submit shape besar tetap menggambar polygon"""
+        pygame.init()
+        surface = pygame.Surface((800, 600))
+        queue = RenderQueue()
+        shape = self._big_polygon()
+        shape.submit(queue, surface, view_matrix=TransformationMatrix().scale(0.2))
+        assert len(queue) == 1
+        assert queue.flush(surface) == 1
+
+
+class TestShapeTriangulation:
+    """Test class untuk triangulasi yang di-cache dan hit testing"""
+
+    @staticmethod
+    def _l_shape():
+        return Polygon([(0, 0), (20, 0), (20, 10), (10, 10), (10, 30), (0, 30)])
+
+    def test_triangles_cached_per_geometry(self):
+        """Index buffer dihitung sekali, tidak ikut berubah saat transform"""
+        shape = self._l_shape()
+        triangles = shape.triangles
+        shape.apply_transform(TransformationMatrix().rotate(45))
+        assert shape.triangles is triangles
+        assert np.isclose(shape.triangle_areas.sum(), 400)
+        shape.set_points([(0, 0), (4, 0), (4, 4), (0, 4)])
+        assert shape.triangles is not triangles and len(shape.triangles) == 2
+
+    def test_contains_point_concave(self):
+        """Titik di notch tidak kena walau berada di dalam bounding box"""
+        shape = self._l_shape()
+        assert shape.contains_point(5, 25)
+        assert not shape.contains_point(15, 20)
+        assert shape.contains_point(15, 20, tolerance=6)
+
+    def test_contains_point_transformed(self):
+        """Hit testing memakai vertex setelah transformasi"""
+        shape = self._l_shape()
+        shape.apply_transform(TransformationMatrix().translate(100, 0))
+        assert shape.contains_point(105, 25)
+        assert not shape.contains_point(5, 25)
+
+    def test_contains_point_huge_polygon(self):
+        """Polygon dengan vertex sangat banyak di-hit-test tanpa triangulasi"""
+        angles = np.linspace(0, 2 * np.pi, 20000, endpoint=False)
+        radii = 300 + 40 * np.sin(angles * 2500)
+        shape = Polygon(np.column_stack((radii * np.cos(angles), radii * np.sin(angles))))
+        assert shape.contains_point(0, 0)
+        assert shape.contains_point(200, 0)
+        assert not shape.contains_point(335, 335)
+        assert not shape.contains_point(0, 345)
+        assert shape.contains_point(0, 345, tolerance=6)
+        assert shape._triangle_cache[0] is None
+
+    def test_line_needs_tolerance(self):
+        """Line hanya bisa kena dengan toleransi jarak"""
+        line = Line(0, 0, 10, 0)
+        assert not line.contains_point(5, 0)
+        assert line.contains_point(5, 2, tolerance=3)
+        assert not line.contains_point(5, 4, tolerance=3)
+
+    def test_rasterize_matches_area(self):
+        """Rasterizer memakai triangulasi yang di-cache, jumlah pixel = luas x zoom^2"""
+        shape = self._l_shape()
+        mask = shape.rasterize(100, 100, TransformationMatrix().scale(2))
+        assert mask.shape == (100, 100)
+        assert mask.sum() == 400 * 4
+
+
+class TestGrid:
+    """Test class untuk Grid"""
+
+    @staticmethod
+    def _draw(grid, width, height):
+        surface = pygame.Surface((width, height))
+        grid.draw(surface, offset_x=-30, offset_y=-20)
+        return np.frombuffer(pygame.image.tobytes(surface, 'RGB'), dtype=np.uint8).reshape(
+            height, width, 3).any(axis=2)
+
+    def test_lines_cover_grid(self):
+        """Setiap garis grid tergambar sepanjang area grid"""
+        drawn = self._draw(Grid(200, 150, spacing=50, color=(255, 255, 255)), 200, 150)
+        assert drawn[:, 80].all() and drawn[120, :].all()
+        assert not drawn[10:20, 10:20].any()
+
+    def test_no_connectors_outside_grid(self):
+        """Surface lebih besar dari grid: tidak ada garis penghubung di luar grid"""
+        drawn = self._draw(Grid(100, 80, spacing=25, color=(255, 255, 255)), 200, 150)
+        assert drawn[:80, 5].all() and drawn[45, :100].all()
+        # Penghubung polyline dulu berada di x = width + 1 dan y = height + 1
+        assert not drawn[:, 101].any()
+        assert not drawn[81, :].any()
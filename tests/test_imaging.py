@@ -0,0 +1,140 @@
+"""
+Test untuk warping image raster
+Unit tests untuk load_image, warp_image dan ImageShape
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+from PIL import Image
+
+from src.imaging import ImageShape, load_image, warp_image
+from src.matrix import TransformationMatrix
+from src.render import RenderQueue
+
+
+def _random_image(height=60, width=80, channels=3, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, size=(height, width, channels), dtype=np.uint8)
+
+
+class TestLoadImage:
+    """Test class untuk load_image"""
+
+    def test_sources(self, tmp_path):
+        """Array, file dan pygame.Surface menjadi array (H, W, C)"""
+        pixels = _random_image()
+        assert load_image(pixels[:, :, 0]).shape == (60, 80, 1)
+        path = tmp_path / 'image.png'
+        Image.fromarray(pixels).save(path)
+        assert np.array_equal(load_image(str(path)), pixels)
+        surface = pygame.image.frombytes(pixels.tobytes(), (80, 60), 'RGB')
+        assert np.array_equal(load_image(surface), pixels)
+        with pytest.raises(ValueError):
+            load_image(np.zeros((2, 2, 2, 2)))
+
+
+class TestWarpImage:
+    """Test class untuk warp_image"""
+
+    @pytest.mark.parametrize('interpolation', ['nearest', 'bilinear'])
+    def test_identity_and_translation(self, interpolation):
+        """Identity dan translasi integer menyalin pixel persis"""
+        pixels = _random_image()
+        assert np.array_equal(warp_image(pixels, TransformationMatrix(),
+                                         interpolation=interpolation), pixels)
+        moved = warp_image(pixels, TransformationMatrix().translate(5, 7),
+                           interpolation=interpolation, tile_size=16, background=(1, 2, 3))
+        assert np.array_equal(moved[7:, 5:], pixels[:-7, :-5])
+        assert (moved[:7] == (1, 2, 3)).all() and (moved[:, :5] == (1, 2, 3)).all()
+
+    def test_nearest_scale_up(self):
+        """Scale 2x nearest: setiap pixel menjadi blok 2x2"""
+        pixels = _random_image(10, 12)
+        scaled = warp_image(pixels, TransformationMatrix().scale(2, 2), (24, 20), 'nearest')
+        assert np.array_equal(scaled, pixels.repeat(2, axis=0).repeat(2, axis=1))
+
+    def test_rotation_matches_scipy(self):
+        """Bilinear sama dengan scipy.ndimage.affine_transform (order 1)"""
+        ndimage = pytest.importorskip('scipy.ndimage')
+        pixels = _random_image(90, 120)
+        matrix = TransformationMatrix().rotate(30, 60, 45).scale(1.3, 1.3, 60, 45)
+        warped = warp_image(pixels, matrix, interpolation='bilinear', tile_size=32)
+        # Pusat pixel output (x + 0.5) -> index source u = inverse(x + 0.5) - 0.5 (urutan row, col)
+        a, b, c, d, e, f = matrix.inverse().coefficients
+        offset = (0.5 * (d + e) + f - 0.5, 0.5 * (a + b) + c - 0.5)
+        expected = np.stack([ndimage.affine_transform(pixels[:, :, k].astype(float), [[e, d], [b, a]],
+                                                      offset, output_shape=(90, 120), order=1,
+                                                      mode='nearest')
+                             for k in range(3)], axis=-1)
+        inside = warp_image(np.full((90, 120, 1), 255, np.uint8), matrix)[:, :, 0] == 255
+        difference = np.abs(warped.astype(int) - np.rint(expected).astype(int))[inside]
+        assert inside.sum() > 5000 and difference.max() <= 1
+
+    def test_tile_size_independent(self):
+        """Hasil tidak bergantung ukuran tile"""
+        pixels = _random_image()
+        matrix = TransformationMatrix().rotate(-17, 40, 30).scale(0.7, 1.4)
+        results = [warp_image(pixels, matrix, (100, 90), tile_size=size) for size in (7, 64, 1000)]
+        assert np.array_equal(results[0], results[1]) and np.array_equal(results[0], results[2])
+
+    def test_out_and_errors(self):
+        """Parameter out dipakai; interpolation dan ukuran out divalidasi"""
+        pixels = _random_image()
+        out = np.zeros((60, 80, 3), dtype=np.uint8)
+        assert warp_image(pixels, TransformationMatrix(), out=out) is out
+        with pytest.raises(ValueError):
+            warp_image(pixels, TransformationMatrix(), interpolation='cubic')
+        with pytest.raises(ValueError):
+            warp_image(pixels, TransformationMatrix(), out=np.zeros((10, 10, 3), dtype=np.uint8))
+        with pytest.raises(ValueError):
+            warp_image(pixels, TransformationMatrix().scale(0, 1))
+
+
+class TestImageShape:
+    """Test class untuk ImageShape"""
+
+    @pytest.fixture
+    def image(self):
+        pixels = np.zeros((20, 40, 3), dtype=np.uint8)
+        pixels[:, :20] = (255, 0, 0)
+        pixels[:, 20:] = (0, 0, 255)
+        return ImageShape(100, 100, pixels, width=80, height=40)
+
+    def test_geometry(self, image):
+        """Rectangle world sesuai ukuran yang diminta; pixel disimpan RGBA"""
+        assert image.world_bounds == (100, 100, 180, 140)
+        assert image.pixels.shape == (20, 40, 4)
+        assert image.contains_point(150, 120)
+
+    def test_draw_with_transform(self, image):
+        """Rotasi 90 derajat: separuh kiri image (merah) pindah ke atas"""
+        pygame.init()
+        surface = pygame.Surface((300, 300))
+        surface.fill((255, 255, 255))
+        image.apply_transform(TransformationMatrix().rotate(90, 140, 120))
+        image.draw(surface)
+        assert surface.get_at((140, 100))[:3] == (255, 0, 0)
+        assert surface.get_at((140, 140))[:3] == (0, 0, 255)
+        # Di luar image tetap background (area warp transparan)
+        assert surface.get_at((105, 105))[:3] == (255, 255, 255)
+
+    def test_clipped_and_cached(self, image):
+        """Hanya area yang terlihat di-warp; surface dipakai ulang selama tidak ada perubahan"""
+        pygame.init()
+        surface = pygame.Surface((200, 150))
+        view = TransformationMatrix().scale(1.2, 1.2)
+        warped, position = image.render_surface(surface, view)
+        # Screen bounds (120, 120, 216, 168) dipotong ke surface
+        assert position == (120, 120) and warped.get_size() == (80, 30)
+        assert image.render_surface(surface, view)[0] is warped
+        queue = RenderQueue()
+        image.submit(queue, surface, view_matrix=TransformationMatrix().translate(500, 0))
+        assert len(queue) == 0
@@ -0,0 +1,100 @@
+"""
+Test untuk geometry instancing
+Unit tests untuk SharedGeometry, InstancedShape dan InstanceBatch
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pygame
+import pytest
+
+from src.matrix import TransformationMatrix
+from src.graphics import Circle
+from src.instancing import SharedGeometry, InstanceBatch
+
+
+class TestSharedGeometry:
+    """Test class untuk SharedGeometry"""
+
+    def test_vertices_immutable(self):
+        """Vertex data tidak boleh diubah"""
+        geometry = SharedGeometry([(0, 0), (10, 0), (0, 10)])
+        with pytest.raises(ValueError):
+            geometry.vertices[0, 0] = 5
+
+    def test_registry_shares_geometry(self):
+        """Circle dengan parameter sama memakai geometry yang sama"""
+        a = SharedGeometry.circle(10, segments=16)
+        b = SharedGeometry.circle(10, segments=16)
+        assert a is b
+        assert SharedGeometry.circle(20, segments=16) is not a
+
+
+class TestInstanceBatch:
+    """Test class untuk InstanceBatch"""
+
+    def test_batch_matches_shape2d(self):
+        """Hasil batch transform sama dengan Shape2D biasa"""
+        geometry = SharedGeometry.circle(40, segments=32)
+        batch = InstanceBatch()
+        offsets = [(0, 0), (100, 50), (-30, 200)]
+        for tx, ty in offsets:
+            batch.add(geometry, TransformationMatrix().translate(tx, ty).rotate(30))
+
+        points = batch.transformed_points(geometry)
+        assert points.shape == (3, 32, 2)
+
+        for i, (tx, ty) in enumerate(offsets):
+            circle = Circle(0, 0, 40, segments=32)
+            circle.apply_transform(TransformationMatrix().translate(tx, ty).rotate(30))
+            expected = [p.to_tuple() for p in circle.transformed_points]
+            assert np.allclose(points[i], expected)
+
+    def test_instance_handle(self):
+        """InstancedShape membaca dan menulis ke storage batch"""
+        geometry = SharedGeometry.rectangle(10, 20)
+        batch = InstanceBatch()
+        instance = batch.add(geometry, color=(1, 2, 3))
+        assert instance.geometry is geometry
+        assert instance.color == (1, 2, 3)
+
+        instance.apply_transform(TransformationMatrix().translate(5, 5))
+        assert instance.get_points()[0] == (5, 5)
+        instance.reset_transform()
+        assert instance.get_points()[0] == (0, 0)
+
+    def test_groups_grow(self):
+        """Instance bertambah melewati kapasitas awal"""
+        geometry = SharedGeometry.rectangle(1, 1)
+        batch = InstanceBatch()
+        handles = [batch.add(geometry, TransformationMatrix().translate(i, 0)) for i in range(100)]
+        assert len(batch) == 100
+        assert batch.geometries == [geometry]
+        assert handles[99].get_points()[0] == (99, 0)
+
+    def test_draw(self):
+        """Draw batch ke surface tanpa error"""
+        geometry = SharedGeometry.rectangle(10, 10)
+        batch = InstanceBatch()
+        batch.add(geometry, TransformationMatrix().translate(5, 5), color=(255, 0, 0))
+        surface = pygame.Surface((40, 40))
+        surface.fill((0, 0, 0))
+        batch.draw(surface)
+        assert surface.get_at((10, 10))[:3] == (255, 0, 0)
+
+    def test_view_matrix_batch(self):
+        """View matrix dikomposisikan dengan matrix 2x3 setiap instance"""
+        geometry = SharedGeometry.rectangle(10, 10)
+        batch = InstanceBatch()
+        first = batch.add(geometry, TransformationMatrix().rotate(30).translate(5, 0))
+        second = batch.add(geometry, TransformationMatrix().scale(2, 3))
+        camera = TransformationMatrix().translate(100, 50).scale(1.5)
+        points = batch.transformed_points(geometry, camera)
+        for i, instance in enumerate((first, second)):
+            expected = camera.copy().compose(instance.transform_matrix).apply_to_array(geometry.vertices)
+            assert np.allclose(points[i], expected)
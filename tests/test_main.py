@@ -0,0 +1,188 @@
+"""
+Test untuk aplikasi utama
+Unit tests untuk main loop MatrixTransform2DApp (headless)
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+
+from src.main import MatrixTransform2DApp, parse_args
+from src.scene import generate_scene
+
+
+@pytest.fixture
+def app():
+    application = MatrixTransform2DApp(width=800, height=600)
+    pygame.event.clear()
+    yield application
+    pygame.quit()
+
+
+class TestIdleLoop:
+    """Test class untuk idle mode main loop"""
+
+    def test_active_after_input(self, app):
+        """Input baru membuat loop aktif, lalu idle setelah idle_delay"""
+        assert not app.is_idle()
+        app.idle_delay = 0.0
+        app._last_activity -= 1
+        assert app.is_idle()
+
+    def test_idle_wait_timeout(self, app):
+        """Tanpa input, frame idle hanya menunggu dan tidak merender"""
+        app.idle_delay = 0.0
+        app.idle_timeout_ms = 20
+        app._last_activity -= 1
+        assert app.run_frame() is False
+        assert app.loop_stats.idle_waits == 1
+        assert app.loop_stats.frames == 0
+        assert app.loop_stats.idle_time > 0
+
+    def test_wakes_on_input(self, app):
+        """Event yang membangunkan loop langsung diproses pada frame yang sama"""
+        app.idle_delay = 10.0
+        app._last_activity -= 20
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_PLUS, mod=0,
+                                             unicode='+', scancode=0))
+        zoom = app.camera_zoom
+        assert app.run_frame() is True
+        assert app.camera_zoom > zoom
+        assert app.loop_stats.frames == 1
+        assert not app.is_idle()
+
+    def test_drag_keeps_loop_active(self, app):
+        """Slider yang sedang di-drag mencegah idle mode"""
+        app.idle_delay = 0.0
+        app._last_activity -= 1
+        slider = app.control_panel.rotate_slider
+        app.control_panel.handle_event(pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, pos=slider.rect.center, button=1))
+        assert not app.is_idle()
+
+
+class TestTrace:
+    """Test class untuk rekam dan replay input trace"""
+
+    @staticmethod
+    def _session(app):
+        """Sesi kecil: ganti shape, drag slider rotate, zoom dengan wheel"""
+        slider = app.control_panel.rotate_slider
+        x, y = slider.rect.center
+        frames = [
+            [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_TAB, mod=0, unicode='\t', scancode=0)],
+            [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(x, y), button=1)],
+            [pygame.event.Event(pygame.MOUSEMOTION, pos=(x + 10, y), rel=(10, 0), buttons=(1, 0, 0)),
+             pygame.event.Event(pygame.MOUSEMOTION, pos=(x + 40, y), rel=(30, 0), buttons=(1, 0, 0))],
+            [pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(x + 40, y), button=1)],
+            [],
+            [pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=1, flipped=False, pos=(100, 100))],
+        ]
+        for events in frames:
+            for event in events:
+                pygame.event.post(event)
+            app.run_frame()
+
+    def test_record_and_replay(self, app, tmp_path):
+        """Replay trace menghasilkan state yang sama dengan sesi asli"""
+        from src.trace import Replayer
+
+        path = str(tmp_path / "session.jsonl.gz")
+        app.idle_enabled = False
+        app.start_recording(path)
+        self._session(app)
+        app.recorder.close()
+        recorded_state = app.get_slider_state()
+        recorded_zoom = app.camera_zoom
+        recorded_selection = app.selected_shape_index
+        assert recorded_state['rot'] != 0
+
+        replayer = Replayer(path)
+        assert (replayer.width, replayer.height) == (800, 600)
+        assert replayer.frame_count == 6
+        replay_app = MatrixTransform2DApp(width=replayer.width, height=replayer.height)
+        replay_app.start_replay(replayer)
+        while replay_app.running:
+            replay_app.run_frame()
+        assert replay_app.frame_index == 6
+        assert replay_app.get_slider_state() == recorded_state
+        assert replay_app.camera_zoom == recorded_zoom
+        assert replay_app.selected_shape_index == recorded_selection
+        assert replayer.mismatches == []
+        assert replayer.timing_summary()['frames'] == 6
+
+    def test_event_round_trip(self):
+        """encode_event/decode_event mempertahankan atribut event"""
+        from src.trace import encode_event, decode_event
+
+        event = pygame.event.Event(pygame.MOUSEMOTION, pos=(3, 4), rel=(1, -1), buttons=(1, 0, 0))
+        decoded = decode_event(encode_event(event))
+        assert decoded.type == pygame.MOUSEMOTION
+        assert decoded.pos == (3, 4) and decoded.rel == (1, -1) and decoded.buttons == (1, 0, 0)
+        assert encode_event(pygame.event.Event(pygame.USEREVENT)) is None
+
+
+class TestLoadScene:
+    """Test class untuk memuat scene sintetis ke aplikasi"""
+
+    def test_load_shapes(self, app):
+        """List shape menggantikan shape demo dan shape pertama terpilih"""
+        shapes = generate_scene(50, seed=1)
+        app.load_scene(shapes)
+        assert app.shapes == shapes
+        assert app.selected_shape is shapes[0]
+        app.draw()
+
+    def test_load_instanced(self, app):
+        """InstanceBatch digambar di belakang shape yang ada"""
+        shape_count = len(app.shapes)
+        app.load_scene(generate_scene(1000, seed=1, instanced=True))
+        assert app.instance_batch is not None
+        assert len(app.shapes) == shape_count
+        app.draw()
+
+    def test_cli_flags(self):
+        """Flag --scene, --seed dan --instanced"""
+        args = parse_args(["--scene", "1000", "--seed", "4", "--instanced"])
+        assert args.scene == 1000 and args.seed == 4 and args.instanced
+
+
+class TestExportScene:
+    """Test class untuk export scene dari aplikasi"""
+
+    def test_export_svg_and_png(self, app, tmp_path):
+        """Format dipilih dari ekstensi file"""
+        app.load_scene(generate_scene(100, seed=3, instanced=True))
+        assert app.export_scene(str(tmp_path / 'scene.svg')) > len(app.shapes)
+        assert app.export_scene(str(tmp_path / 'scene.png'), use_camera=False) >= 1
+        assert (tmp_path / 'scene.png').read_bytes()[:4] == b'\x89PNG'
+        with pytest.raises(ValueError):
+            app.export_scene(str(tmp_path / 'scene.bmp'))
+
+    def test_cli_flags(self):
+        """Flag --export dan --export-world"""
+        args = parse_args(["--export", "out.svg", "--export-world"])
+        assert args.export == "out.svg" and args.export_world
+
+
+class TestAddImage:
+    """Test class untuk menambah image ke canvas"""
+
+    def test_add_image(self, app):
+        """Image ditempatkan di tengah canvas dan langsung terpilih"""
+        image = app.add_image(np.zeros((40, 60, 3), dtype=np.uint8))
+        assert app.selected_shape is image and app.shapes[-1] is image
+        assert image.center == pytest.approx((app.canvas_width / 2, app.canvas_height / 2))
+        app.draw()
+
+    def test_cli_flag(self):
+        """Flag --image"""
+        assert parse_args(["--image", "photo.png"]).image == "photo.png"
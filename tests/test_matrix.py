@@ -6,11 +6,17 @@ Unit tests untuk TransformationMatrix dan Transform2D
 import sys
 import os
 import math
+import subprocess
+from array import array
 
 # Add parent directory ke path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.matrix import TransformationMatrix, Transform2D
+from src.matrix import (
+    TransformationMatrix, Transform2D, TransformKind, PrecisionPolicy,
+    get_precision_policy, precision_scope, build_matrix_stack, decompose_matrix_stack
+)
+import numpy as np
 import pytest
 
 
@@ -181,6 +187,232 @@ class TestTransformationMatrix:
         x, y = matrix1.apply_to_point(0, 0)
         assert abs(x - 30) < 0.001
         assert abs(y - 30) < 0.001
+    
+    def test_scalar_matches_numpy(self):
+        """Fast path skalar dan path NumPy memberi hasil yang sama"""
+        matrix = TransformationMatrix()
+        matrix.translate(10, -5).rotate(33, 4, 7).scale(1.5, 0.5, -2, 3)
+        points = [(float(i), float(i * i % 7)) for i in range(50)]
+        scalar = matrix._apply_scalar(points)
+        vectorized = matrix.apply_to_array(points)
+        assert np.allclose(scalar, vectorized)
+        
+        # Bandingkan juga dengan perkalian matrix 3x3 biasa
+        x, y = matrix.apply_to_point(3, 4)
+        expected = np.dot(matrix.get_matrix(), [3, 4, 1])
+        assert abs(x - expected[0]) < 1e-9
+        assert abs(y - expected[1]) < 1e-9
+    
+    def test_matrix_read_only(self):
+        """Matrix cache tidak bisa diubah in-place"""
+        matrix = TransformationMatrix().translate(1, 2)
+        with pytest.raises(ValueError):
+            matrix.matrix[0, 2] = 5
+        matrix.set_matrix([[1, 0, 5], [0, 1, 6], [0, 0, 1]])
+        assert matrix.apply_to_point(0, 0) == (5, 6)
+    
+    def test_inverse(self):
+        """Inverse membatalkan transformasi dan jenisnya tetap sama"""
+        matrix = TransformationMatrix().translate(10, -5).rotate(33, 4, 7).scale(1.5, 0.5)
+        inverse = matrix.inverse()
+        assert inverse.kind == matrix.kind
+        assert np.allclose(inverse.get_matrix() @ matrix.get_matrix(), np.eye(3))
+        assert TransformationMatrix().translate(3, 4).inverse().apply_to_point(3, 4) == (0, 0)
+        with pytest.raises(ValueError):
+            TransformationMatrix().scale(0, 1).inverse()
+
+
+class TestTransformKind:
+    """Test class untuk penandaan jenis transformasi"""
+    
+    def test_kinds_from_operations(self):
+        """Setiap operasi menandai jenis yang sesuai"""
+        assert TransformationMatrix().kind == TransformKind.IDENTITY
+        assert TransformationMatrix().translate(1, 2).kind == TransformKind.TRANSLATION
+        assert TransformationMatrix().translate(1, 2).scale(2, 3).kind == TransformKind.SCALE
+        assert TransformationMatrix().rotate(30, 5, 5).kind == TransformKind.RIGID
+        assert TransformationMatrix().rotate(30).scale(2).kind == TransformKind.AFFINE
+        assert TransformationMatrix().translate(0, 0).kind == TransformKind.IDENTITY
+    
+    def test_kind_from_set_matrix(self):
+        """set_matrix mengklasifikasikan matrix"""
+        assert TransformationMatrix().set_matrix(np.eye(3)).kind == TransformKind.IDENTITY
+        assert TransformationMatrix().set_matrix(
+            [[1, 0, 4], [0, 1, 5]]).kind == TransformKind.TRANSLATION
+        rotated = TransformationMatrix().rotate(45).get_matrix()
+        assert TransformationMatrix().set_matrix(rotated).kind == TransformKind.RIGID
+        assert TransformationMatrix().set_matrix(
+            [[1, 2, 0], [0, 1, 0]]).kind == TransformKind.AFFINE
+    
+    def test_specialized_kernels_match_general(self):
+        """Kernel khusus memberi hasil sama dengan perkalian matrix 3x3"""
+        points = np.random.default_rng(1).uniform(-100, 100, size=(200, 2))
+        homogeneous = np.column_stack((points, np.ones(len(points))))
+        matrices = [
+            TransformationMatrix(),
+            TransformationMatrix().translate(3, -7),
+            TransformationMatrix().translate(3, -7).scale(2, 0.5, 10, 10),
+            TransformationMatrix().rotate(70, 1, 2).translate(5, 5),
+            TransformationMatrix().rotate(70).scale(2, 3),
+        ]
+        for matrix in matrices:
+            expected = (homogeneous @ matrix.get_matrix().T)[:, :2]
+            assert np.allclose(matrix.apply_to_array(points), expected)
+            assert np.allclose(matrix._apply_scalar(points[:5]), expected[:5])
+            x, y = matrix.apply_to_point(*points[0])
+            assert np.allclose((x, y), expected[0])
+    
+    def test_compose_kernels(self):
+        """Komposisi per jenis sama dengan perkalian matrix biasa"""
+        ops = [
+            lambda m: m.translate(4, 5),
+            lambda m: m.scale(2, 3, 1, 1),
+            lambda m: m.rotate(25, -3, 2),
+            lambda m: m,
+        ]
+        for first in ops:
+            for second in ops:
+                a = first(TransformationMatrix())
+                b = second(TransformationMatrix())
+                expected = a.get_matrix() @ b.get_matrix()
+                assert np.allclose(a.copy().compose(b).get_matrix(), expected)
+    
+    def test_affine_storage(self):
+        """Matrix tersedia sebagai affine 2x3"""
+        matrix = TransformationMatrix().translate(1, 2)
+        assert matrix.affine.shape == (2, 3)
+        assert np.allclose(matrix.affine, matrix.get_matrix()[:2])
+
+
+class TestApplyToArray:
+    """Test class untuk apply_to_array (ndarray in/out tanpa tuple)"""
+    
+    def test_out_parameter(self):
+        """Hasil ditulis ke memory milik caller"""
+        matrix = TransformationMatrix().rotate(90).translate(1, 0)
+        points = np.array([[1.0, 0.0], [0.0, 2.0]])
+        out = np.zeros_like(points)
+        result = matrix.apply_to_array(points, out=out)
+        assert result is out
+        assert np.allclose(out, [[0, 2], [-2, 1]])
+    
+    def test_in_place(self):
+        """out boleh sama dengan input untuk setiap jenis kernel"""
+        matrices = [
+            TransformationMatrix(),
+            TransformationMatrix().translate(3, 4),
+            TransformationMatrix().scale(2, 3),
+            TransformationMatrix().rotate(30).scale(2, 1),
+        ]
+        for matrix in matrices:
+            points = np.random.default_rng(3).uniform(-10, 10, size=(100, 2))
+            expected = matrix.apply_to_array(points)
+            matrix.apply_to_array(points, out=points)
+            assert np.allclose(points, expected)
+    
+    def test_in_place_blocks(self):
+        """Kernel in-place umum diproses per blok tanpa mengubah hasil"""
+        matrix = TransformationMatrix().rotate(30).translate(5, -5)
+        points = np.random.default_rng(4).uniform(-10, 10, size=(40000, 2))
+        expected = matrix.apply_to_array(points)
+        matrix.apply_to_array(points, out=points)
+        assert np.allclose(points, expected)
+    
+    def test_buffer_protocol(self):
+        """Object buffer-protocol dibaca tanpa copy, bentuk datar diterima"""
+        buffer = array('d', [1.0, 2.0, 3.0, 4.0])
+        result = TransformationMatrix().translate(10, 20).apply_to_array(memoryview(buffer))
+        assert result.dtype == np.float64
+        assert np.allclose(result, [[11, 22], [13, 24]])
+    
+    def test_dtype(self):
+        """dtype float dipertahankan, integer memakai dtype policy"""
+        matrix = TransformationMatrix().scale(2)
+        assert matrix.apply_to_array(np.ones((3, 2), dtype=np.float32)).dtype == np.float32
+        assert matrix.apply_to_array(np.ones((3, 2), dtype=np.int32)).dtype == np.float64
+        out = np.empty((3, 2), dtype=np.float32)
+        assert matrix.apply_to_array(np.ones((3, 2)), out=out).dtype == np.float32
+    
+    def test_out_shape_mismatch(self):
+        """Ukuran out yang salah ditolak"""
+        with pytest.raises(ValueError):
+            TransformationMatrix().apply_to_array(np.ones((3, 2)), out=np.empty((2, 2)))
+
+
+class TestLazyChain:
+    """Test class untuk operasi lazy yang digabung saat diterapkan"""
+    
+    @staticmethod
+    def _reference(ops):
+        """Perkalian matrix 3x3 eksplisit sebagai pembanding"""
+        result = np.eye(3)
+        for name, *args in ops:
+            if name == 'translate':
+                tx, ty = args
+                op = np.array([[1, 0, tx], [0, 1, ty], [0, 0, 1]], dtype=float)
+            elif name == 'rotate':
+                angle, px, py = args
+                c, s = math.cos(math.radians(angle)), math.sin(math.radians(angle))
+                op = (np.array([[1, 0, px], [0, 1, py], [0, 0, 1]])
+                      @ np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+                      @ np.array([[1, 0, -px], [0, 1, -py], [0, 0, 1]]))
+            else:
+                sx, sy, px, py = args
+                op = (np.array([[1, 0, px], [0, 1, py], [0, 0, 1]])
+                      @ np.diag([sx, sy, 1.0])
+                      @ np.array([[1, 0, -px], [0, 1, -py], [0, 0, 1]]))
+            result = result @ op
+        return result
+    
+    def test_operations_are_deferred(self):
+        """Operasi hanya direkam sampai matrix dibaca"""
+        matrix = TransformationMatrix().translate(1, 2).translate(3, 4).rotate(10)
+        assert len(matrix._pending) == 2
+        version = matrix.version
+        matrix.get_matrix()
+        assert matrix._pending == []
+        assert matrix.version == version
+    
+    def test_merge_adjacent(self):
+        """Translasi, rotasi dan skala berurutan digabung"""
+        matrix = TransformationMatrix()
+        matrix.translate(1, 0).translate(2, 0).translate(3, 5)
+        assert matrix._pending == [('T', 6, 5)]
+        matrix.rotate(10, 4, 4).rotate(20, 4, 4)
+        matrix.scale(2, 3).scale(0.5, 2)
+        assert matrix._pending[1] == ('R', 30, 4, 4)
+        assert matrix._pending[2] == ('S', 1.0, 6, 0, 0)
+    
+    def test_pivot_sandwich(self):
+        """T(p) @ R @ T(-p) menjadi satu rotasi terhadap pivot"""
+        matrix = TransformationMatrix().translate(50, 50).rotate(180).translate(-50, -50)
+        assert matrix._pending == [('R', 180, 50, 50)]
+        x, y = matrix.apply_to_point(60, 50)
+        assert abs(x - 40) < 1e-9
+        assert abs(y - 50) < 1e-9
+    
+    def test_random_chains(self):
+        """Chain acak memberi hasil sama dengan perkalian eksplisit"""
+        rng = np.random.default_rng(7)
+        for _ in range(50):
+            ops = []
+            matrix = TransformationMatrix()
+            for _ in range(rng.integers(1, 10)):
+                choice = rng.integers(0, 3)
+                px, py = rng.choice([0.0, 5.0, -3.0], size=2)
+                if choice == 0:
+                    tx, ty = rng.choice([0.0, 5.0, 3.0, -5.0], size=2)
+                    ops.append(('translate', tx, ty))
+                    matrix.translate(tx, ty)
+                elif choice == 1:
+                    angle = float(rng.choice([30.0, -45.0, 90.0]))
+                    ops.append(('rotate', angle, px, py))
+                    matrix.rotate(angle, px, py)
+                else:
+                    sx, sy = rng.choice([0.5, 2.0, 1.0], size=2)
+                    ops.append(('scale', sx, sy, px, py))
+                    matrix.scale(sx, sy, px, py)
+            assert np.allclose(matrix.get_matrix(), self._reference(ops))
 
 
 class TestTransform2D:
@@ -213,6 +445,26 @@ class TestTransform2D:
         assert isinstance(x, (int, float))
         assert isinstance(y, (int, float))
     
+    def test_get_matrix_pivot(self):
+        """Pivot tetap di tempat untuk rotasi dan skala"""
+        transform = Transform2D()
+        transform.rotation_angle = 60
+        transform.scale_x = 2.0
+        transform.scale_y = 0.5
+        transform.pivot_x = 30
+        transform.pivot_y = -10
+        x, y = transform.get_matrix().apply_to_point(30, -10)
+        assert abs(x - 30) < 1e-9
+        assert abs(y + 10) < 1e-9
+    
+    def test_translation_only_kind(self):
+        """Slider translasi saja menghasilkan matrix TRANSLATION"""
+        transform = Transform2D()
+        transform.translation_x = 15
+        transform.pivot_x = 100
+        transform.pivot_y = 100
+        assert transform.get_matrix().kind == TransformKind.TRANSLATION
+    
     def test_reset(self):
         """Test reset transform"""
         transform = Transform2D()
@@ -230,6 +482,113 @@ class TestTransform2D:
         assert transform.scale_y == 1.0
 
 
+class TestMatrixStack:
+    """Test class untuk build/decompose matrix stack (Transform2D batch)"""
+    
+    @staticmethod
+    def _columns(count=50):
+        rng = np.random.default_rng(7)
+        return dict(
+            tx=rng.uniform(-100, 100, count), ty=rng.uniform(-100, 100, count),
+            rot=rng.uniform(-179, 179, count), sx=rng.uniform(0.1, 3, count),
+            sy=rng.uniform(-3, 3, count), px=rng.uniform(-50, 50, count),
+            py=rng.uniform(-50, 50, count),
+        )
+    
+    def test_matches_transform2d(self):
+        """Setiap matrix dalam stack sama dengan Transform2D.get_matrix"""
+        c = self._columns()
+        stack = build_matrix_stack(c['tx'], c['ty'], c['rot'], c['sx'], c['sy'], c['px'], c['py'])
+        assert stack.shape == (50, 3, 3)
+        for i in range(50):
+            transform = Transform2D()
+            transform.translation_x, transform.translation_y = c['tx'][i], c['ty'][i]
+            transform.rotation_angle = c['rot'][i]
+            transform.scale_x, transform.scale_y = c['sx'][i], c['sy'][i]
+            transform.pivot_x, transform.pivot_y = c['px'][i], c['py'][i]
+            assert np.allclose(stack[i], transform.get_matrix().get_matrix())
+    
+    def test_scalar_broadcast(self):
+        """Kolom skalar di-broadcast ke panjang kolom array"""
+        stack = build_matrix_stack([0, 10, 20], 0, 90, 2, 2, pivot_x=5, pivot_y=5)
+        assert stack.shape == (3, 3, 3)
+        assert np.allclose(stack[:, 0, 2], [15, 25, 35])
+    
+    def test_round_trip(self):
+        """decompose(build(p)) mengembalikan parameter yang sama"""
+        c = self._columns()
+        stack = build_matrix_stack(c['tx'], c['ty'], c['rot'], c['sx'], c['sy'], c['px'], c['py'])
+        tx, ty, rot, sx, sy = decompose_matrix_stack(stack, c['px'], c['py'])
+        for result, key in ((tx, 'tx'), (ty, 'ty'), (rot, 'rot'), (sx, 'sx'), (sy, 'sy')):
+            assert np.allclose(result, c[key])
+    
+    def test_invalid_shape(self):
+        """Stack dengan bentuk salah ditolak"""
+        with pytest.raises(ValueError):
+            decompose_matrix_stack(np.eye(3))
+
+
+class TestPrecisionPolicy:
+    """Test class untuk PrecisionPolicy"""
+    
+    def test_default_float64(self):
+        """Default policy adalah float64"""
+        assert get_precision_policy().dtype == np.float64
+        assert TransformationMatrix().get_matrix().dtype == np.float64
+    
+    def test_float32_scope(self):
+        """Komposisi tetap float64, geometry memakai float32"""
+        with precision_scope(np.float32):
+            matrix = TransformationMatrix().translate(10, 20).rotate(30)
+            assert matrix.get_matrix().dtype == np.float64
+            transformed = matrix.apply_to_points(np.ones((100, 2)))
+            assert len(transformed) == 100
+            assert abs(transformed[0][1] - matrix.apply_to_point(1, 1)[1]) < 1e-3
+        assert get_precision_policy().dtype == np.float64
+    
+    def test_float32_accumulate(self):
+        """accumulate_float64=False membuat komposisi dalam float32"""
+        with precision_scope(PrecisionPolicy(np.float32, accumulate_float64=False)):
+            matrix = TransformationMatrix().translate(10, 20).scale(2)
+            assert matrix.get_matrix().dtype == np.float32
+            x, y = matrix.apply_to_point(1, 1)
+            assert abs(x - 12) < 0.001
+            assert abs(y - 22) < 0.001
+    
+    def test_invalid_dtype(self):
+        """dtype selain float32/float64 ditolak"""
+        with pytest.raises(ValueError):
+            PrecisionPolicy(np.int32)
+
+
+class TestImport:
+    """Test bahwa layer matematika tidak bergantung pada pygame"""
+    
+    def test_matrix_without_pygame(self):
+        """src.matrix bisa di-import walaupun pygame tidak tersedia"""
+        code = (
+            "import sys; sys.modules['pygame'] = None; "
+            "from src.matrix import TransformationMatrix; import src; "
+            "assert src.TransformationMatrix is TransformationMatrix"
+        )
+        root = os.path.join(os.path.dirname(__file__), '..')
+        result = subprocess.run([sys.executable, "-c", code], cwd=root,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+    def test_main_stays_function(self):
+        """`from src import main` tetap fungsi main() walau src.main sudah di-import"""
+        code = (
+            "import sys, types; import src; assert 'pygame' not in sys.modules; "
+            "import src.main; from src import main; "
+            "assert not isinstance(main, types.ModuleType) and main is sys.modules['src.main'].main"
+        )
+        root = os.path.join(os.path.dirname(__file__), '..')
+        result = subprocess.run([sys.executable, "-c", code], cwd=root,
+                                capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+
+
 def run_tests():
     """Run semua tests"""
     print("Running tests...")
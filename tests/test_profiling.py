@@ -0,0 +1,138 @@
+"""
+Test untuk profiling alokasi
+Unit tests untuk AllocationProfiler dan integrasinya dengan main loop
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import tracemalloc
+import pygame
+import pytest
+
+from src.profiling import AllocationProfiler, phase_scope
+
+
+@pytest.fixture
+def profiler():
+    allocation_profiler = AllocationProfiler(budget_bytes=32 * 1024)
+    allocation_profiler.start()
+    yield allocation_profiler
+    allocation_profiler.stop()
+
+
+class TestAllocationProfiler:
+    """Test class untuk AllocationProfiler"""
+
+    def test_phase_measures_allocation(self, profiler):
+        """Alokasi di dalam fase tercatat sebagai allocated dan retained"""
+        kept = []
+        profiler.begin_frame(0)
+        with profiler.phase('work'):
+            kept.append(bytearray(100_000))
+        with profiler.phase('idle'):
+            pass
+        frame = profiler.end_frame()
+        allocated, retained = frame.phases['work']
+        assert allocated >= 100_000 and retained >= 100_000
+        assert frame.phases['idle'][0] < 1000
+
+    def test_transient_allocation_not_retained(self, profiler):
+        """Alokasi sementara terlihat di puncak tetapi tidak tertahan"""
+        profiler.begin_frame(0)
+        with profiler.phase('draw'):
+            buffer = bytearray(200_000)
+            del buffer
+        allocated, retained = profiler.end_frame().phases['draw']
+        assert allocated >= 200_000
+        assert retained < 10_000
+
+    def test_budget_flags_frames(self, profiler):
+        """Frame di atas budget ditandai, frame kecil tidak"""
+        kept = []
+        for index, size in enumerate((10, 100_000, 10)):
+            profiler.begin_frame(index)
+            with profiler.phase('draw'):
+                kept.append(bytearray(size))
+            profiler.end_frame()
+        assert [frame.frame for frame in profiler.over_budget] == [1]
+        assert profiler.summary()['over_budget'] == 1
+        assert profiler.frame_count == 3
+
+    def test_top_lines_point_to_source(self, profiler):
+        """Baris yang menahan alokasi muncul di statistik baris"""
+        kept = []
+        for index in range(3):
+            profiler.begin_frame(index)
+            with profiler.phase('draw'):
+                kept.append(bytearray(50_000))
+            profiler.end_frame()
+        location, size, _ = profiler.top_lines()[0]
+        assert location.startswith(__file__)
+        assert size >= 150_000
+        assert "Alokasi: 3 frame" in profiler.report()
+
+    def test_transient_allocation_attributed_to_line(self, profiler):
+        """Objek sementara yang dibebaskan sebelum end_frame tercatat pada barisnya"""
+        def render():
+            scratch = [bytes(1000) for _ in range(2200)]
+            return len(scratch)
+
+        profiler.begin_frame(0)
+        with profiler.phase('draw'):
+            render()
+            label = f"{render()}"
+        frame = profiler.end_frame()
+        assert label == "2200"
+        location, size, _ = frame.top_lines[0]
+        assert location == f"{__file__}:{render.__code__.co_firstlineno + 1}"
+        # Snapshot diambil per langkah seperempat, puncak per fase tetap tepat
+        assert size >= 0.75 * 2_200_000
+        assert frame.allocated >= 2_200_000
+        assert not any('tracemalloc' in line or 'fnmatch' in line for line, _, _ in frame.top_lines)
+        assert sys.gettrace() is None
+
+    def test_stop_only_own_tracing(self):
+        """Profiler tidak mematikan tracemalloc yang dimulai pihak lain"""
+        tracemalloc.start()
+        try:
+            profiler = AllocationProfiler()
+            profiler.start()
+            profiler.stop()
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+    def test_phase_scope_without_profiler(self):
+        """phase_scope(None, ...) adalah no-op yang dapat dipakai ulang"""
+        with phase_scope(None, 'draw'):
+            with phase_scope(None, 'nested'):
+                pass
+
+
+class TestMainLoopProfiling:
+    """Test class untuk profiling alokasi di main loop"""
+
+    def test_run_frame_records_phases(self):
+        """Setiap frame mencatat fase events, update, draw dan tick"""
+        from src.main import MatrixTransform2DApp
+        app = MatrixTransform2DApp(width=800, height=600)
+        try:
+            app.fps = 0
+            app.idle_enabled = False
+            profiler = app.start_alloc_profiling(budget_bytes=1 << 30)
+            for _ in range(3):
+                app.run_frame()
+            profiler.stop()
+            assert profiler.frame_count == 3
+            assert set(profiler.summary()['phases']) == {'events', 'update', 'draw', 'tick'}
+            assert profiler.over_budget_count == 0
+            # Font dibuat sekali per ukuran, bukan setiap frame
+            assert app._get_font(24) is app._get_font(24)
+        finally:
+            pygame.quit()
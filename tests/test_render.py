@@ -0,0 +1,85 @@
+"""
+Test untuk render queue
+Unit tests untuk RenderQueue dan grid_polyline
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pygame
+
+from src.render import RenderQueue, grid_polyline
+from src.graphics import Circle, Rectangle
+
+
+class TestRenderQueue:
+    """Test class untuk RenderQueue"""
+
+    def test_outline_single_call(self):
+        """Satu outline tertutup digambar dengan satu draw call"""
+        surface = pygame.Surface((100, 100))
+        queue = RenderQueue()
+        Circle(50, 50, 20, fill=False, segments=32).submit(queue, surface)
+        assert queue.flush(surface) == 1
+        assert len(queue) == 0
+
+    def test_contiguous_segments_merged(self):
+        """Segment bersambung dengan style sama digabung, style berbeda tidak"""
+        surface = pygame.Surface((20, 20))
+        queue = RenderQueue()
+        queue.add_segments([((0, 0), (5, 0)), ((5, 0), (5, 5)), ((9, 9), (10, 10))], (255, 0, 0))
+        queue.add_segments([((10, 10), (12, 12))], (0, 255, 0))
+        assert queue.flush(surface) == 3
+
+    def test_submission_order_kept(self):
+        """Primitive yang disubmit belakangan tetap menimpa yang sebelumnya"""
+        surface = pygame.Surface((40, 40))
+        queue = RenderQueue()
+        Rectangle(0, 0, 30, 30, color=(255, 0, 0)).submit(queue, surface)
+        Rectangle(10, 10, 30, 30, color=(0, 0, 255)).submit(queue, surface)
+        Rectangle(15, 15, 5, 5, color=(255, 0, 0)).submit(queue, surface)
+        queue.flush(surface)
+        assert surface.get_at((12, 12))[:3] == (0, 0, 255)
+        assert surface.get_at((16, 16))[:3] == (255, 0, 0)
+
+    def test_draw_matches_queue(self):
+        """Shape2D.draw sama dengan submit + flush"""
+        direct = pygame.Surface((60, 60))
+        queued = pygame.Surface((60, 60))
+        circle = Circle(30, 30, 20, color=(0, 200, 0), fill=False)
+        circle.draw(direct, draw_center=True)
+        queue = RenderQueue()
+        circle.submit(queue, queued, draw_center=True)
+        queue.flush(queued)
+        assert pygame.image.tostring(direct, "RGB") == pygame.image.tostring(queued, "RGB")
+
+
+class TestGridPolyline:
+    """Test class untuk grid_polyline"""
+
+    def test_connectors_off_screen(self):
+        """Semua garis grid ada, penghubungnya di luar area terlihat"""
+        points = grid_polyline([10, 20, 30], [5, 15], (-2, 42), (-2, 22))
+        assert len(points) == 2 * 3 + 1 + 2 * 2
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            if x0 == x1 and x0 in (10, 20, 30):
+                continue  # garis vertikal grid
+            if y0 == y1 and y0 in (5, 15):
+                continue  # garis horizontal grid
+            assert x0 == x1 and x0 in (-2, 42) or y0 == y1 and y0 in (-2, 22)
+
+    def test_grid_pixels(self):
+        """Grid sebagai satu polyline menggambar pixel pada setiap garis"""
+        surface = pygame.Surface((40, 20))
+        surface.fill((0, 0, 0))
+        queue = RenderQueue()
+        queue.add_polyline(grid_polyline([10, 20, 30], [5, 15], (-2, 42), (-2, 22)), (255, 255, 255))
+        assert queue.flush(surface) == 1
+        for x in (10, 20, 30):
+            assert surface.get_at((x, 10))[:3] == (255, 255, 255)
+        for y in (5, 15):
+            assert surface.get_at((3, y))[:3] == (255, 255, 255)
+        assert surface.get_at((3, 10))[:3] == (0, 0, 0)
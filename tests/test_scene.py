@@ -0,0 +1,99 @@
+"""
+Test untuk generator scene sintetis
+Unit tests untuk generate_scene (mode Shape2D dan instanced)
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+import pytest
+
+from src.graphics import Circle, Line
+from src.instancing import InstanceBatch
+from src.scene import generate_scene
+
+
+def _is_simple(points):
+    """True jika tidak ada dua edge tidak bersebelahan yang berpotongan"""
+    count = len(points)
+    edges = [(points[i], points[(i + 1) % count]) for i in range(count)]
+
+    def side(a, b, c):
+        return np.sign((b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0]))
+
+    for i in range(count):
+        for j in range(i + 2, count):
+            if i == 0 and j == count - 1:
+                continue
+            (a, b), (c, d) = edges[i], edges[j]
+            if side(a, b, c) != side(a, b, d) and side(c, d, a) != side(c, d, b):
+                return False
+    return True
+
+
+class TestGenerateScene:
+    """Test class untuk generate_scene"""
+
+    def test_deterministic_for_seed(self):
+        """Seed yang sama menghasilkan scene yang sama"""
+        a = generate_scene(200, seed=7)
+        b = generate_scene(200, seed=7)
+        c = generate_scene(200, seed=8)
+        assert [type(s) for s in a] == [type(s) for s in b]
+        assert all(np.array_equal(x.vertices, y.vertices) for x, y in zip(a, b))
+        assert not all(np.array_equal(x.vertices, y.vertices) for x, y in zip(a, c)
+                       if x.vertices.shape == y.vertices.shape)
+
+    def test_polygons_are_simple(self):
+        """Polygon acak dengan sedikit vertex tidak pernah self-intersecting"""
+        shapes = generate_scene(600, seed=3, mix={'polygon': 1}, vertex_range=(5, 6))
+        assert all(_is_simple(shape.vertices.tolist()) for shape in shapes)
+
+    def test_mix_respected(self):
+        """Hanya jenis shape dengan bobot positif yang dibuat"""
+        shapes = generate_scene(300, mix={'circle': 1, 'line': 1})
+        assert len(shapes) == 300
+        assert {type(s) for s in shapes} == {Circle, Line}
+
+    def test_invalid_arguments(self):
+        """Mix atau distribusi yang tidak dikenal ditolak"""
+        with pytest.raises(ValueError):
+            generate_scene(10, mix={'hexagon': 1})
+        with pytest.raises(ValueError):
+            generate_scene(10, mix={'circle': 0})
+        with pytest.raises(ValueError):
+            generate_scene(10, vertex_distribution='gaussian')
+
+    def test_log_vertex_distribution(self):
+        """Distribusi log tetap di dalam vertex_range dan condong ke nilai kecil"""
+        shapes = generate_scene(500, mix={'polygon': 1}, vertex_range=(3, 64),
+                                vertex_distribution='log')
+        counts = np.array([len(s.vertices) for s in shapes])
+        assert counts.min() >= 3 and counts.max() <= 64
+        assert np.median(counts) < (3 + 64) / 2
+
+    def test_extent_limits_positions(self):
+        """Center shape berada di dalam extent"""
+        shapes = generate_scene(200, mix={'rectangle': 1}, extent=100, size_range=(1, 2))
+        centers = np.array([s.get_center() for s in shapes])
+        assert np.abs(centers).max() <= 100 + 2
+
+    def test_instanced_count(self):
+        """Mode instanced menghasilkan InstanceBatch dengan jumlah instance yang sama"""
+        batch = generate_scene(5000, seed=3, instanced=True)
+        assert isinstance(batch, InstanceBatch)
+        assert len(batch) == 5000
+        # Geometry dipakai bersama oleh banyak instance
+        assert len(batch.geometries) < 500
+
+    def test_instanced_rectangle_size(self):
+        """Rectangle instanced memiliki ukuran sesuai size_range"""
+        batch = generate_scene(100, mix={'rectangle': 1}, size_range=(10, 10),
+                               instanced=True)
+        points = np.concatenate([batch.transformed_points(g) for g in batch.geometries])
+        widths = points[:, :, 0].max(axis=1) - points[:, :, 0].min(axis=1)
+        np.testing.assert_allclose(widths, 20)
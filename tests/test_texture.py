@@ -0,0 +1,204 @@
+"""
+Test untuk mipmap dan cache texture
+Unit tests untuk build_mipmaps, kuantisasi zoom/angle, TextureCache dan
+jalur texture ImageShape
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame
+import pytest
+
+from src.imaging import ImageShape
+from src.matrix import TransformationMatrix
+from src.render import RenderQueue
+from src.texture import (
+    TextureCache, build_mipmaps, mip_level_for, quantize_angle, quantize_zoom, surface_bytes
+)
+
+
+def _surface(width, height):
+    return pygame.Surface((width, height), pygame.SRCALPHA, 32)
+
+
+def _gradient(height=64, width=96):
+    """Image RGB halus (perbedaan texture vs warp kecil)"""
+    rows, columns = np.mgrid[0:height, 0:width]
+    return np.stack([columns * 255 // width, rows * 255 // height,
+                     np.full_like(rows, 128)], axis=-1).astype(np.uint8)
+
+
+class TestMipmaps:
+    """Test class untuk build_mipmaps dan pemilihan level"""
+
+    def test_pyramid(self):
+        """Setiap level setengah ukuran, berisi rata-rata blok 2x2"""
+        pixels = np.random.default_rng(0).integers(0, 256, size=(12, 20, 4), dtype=np.uint8)
+        levels = build_mipmaps(pixels)
+        assert levels[0] is pixels
+        assert [level.shape[:2] for level in levels] == [(12, 20), (6, 10), (3, 5), (1, 2), (1, 1)]
+        block = pixels[2:4, 4:6].astype(int).sum(axis=(0, 1))
+        assert np.array_equal(levels[1][1, 2], (block + 2) // 4)
+
+    def test_constant_image(self):
+        """Image satu warna tetap sama di semua level"""
+        levels = build_mipmaps(np.full((16, 16, 3), 77, dtype=np.uint8))
+        assert len(levels) == 5
+        assert all((level == 77).all() for level in levels)
+
+    def test_level_for_zoom(self):
+        """Level dipilih supaya scaling dari level tersebut antara 0.5x dan 1x"""
+        assert mip_level_for(2.0, 5) == 0
+        assert mip_level_for(1.0, 5) == 0
+        assert mip_level_for(0.6, 5) == 0
+        assert mip_level_for(0.5, 5) == 1
+        assert mip_level_for(0.2, 5) == 2
+        assert mip_level_for(0.001, 5) == 4
+
+
+class TestQuantize:
+    """Test class untuk kuantisasi zoom dan angle"""
+
+    def test_zoom(self):
+        """Zoom yang berdekatan jatuh ke langkah yang sama; oktaf tepat tidak berubah"""
+        assert quantize_zoom(1.0) == 1.0
+        assert quantize_zoom(0.5) == 0.5
+        assert quantize_zoom(1.01) == quantize_zoom(0.99) == 1.0
+        assert quantize_zoom(1.2) != quantize_zoom(1.0)
+        assert abs(quantize_zoom(1.234) / 1.234 - 1) < 0.025
+
+    def test_angle(self):
+        """Angle dibulatkan ke derajat dan dinormalisasi ke [0, 360)"""
+        assert quantize_angle(10.3) == 10.0
+        assert quantize_angle(-0.2) == 0.0
+        assert quantize_angle(-90) == 270.0
+        assert quantize_angle(359.8) == 0.0
+
+
+class TestTextureCache:
+    """Test class untuk TextureCache"""
+
+    def test_lru_eviction(self):
+        """Entry yang paling lama tidak dipakai dibuang saat melewati batas byte"""
+        size = surface_bytes(_surface(10, 10))
+        cache = TextureCache(max_bytes=3 * size)
+        for key in 'abc':
+            cache.put(key, _surface(10, 10))
+        assert cache.get('a') is not None  # 'a' menjadi paling baru
+        cache.put('d', _surface(10, 10))
+        assert 'b' not in cache and all(key in cache for key in 'acd')
+        assert cache.bytes_used == 3 * size and cache.evictions == 1
+
+    def test_oversized_and_replace(self):
+        """Surface lebih besar dari batas tidak disimpan; key yang sama menggantikan"""
+        cache = TextureCache(max_bytes=surface_bytes(_surface(10, 10)))
+        cache.put('big', _surface(100, 100))
+        assert len(cache) == 0 and cache.bytes_used == 0
+        cache.put('x', _surface(5, 5))
+        cache.put('x', _surface(10, 10))
+        assert len(cache) == 1 and cache.bytes_used == surface_bytes(_surface(10, 10))
+        cache.clear()
+        assert len(cache) == 0 and cache.bytes_used == 0
+
+    def test_get_or_create(self):
+        """Factory hanya dipanggil saat miss"""
+        cache = TextureCache()
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return _surface(4, 4)
+
+        first = cache.get_or_create('k', factory)
+        assert cache.get_or_create('k', factory) is first
+        assert len(calls) == 1 and cache.hits == 1 and cache.misses == 1
+
+
+class TestImageTextures:
+    """Test class untuk jalur texture ImageShape"""
+
+    @pytest.fixture
+    def surface(self):
+        pygame.init()
+        return pygame.Surface((300, 240))
+
+    @staticmethod
+    def _draw(image, surface, view):
+        surface.fill((0, 0, 0))
+        queue = RenderQueue()
+        image.submit(queue, surface, view_matrix=view)
+        queue.flush(surface)
+        return np.frombuffer(pygame.image.tobytes(surface, 'RGB'), dtype=np.uint8).reshape(
+            surface.get_height(), surface.get_width(), 3).astype(int)
+
+    def test_pan_and_small_zoom_reuse(self, surface):
+        """Pan dan zoom kecil memakai texture yang sama dari cache"""
+        image = ImageShape(0, 0, _gradient(), texture_cache=TextureCache())
+        for step in range(5):
+            view = TransformationMatrix().translate(40 + step * 7, 30).rotate(15).scale(0.8, 0.8)
+            self._draw(image, surface, view)
+        view = TransformationMatrix().translate(40, 30).rotate(15).scale(0.805, 0.805)
+        self._draw(image, surface, view)
+        cache = image.texture_cache
+        assert cache.misses == 1 and cache.hits == 5 and len(cache) == 1
+
+    def test_matches_warp(self, surface):
+        """Texture mendekati hasil warp_image walau zoom dan angle dikuantisasi"""
+        image = ImageShape(10, 20, _gradient(), texture_cache=TextureCache())
+        for view in (TransformationMatrix().translate(150, 120).scale(1.5, 1.5).translate(-58, -52),
+                     TransformationMatrix().translate(150, 120).rotate(30).scale(0.5, 0.5)
+                     .translate(-58, -52)):
+            image.use_textures = True
+            texture = self._draw(image, surface, view)
+            image.use_textures = False
+            warped = self._draw(image, surface, view)
+            # Perbedaan hanya di tepi (anti-aliasing rotozoom), isi image hampir sama
+            assert np.median(np.abs(texture - warped)) <= 2
+            assert np.mean(np.abs(texture - warped)) < 2
+
+    def test_nearest_keeps_pixels(self, surface):
+        """Nearest di zoom besar (juga dengan rotasi) hanya berisi warna image asli"""
+        checker = (np.indices((4, 4)).sum(axis=0) % 2 * 255).astype(np.uint8)
+        image = ImageShape(0, 0, checker, interpolation='nearest', texture_cache=TextureCache())
+        for angle in (0, 30):
+            view = TransformationMatrix().translate(150, 120).rotate(angle).scale(20, 20).translate(-2, -2)
+            assert image.texture_surface(surface, view) is not None
+            drawn = self._draw(image, surface, view)
+            assert set(np.unique(drawn).tolist()) == {0, 255}
+
+    def test_interpolation_in_key(self, surface):
+        """Ganti interpolation tidak memakai texture lama dari cache"""
+        checker = (np.indices((4, 4)).sum(axis=0) % 2 * 255).astype(np.uint8)
+        image = ImageShape(0, 0, checker, texture_cache=TextureCache())
+        view = TransformationMatrix().translate(110, 80).scale(20, 20)
+        assert len(np.unique(self._draw(image, surface, view))) > 2
+        image.interpolation = 'nearest'
+        assert set(np.unique(self._draw(image, surface, view)).tolist()) == {0, 255}
+        assert image.texture_cache.misses == 2 and len(image.texture_cache) == 2
+
+    def test_fallback_to_warp(self, surface):
+        """Shear (scale tidak seragam lalu rotasi) dan zoom sangat besar memakai warp_image"""
+        image = ImageShape(0, 0, _gradient(), texture_cache=TextureCache())
+        sheared = TransformationMatrix().rotate(30).scale(2, 0.5).rotate(20)
+        assert image.texture_surface(surface, sheared) is None
+        huge = TransformationMatrix().scale(40, 40)
+        assert image.texture_surface(surface, huge) is None
+        assert image.texture_surface(surface, TransformationMatrix().scale(2, 0.5)) is not None
+        self._draw(image, surface, sheared)
+        assert len(image.texture_cache) == 1
+
+    def test_byte_budget_shared(self, surface):
+        """Banyak zoom berbeda tidak membuat cache melewati batas byte"""
+        cache = TextureCache(max_bytes=200 * 1024)
+        image = ImageShape(0, 0, _gradient(), texture_cache=cache)
+        for step in range(20):
+            zoom = 0.5 * 1.1 ** step
+            self._draw(image, surface, TransformationMatrix().scale(zoom, zoom))
+        assert cache.bytes_used <= cache.max_bytes and cache.evictions > 0
@@ -0,0 +1,123 @@
+"""
+Test untuk komponen UI
+Unit tests untuk dispatch event ControlPanel
+"""
+
+import sys
+import os
+
+# Add parent directory ke path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pygame
+import pytest
+
+from src.ui import ControlPanel, coalesce_motion_events
+
+
+@pytest.fixture
+def panel():
+    pygame.font.init()
+    return ControlPanel(900, 0, 300, 800)
+
+
+def _mouse(event_type, pos, **attributes):
+    return pygame.event.Event(event_type, pos=pos, **attributes)
+
+
+class TestCoalesceMotion:
+    """Test class untuk coalesce_motion_events"""
+
+    def test_runs_merged(self):
+        """MOUSEMOTION beruntun menjadi satu, urutan dengan klik dipertahankan"""
+        events = [
+            _mouse(pygame.MOUSEMOTION, (1, 1), rel=(1, 1), buttons=(0, 0, 0)),
+            _mouse(pygame.MOUSEMOTION, (3, 2), rel=(2, 1), buttons=(0, 0, 0)),
+            _mouse(pygame.MOUSEBUTTONDOWN, (3, 2), button=1),
+            _mouse(pygame.MOUSEMOTION, (4, 2), rel=(1, 0), buttons=(1, 0, 0)),
+            _mouse(pygame.MOUSEMOTION, (9, 5), rel=(5, 3), buttons=(1, 0, 0)),
+        ]
+        result = coalesce_motion_events(events)
+        assert [event.type for event in result] == [
+            pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION]
+        assert result[0].pos == (3, 2) and result[0].rel == (3, 2)
+        assert result[2].pos == (9, 5) and result[2].rel == (6, 3)
+
+
+class TestControlPanelDispatch:
+    """Test class untuk hit dispatch ControlPanel"""
+
+    def test_widget_at(self, panel):
+        """Index hit-test menemukan widget di bawah cursor"""
+        assert panel.widget_at(panel.rotate_slider.rect.center) is panel.rotate_slider
+        assert panel.widget_at(panel.reset_button.rect.center) is panel.reset_button
+        assert panel.widget_at((panel.rect.x + 2, panel.rect.y + 2)) is None
+
+    def test_drag_capture(self, panel):
+        """Slider yang di-drag menerima motion walau cursor keluar dari slider"""
+        slider = panel.translate_x_slider
+        assert panel.handle_event(_mouse(pygame.MOUSEBUTTONDOWN, slider.rect.center, button=1))
+        assert slider.is_dragging
+        panel.handle_event(_mouse(pygame.MOUSEMOTION, (slider.rect.right + 500, 700),
+                                  rel=(0, 0), buttons=(1, 0, 0)))
+        assert slider.value == slider.max_val
+        assert panel.handle_event(_mouse(pygame.MOUSEBUTTONUP, (0, 0), button=1))
+        assert not slider.is_dragging
+        assert not panel.handle_event(_mouse(pygame.MOUSEBUTTONUP, (0, 0), button=1))
+
+    def test_only_target_receives_click(self, panel):
+        """Klik pada slider tidak diteruskan ke widget lain"""
+        panel.handle_event(_mouse(pygame.MOUSEBUTTONDOWN, panel.rotate_slider.rect.center, button=1))
+        assert panel.rotate_slider.is_dragging
+        assert not any(slider.is_dragging for slider in
+                       (panel.zoom_slider, panel.translate_x_slider, panel.scale_x_slider))
+
+    def test_hover(self, panel):
+        """Hover berpindah antar button tanpa sisa hover lama"""
+        panel.handle_event(_mouse(pygame.MOUSEMOTION, panel.reset_button.rect.center, rel=(0, 0)))
+        assert panel.reset_button.is_hovered
+        panel.handle_event(_mouse(pygame.MOUSEMOTION, panel.reset_camera_button.rect.center,
+                                  rel=(0, 0)))
+        assert not panel.reset_button.is_hovered
+        assert panel.reset_camera_button.is_hovered
+        panel.handle_event(_mouse(pygame.MOUSEMOTION, (0, 0), rel=(0, 0)))
+        assert not panel.reset_camera_button.is_hovered
+
+    def test_button_callback(self, panel):
+        """Klik button memanggil callback-nya"""
+        panel.translate_x_slider.set_value(50)
+        panel.handle_event(_mouse(pygame.MOUSEBUTTONDOWN, panel.reset_center_button.rect.center,
+                                  button=1))
+        assert panel.translate_x_slider.value == 0
+
+
+class TestControlPanelCache:
+    """Test class untuk surface cache ControlPanel"""
+
+    @staticmethod
+    def _pixels(panel):
+        screen = pygame.Surface((1200, 800))
+        panel.draw(screen)
+        return pygame.image.tostring(screen.subsurface(panel.rect), "RGB")
+
+    def test_idle_frame_repaints_nothing(self, panel):
+        """Frame tanpa perubahan tidak menggambar ulang widget"""
+        self._pixels(panel)
+        assert panel._repaint_dirty() == 0
+
+    def test_incremental_matches_full_repaint(self, panel):
+        """Hasil update per widget sama dengan repaint penuh"""
+        self._pixels(panel)
+        panel.rotate_slider.set_value(90)
+        panel.scale_x_slider.set_value(2.5)
+        panel.handle_event(_mouse(pygame.MOUSEMOTION, panel.reset_button.rect.center, rel=(0, 0)))
+        panel.matrix_label.set_text("TX: 1.0")
+        incremental = self._pixels(panel)
+        panel.invalidate()
+        assert incremental == self._pixels(panel)
+
+    def test_only_changed_widget_redrawn(self, panel):
+        """Mengubah satu slider hanya menggambar ulang slider itu"""
+        self._pixels(panel)
+        panel.translate_y_slider.set_value(30, trigger_callback=False)
+        assert panel._repaint_dirty() == 1